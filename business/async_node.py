@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+
+import grpc
+
+from business.async_node_network_interface import AsyncNodeNetworkInterface
+from business.node import JOIN_ATTEMPTS, Node
+from business.node_network_interface import UNSUPPORTED, Unsupported
+from business.routing_state import RoutingState
+from business.single_flight import AsyncSingleFlight
+
+
+class AsyncNode(Node):
+    """Node variant whose network-facing operations are coroutines.
+
+    Purely local operations (notify, find_next_hop, the key store) are inherited
+    from Node and stay synchronous, so the asyncio server can answer them inline.
+    The coroutines here only add the awaits around Node's routing and state helpers.
+    """
+
+    def __init__(self, node_id, m, network: AsyncNodeNetworkInterface, iterative_lookup: bool = True, **kwargs):
+        super().__init__(node_id, m, network, iterative_lookup=iterative_lookup, **kwargs)
+        self.pending_tasks: set[asyncio.Task] = set()
+        self.inflight = AsyncSingleFlight(self.inflight.timeout)
+
+    def spawn(self, coroutine):
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.pending_tasks.add(task)
+        task.add_done_callback(self.pending_tasks.discard)
+        return task
+
+    async def join(self, bootstrap_node):
+        if await self.resume() or await self.join_ring(bootstrap_node):
+            await self.pull_keys()
+
+    async def resume(self) -> bool:
+        if self.journal is None:
+            return False
+        for candidate in self.restore_routing(self.journal.load()):
+            if await self.network.get_neighbors(candidate) is not None:
+                self.successor = candidate
+                await self.stabilize()
+                self.mark_joined(f"Resumed from the membership journal with successor {candidate}")
+                return True
+        self.reset_routing()
+        return False
+
+    async def join_ring(self, bootstrap_node) -> bool:
+        joined = False
+        if bootstrap_node not in ("", None, "None"):
+            seeded = await self.init_finger_table(bootstrap_node)
+            if self.join_failed(bootstrap_node):
+                return False
+            if seeded:
+                self.spawn(self.refine_routing())
+            else:
+                await self.announce()
+            joined = True
+        else:
+            self.create_ring()
+
+        self.mark_joined()
+        return joined
+
+    async def init_finger_table(self, node: int) -> bool:
+        successor, state = await self.locate_successor(node)
+        if successor is None:
+            return False
+        self.adopt_successor(successor)
+        if state is not UNSUPPORTED:
+            predecessor = self.seed_routing(successor, state)
+            await self.network.set_predecessor(successor, self.node_id)
+            await self.network.update_finger_table(predecessor, self.node_id, 0)
+            return True
+
+        self.predecessor = await self.network.get_predecessor(successor)
+        await self.network.set_predecessor(successor, self.node_id)
+
+        for i in range(self.m - 1):
+            finger = self.covering_finger(i + 1)
+            if finger is None:
+                finger = await self.network.find_successor(node, self.start(i + 1))
+            self.set_finger(i + 1, finger)
+        await self.network.notify(self.predecessor, self.node_id)
+        return False
+
+    async def locate_successor(self, bootstrap: int) -> tuple[int | None, RoutingState | Unsupported | None]:
+        for attempt in range(JOIN_ATTEMPTS):
+            successor = await self.network.find_successor(bootstrap, self.start(0))
+            if successor in ("", None, "None"):
+                continue
+            state = await self.network.get_routing_state(successor)
+            if state is not None:
+                return successor, state
+
+            logging.warning(f"[Node {self.node_id}] Successor {successor} found through {bootstrap} is dead")
+            predecessor, candidates = await self.successors_after(bootstrap, successor)
+            for candidate in candidates:
+                if (state := await self.network.get_routing_state(candidate)) is not None:
+                    return candidate, state if state is UNSUPPORTED else state.replace(predecessor=predecessor)
+        return None, None
+
+    async def successors_after(self, bootstrap: int, dead: int) -> tuple[int | None, list[int]]:
+        predecessor, _, done, _ = await self.walk(self.start(0), self.node_id, bootstrap)
+        neighbors = await self.network.get_neighbors(predecessor) if done and predecessor != self.node_id else None
+        if neighbors is None:
+            return None, []
+        return predecessor, [node_id for node_id in neighbors[1] if node_id not in (dead, self.node_id, "", None, "None")]
+
+    async def refine_routing(self):
+        await self.fix_fingers()
+        await self.announce()
+
+    async def announce(self):
+        if not self.lazy_join:
+            await self.update_others()
+        elif (target := self.hint_target(self.node_id, self.finger_hint_hops + 1)) is not None:
+            self.spawn(self.network.finger_hint(target, self.node_id, self.finger_hint_hops))
+
+    def finger_hint(self, new_node: int, hops: int):
+        if self.accept_finger_hint(new_node) and (target := self.hint_target(new_node, hops)) is not None:
+            self.spawn(self.network.finger_hint(target, new_node, hops - 1))
+
+    async def update_others(self):
+        for i in range(self.m):
+            id_to_update = (self.node_id - (1 << i)) % self.ring_size
+            p = await self.find_predecessor(id_to_update)
+            await self.network.update_finger_table(p, self.node_id, i)
+
+    async def update_finger_table(self, s: int, i: int):
+        predecessor = self.adopt_finger_update(s, i)
+        if predecessor is not None:
+            await self.network.update_finger_table(predecessor, s, i)
+
+    async def find_successor(self, key: int, coalesce: bool = True) -> int:
+        self.count('lookups')
+        if self.successor == self.node_id:
+            return self.node_id
+        with self.lookups_in_flight.track():
+            if coalesce:
+                owner = await self.inflight.do(('successor', key), lambda: self.resolve_successor(key))
+            else:
+                owner = await self.resolve_successor(key, coalesce=False)
+        return self.lookup_finished(owner)
+
+    async def resolve_successor(self, key: int, coalesce: bool = True) -> int | None:
+        started = time.monotonic()
+        try:
+            if self.iterative_lookup:
+                return await self.find_successor_iterative(key)
+
+            n = await self.find_predecessor(key, coalesce)
+            if n == self.node_id:
+                return self.successor
+            return await self.network.find_successor(n, key)
+        finally:
+            self.record_lookup_latency(time.monotonic() - started)
+
+    async def find_successor_iterative(self, key: int) -> int | None:
+        next_hop, done = self.find_next_hop(key)
+        _, next_hop, done, hops = await self.walk(key, self.node_id, next_hop, done)
+        self.lookup_hops.observe(hops)
+        return self.iterative_owner(key, next_hop, done)
+
+    async def walk(self, key: int, previous: int, next_hop: int, done: bool = False) -> tuple[int, int, bool, int]:
+        hops, dead = 0, set()
+        while not done and hops < 2 * self.m:
+            answer = await self.network.find_next_hop(next_hop, key)
+            if answer is not None:
+                previous = next_hop
+            elif previous != self.node_id:
+                dead.add(next_hop)
+                answer = self.detour(key, previous, dead, await self.network.get_neighbors(previous))
+            else:
+                answer = self.find_next_hop(key)
+            next_hop, done = answer
+            hops += 1
+        return previous, next_hop, done, hops
+
+    async def find_predecessor(self, key: int, coalesce: bool = True):
+        self.count('lookups')
+        successor = self.successor
+        if successor == self.node_id:
+            return self.node_id
+
+        n = self.node_id
+        iterations = 0
+        while (successor is not None and not self.in_range(key, n, successor, include_end=True)
+               and iterations < self.m + 1):
+            prev_n = n
+            n = self.route_toward(key)
+            if n == prev_n:
+                break
+            successor = await self.find_successor(n, coalesce)
+            iterations += 1
+
+        return n
+
+    async def pull_keys(self):
+        source = self.handoff_source()
+        if source is not None and not await self.network.request_handoff(source[0], self.node_id, source[1],
+                                                                         self.node_id):
+            self.handoff_incomplete(*source)
+
+    def serve_handoff(self, requester_id: int, start: int, end: int) -> bool:
+        self.spawn(self.push_keys(requester_id, self.get_range(start, end)))
+        return True
+
+    async def push_keys(self, requester_id: int, info_keys: list[int]):
+        if not await self.hand_off(requester_id, info_keys, release=True):
+            self.push_failed(requester_id, info_keys)
+
+    async def hand_off(self, target_id: int, info_keys: list[int], release: bool = False) -> bool:
+        session_id = uuid.uuid4().hex
+        position = 0
+        for attempt in range(self.handoff_retries):
+            if await self.network.hand_off(target_id, session_id, self.handoff_chunks(info_keys, position)):
+                if release:
+                    self.release_keys(info_keys)
+                return True
+            cursor = await self.network.get_handoff_cursor(target_id, session_id)
+            position = self.handoff_interrupted(target_id, info_keys, cursor, position, attempt)
+        return False
+
+    async def leave(self):
+        if self.successor and self.successor != self.node_id:
+            if not await self.hand_off(self.successor, list(self.key_index)):
+                logging.error(f"[Node {self.node_id}] Could not hand off keys to {self.successor} before leaving")
+
+        for method, target_id, node_id in self.departure_messages():
+            await getattr(self.network, method)(target_id, node_id)
+
+    async def fix_fingers(self):
+        self.count('finger_fixes')
+        in_flight = asyncio.Semaphore(self.finger_fix_parallelism)
+
+        async def lookup(start):
+            async with in_flight:
+                try:
+                    return await self.find_successor(start)
+                except grpc.RpcError:
+                    return None
+
+        starts = [self.start(i) for i in range(self.m)]
+        resolved: dict[int, int | None] = {}
+        pending = self.finger_boundaries()
+        while pending:
+            results = await asyncio.gather(*(lookup(starts[i]) for i in pending))
+            resolved.update(zip(pending, results))
+            fingers, pending = self.reuse_fingers(starts, resolved)
+
+        return self.apply_fingers(fingers)
+
+    async def stabilize(self) -> bool:
+        self.count('stabilization')
+        before = self.routing
+        try:
+            self.adopt_neighbors(await self.network.get_neighbors(self.successor))
+        except grpc.RpcError:
+            self.lose_successor()
+
+        try:
+            successors = await self.network.notify(self.successor, self.node_id)
+            if successors is not None:
+                self.update_successor_list(successors)
+        except grpc.RpcError:
+            self.successor = self.find_alive_successor()
+
+        return self.settle_alone(before)
+
+    async def check_predecessor(self) -> bool:
+        predecessor = self.predecessor
+        if self.claim_missing_predecessor(predecessor):
+            return True
+        try:
+            _ = await self.network.get_predecessor(predecessor)
+        except grpc.RpcError:
+            self.forget_predecessor(predecessor)
+            return True
+        return False
+
+    def replicate(self, info_key: int, info: str) -> bool:
+        # synchronous key-store paths cannot wait, so their replica writes run in the background
+        for node_id in self.routing.successor_list[:self.replication_factor]:
+            self.spawn(self.network.add_redundant_info(node_id, info_key, info))
+        return True
+
+    def remove_replicas(self, info_key: int):
+        for node_id in self.routing.successor_list[:self.replication_factor]:
+            self.spawn(self.network.remove_redundant_info(node_id, info_key))
+
+    def replicate_many(self, items: dict[int, str]) -> bool:
+        if items:
+            for node_id in self.routing.successor_list[:self.replication_factor]:
+                self.spawn(self.network.add_redundant_many(node_id, items))
+        return True
+
+    def sync_replicas(self, replicas: list[int]):
+        for node_id in replicas:
+            for items in self.handoff_chunks(list(self.key_index)):
+                self.spawn(self.network.add_redundant_many(node_id, items))
+
+    async def store_information(self, info_key: int, info: str) -> bool:
+        self.write_information(info_key, info)
+        pending = [self.spawn(self.network.add_redundant_info(node_id, info_key, info))
+                   for node_id in self.routing.successor_list[:self.replication_factor]]
+        if self.write_quorum <= 0 or not pending:
+            return True
+
+        acks = 0
+        for next_done in asyncio.as_completed(pending):
+            try:
+                if await next_done:
+                    acks += 1
+            except grpc.RpcError:
+                continue
+            if acks >= self.write_quorum:
+                return True
+        logging.warning(f"[Node {self.node_id}] Write quorum not reached for key {info_key}: {acks}/{self.write_quorum}")
+        return False
+
+    async def find_owner(self, info_key: int) -> tuple[int | None, bool]:
+        owner = self.cached_owner(info_key)
+        if owner is not None:
+            return owner, True
+        return self.remember_owner(info_key, await self.find_successor(info_key)), False
+
+    async def refresh_owner(self, info_key: int, stale_owner: int | None) -> int | None:
+        owner = await self.find_successor(info_key)
+        if owner is not None and owner != stale_owner:
+            return self.remember_owner(info_key, owner, stale_owner)
+        return None
+
+    async def lookup_information(self, info_key: int) -> tuple[int | None, str | None]:
+        responsible_node, cached = await self.find_owner(info_key)
+        if responsible_node is None:
+            return None, None
+        if responsible_node == self.node_id:
+            return responsible_node, self.node_has_info(info_key)
+
+        information = await self.network.get_information(responsible_node, info_key)
+        if self.owner_may_be_stale(information, cached):
+            owner = await self.refresh_owner(info_key, responsible_node)
+            if owner is not None:
+                responsible_node = owner
+                if owner == self.node_id:
+                    information = self.node_has_info(info_key)
+                else:
+                    information = await self.network.get_information(owner, info_key)
+
+        return responsible_node, information if information != 'None' else None
+
+    async def get_information(self, info_key: int):
+        return (await self.inflight.do(('information', info_key), lambda: self.lookup_information(info_key)))[1]
+
+    async def create_info(self, info_key: int, info: str) -> bool:
+        responsible_node, existing = await self.lookup_information(info_key)
+        if existing or responsible_node is None:
+            return False
+        if responsible_node == self.node_id:
+            return await self.store_information(info_key, info)
+
+        return await self.network.add_information(responsible_node, info_key, info)
+
+    async def remove_info(self, info_key: int):
+        responsible_node, existing = await self.lookup_information(info_key)
+        if not existing or responsible_node is None:
+            return False
+        if responsible_node == self.node_id:
+            self.remove_information(info_key)
+            return True
+
+        await self.network.remove_information(responsible_node, info_key)
+        return True
+
+    async def put(self, key: bytes | str, info: str) -> bool:
+        return await self.create_info(self.key_id(key), info)
+
+    async def get(self, key: bytes | str) -> str | None:
+        return await self.get_information(self.key_id(key))
+
+    async def delete(self, key: bytes | str) -> bool:
+        return await self.remove_info(self.key_id(key))
+
+    async def group_keys_by_owner(self, keys) -> dict[int | None, list[int]]:
+        groups: dict[int | None, list[int]] = {}
+        owner = None
+        low = None
+        for key in sorted(set(keys)):
+            if self.owner_covers(key, low, owner):
+                groups[owner].append(key)
+                continue
+            owner, _ = await self.find_owner(key)
+            low = key
+            groups.setdefault(owner, []).append(key)
+        return groups
+
+    async def get_many(self, keys) -> dict[int, str | None]:
+        async def request(owner, owner_keys):
+            if owner is None:
+                return {}
+            if owner == self.node_id:
+                return self.get_local_information(owner_keys)
+            return await self.network.get_many(owner, owner_keys) or {}
+
+        groups = await self.group_keys_by_owner(keys)
+        return self.merge_found(keys, await asyncio.gather(*(request(owner, owner_keys)
+                                                             for owner, owner_keys in groups.items())))
+
+    async def create_many(self, items: dict[int, str]) -> dict[int, bool]:
+        async def request(owner, owner_keys):
+            owner_items = {key: items[key] for key in owner_keys}
+            if owner is None:
+                return []
+            if owner == self.node_id:
+                return self.add_many_information(owner_items)
+            return await self.network.put_many(owner, owner_items) or []
+
+        groups = await self.group_keys_by_owner(items.keys())
+        return self.mark_keys(items, await asyncio.gather(*(request(owner, owner_keys)
+                                                            for owner, owner_keys in groups.items())))
+
+    async def remove_many(self, keys) -> dict[int, bool]:
+        async def request(owner, owner_keys):
+            if owner is None:
+                return []
+            if owner == self.node_id:
+                return self.remove_many_information(owner_keys)
+            return await self.network.remove_many(owner, owner_keys) or []
+
+        groups = await self.group_keys_by_owner(keys)
+        return self.mark_keys(keys, await asyncio.gather(*(request(owner, owner_keys)
+                                                           for owner, owner_keys in groups.items())))
+
+    async def run_background_tasks(self):
+        self.schedule_maintenance()
+        await self.scheduler.run_forever_async()
+
+    def start_background_tasks(self):
+        return asyncio.get_running_loop().create_task(self.run_background_tasks())
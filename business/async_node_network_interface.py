@@ -0,0 +1,56 @@
+from collections.abc import Iterable
+
+from business.node_network_interface import UNSUPPORTED, Unsupported
+from business.routing_state import RoutingState
+
+
+class AsyncNodeNetworkInterface:
+    async def find_successor(self, target_id: int, key: int) -> int: ...
+
+    def peer_latency(self, node_id: int) -> float | None:
+        return None
+
+    async def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None: ...
+
+    async def get_predecessor(self, target_id: int) -> int: ...
+
+    async def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None: ...
+
+    async def get_routing_state(self, target_id: int) -> RoutingState | Unsupported | None:
+        return UNSUPPORTED
+
+    async def set_predecessor(self, target_id: int, new_predecessor_id: int): ...
+
+    async def set_successor(self, target_id: int, new_successor_id: int): ...
+
+    async def notify(self, target_id: int, sender_id: int) -> list[int] | None: ...
+
+    async def update_finger_table(self, target_id: int, new_node_id: int, index: int): ...
+
+    async def finger_hint(self, target_id: int, new_node_id: int, hops: int): ...
+
+    async def get_information(self, target_node_id: int, info_key: int) -> [str | None]: ...
+
+    async def add_information(self, target_node_id: int, info_key: int, info: str) -> bool: ...
+
+    async def remove_information(self, target_node_id: int, info_key: int): ...
+
+    async def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None: ...
+
+    async def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None: ...
+
+    async def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None: ...
+
+    async def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool: ...
+
+    async def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None: ...
+
+    async def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool: ...
+
+    async def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None: ...
+
+    async def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None: ...
+
+    async def remove_redundant_info(self, target_node_id: int, info_key: int): ...
+
+    async def cleanup(self): ...
@@ -0,0 +1,14 @@
+import hashlib
+
+MAX_ID_BITS = 160
+
+
+def hash_key(key: bytes | str | int, m: int) -> int:
+    if not 1 <= m <= MAX_ID_BITS:
+        raise ValueError(f"Identifier size must be between 1 and {MAX_ID_BITS} bits, got {m}")
+    if isinstance(key, int):
+        key = str(key)
+    if isinstance(key, str):
+        key = key.encode()
+    # the top m bits of the digest, so every m shares the same uniform spread
+    return int.from_bytes(hashlib.sha1(key).digest(), 'big') >> (MAX_ID_BITS - m)
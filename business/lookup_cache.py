@@ -0,0 +1,74 @@
+import bisect
+import threading
+from collections import OrderedDict
+
+
+class LookupCache:
+    """Bounded LRU of resolved ring ranges.
+
+    Every entry is an owner together with the lowest key seen to resolve to it, so
+    the whole arc [low, owner] is answered without a lookup. Arcs of distinct owners
+    never overlap, so the candidate for a key is always the first owner clockwise.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.ranges: OrderedDict[int, int] = OrderedDict()
+        self.owners: list[int] = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def covers(low: int, owner: int, key: int) -> bool:
+        if low <= owner:
+            return low <= key <= owner
+        return key >= low or key <= owner
+
+    def _candidate(self, key: int) -> int | None:
+        if not self.owners:
+            return None
+        return self.owners[bisect.bisect_left(self.owners, key) % len(self.owners)]
+
+    def get(self, key: int) -> int | None:
+        with self.lock:
+            owner = self._candidate(key)
+            if owner is None or not self.covers(self.ranges[owner], owner, key):
+                return None
+            self.ranges.move_to_end(owner)
+            return owner
+
+    def put(self, key: int, owner: int):
+        if self.capacity <= 0:
+            return
+        with self.lock:
+            low = self.ranges.get(owner)
+            if low is None:
+                if len(self.ranges) >= self.capacity:
+                    evicted, _ = self.ranges.popitem(last=False)
+                    self.owners.remove(evicted)
+                bisect.insort(self.owners, owner)
+                self.ranges[owner] = key
+            elif not self.covers(low, owner, key):
+                # both keys resolved to owner, so the one outside [low, owner] extends the arc
+                self.ranges[owner] = key
+            self.ranges.move_to_end(owner)
+
+    def invalidate(self, node_id: int | None):
+        # a node appearing or disappearing only changes the arc it belongs to and its own entry
+        if node_id is None:
+            return
+        with self.lock:
+            stale = {node_id}
+            owner = self._candidate(node_id)
+            if owner is not None and self.covers(self.ranges[owner], owner, node_id):
+                stale.add(owner)
+            for owner in stale:
+                if self.ranges.pop(owner, None) is not None:
+                    self.owners.remove(owner)
+
+    def clear(self):
+        with self.lock:
+            self.ranges.clear()
+            self.owners.clear()
+
+    def __len__(self):
+        return len(self.ranges)
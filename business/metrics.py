@@ -0,0 +1,184 @@
+import bisect
+import math
+import threading
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+HOP_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 24, 32, 64)
+
+
+def format_labels(labels: tuple[tuple[str, str], ...], extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[tuple[str, str], ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.lock = threading.Lock()
+
+    def label(self, name: str) -> str | None:
+        return dict(self.labels).get(name)
+
+    def samples(self) -> list[tuple[str, tuple[tuple[str, str], ...], float]]:
+        return []
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[tuple[str, str], ...]):
+        super().__init__(name, documentation, labels)
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        with self.lock:
+            self.value += amount
+
+    def samples(self):
+        return [(f'{self.name}_total', (), self.value)]
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[tuple[str, str], ...]):
+        super().__init__(name, documentation, labels)
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        self.value = value
+
+    @contextmanager
+    def track(self):
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def samples(self):
+        return [(self.name, (), self.value)]
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[tuple[str, str], ...],
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        with self.lock:
+            counts = list(self.counts)
+        total = 0
+        buckets = []
+        for bound, count in zip((*self.bounds, math.inf), counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def quantile(self, q: float) -> float:
+        # upper bound of the bucket holding the q-th observation, the usual histogram estimate
+        buckets = self.cumulative()
+        rank = q * buckets[-1][1]
+        for bound, total in buckets:
+            if total and total >= rank:
+                return bound
+        return 0.0
+
+    def samples(self):
+        samples = [(f'{self.name}_bucket', (('le', format_value(bound)),), total)
+                   for bound, total in self.cumulative()]
+        samples.append((f'{self.name}_sum', (), self.sum))
+        samples.append((f'{self.name}_count', (), self.count))
+        return samples
+
+
+class MetricsRegistry:
+    """Process-wide home of every counter, gauge and histogram, rendered in the Prometheus text format.
+
+    Metrics are created on first use and keyed by name and labels; callers on hot paths
+    keep the returned object instead of looking it up on every observation.
+    """
+
+    def __init__(self):
+        self.metrics: dict[tuple[str, tuple[tuple[str, str], ...]], Metric] = {}
+        self.lock = threading.Lock()
+
+    def get(self, metric_class, name: str, documentation: str, labels: dict[str, object], **kwargs):
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        metric = self.metrics.get(key)
+        if metric is None:
+            with self.lock:
+                metric = self.metrics.get(key)
+                if metric is None:
+                    metric = self.metrics[key] = metric_class(name, documentation, key[1], **kwargs)
+        return metric
+
+    def counter(self, name: str, documentation: str, **labels) -> Counter:
+        return self.get(Counter, name, documentation, labels)
+
+    def gauge(self, name: str, documentation: str, **labels) -> Gauge:
+        return self.get(Gauge, name, documentation, labels)
+
+    def histogram(self, name: str, documentation: str, buckets: tuple[float, ...] = LATENCY_BUCKETS,
+                  **labels) -> Histogram:
+        return self.get(Histogram, name, documentation, labels, buckets=buckets)
+
+    def collect(self, **labels) -> list[Metric]:
+        # a metric matches when every given label is either equal or absent from it
+        wanted = {label: str(value) for label, value in labels.items()}
+        with self.lock:
+            metrics = list(self.metrics.values())
+        return [metric for metric in metrics
+                if all(metric.label(label) in (None, value) for label, value in wanted.items())]
+
+    def render(self) -> str:
+        families: dict[str, list[Metric]] = {}
+        for metric in self.collect():
+            families.setdefault(metric.name, []).append(metric)
+
+        lines = []
+        for name in sorted(families):
+            first = families[name][0]
+            lines.append(f'# HELP {name} {first.documentation}')
+            lines.append(f'# TYPE {name} {first.kind}')
+            for metric in families[name]:
+                for sample_name, extra, value in metric.samples():
+                    lines.append(f'{sample_name}{format_labels(metric.labels, extra)} {format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
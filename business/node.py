@@ -3,183 +3,638 @@ from __future__ import annotations
 import logging
 import threading
 import time
+import uuid
+from collections import OrderedDict
+from concurrent import futures
 
 import grpc
 
-from business.node_network_interface import NodeNetworkInterface
+from business.identifiers import MAX_ID_BITS, hash_key
+from business.lookup_cache import LookupCache
+from business.metrics import HOP_BUCKETS, REGISTRY, MetricsRegistry
+from business.node_network_interface import UNSUPPORTED, NodeNetworkInterface, Unsupported
+from business.routing_state import RoutingState
+from business.scheduler import AdaptiveScheduler
+from business.single_flight import SingleFlight
+from business.striped_lock import StripedLock
+from persistence.file_repository import FileRepository
+from persistence.key_index import SortedKeyIndex
+from persistence.log_reader import DEFAULT_LOG_PATH, LogReader
+from persistence.membership_journal import MembershipJournal
+
+
+JOIN_ATTEMPTS = 3
 
 
 class Node:
-    def __init__(self, node_id, m, network: NodeNetworkInterface):
+    def __init__(self, node_id, m, network: NodeNetworkInterface, iterative_lookup: bool = False,
+                 max_fan_out: int = 16, successor_list_size: int = 3, replication_factor: int = 0,
+                 write_quorum: int = 0, repository: FileRepository | None = None,
+                 transfer_chunk_size: int = 500, handoff_retries: int = 3,
+                 lookup_cache_size: int = 1024, finger_fix_parallelism: int = 4,
+                 min_maintenance_interval: float = 1.0, max_maintenance_interval: float = 60.0,
+                 proximity_routing: bool = False, coalesce_timeout: float = 5.0,
+                 metrics: MetricsRegistry | None = None, log_path: str = DEFAULT_LOG_PATH,
+                 journal: MembershipJournal | None = None, lazy_join: bool = False, finger_hint_hops: int = 0):
+        if not 1 <= m <= MAX_ID_BITS:
+            raise ValueError(f"Identifier size must be between 1 and {MAX_ID_BITS} bits, got {m}")
         self.node_id = node_id
         self.m = m
+        self.ring_size = 1 << m
+        self.finger_starts = [(node_id + (1 << i)) % self.ring_size for i in range(m)]
         self.network = network
-
-        self.successor: int | None = None
-        self.predecessor: int | None = None
-        self.finger_table = [self.node_id for _ in range(self.m)]
-
-        self.information: dict[int, str] = {}
+        self.iterative_lookup = iterative_lookup
+        self.proximity_routing = proximity_routing
+        self.executor = futures.ThreadPoolExecutor(max_workers=max_fan_out,
+                                                   thread_name_prefix=f'node-{node_id}')
+        self.replication_executor = futures.ThreadPoolExecutor(max_workers=max(successor_list_size, 1),
+                                                               thread_name_prefix=f'node-{node_id}-replication')
+        self.finger_fix_parallelism = max(finger_fix_parallelism, 1)
+        self.finger_executor = futures.ThreadPoolExecutor(max_workers=self.finger_fix_parallelism,
+                                                          thread_name_prefix=f'node-{node_id}-fingers')
+
+        # writers serialize on routing_lock and swap in a new snapshot; readers just load self.routing
+        self.routing_lock = threading.RLock()
+        self.routing = RoutingState(None, None, (), [self.node_id] * self.m)
+        self.journal = journal
+        self.journaled: RoutingState | None = None
+        self.successor_list_size = successor_list_size
+        # lazy joins leave other nodes' fingers to fix_fingers, sped up by at most finger_hint_hops hints
+        self.lazy_join = lazy_join
+        self.finger_hint_hops = max(finger_hint_hops, 0)
+        self.hint_lock = threading.Lock()
+        self.finger_hints_seen: OrderedDict[int, float] = OrderedDict()
+        self.replication_factor = min(replication_factor, successor_list_size)
+        self.write_quorum = min(write_quorum, self.replication_factor)
+
+        self.repository = repository
+        self.key_locks = StripedLock()
+        self.index_lock = threading.Lock()
+        # a repository owns the stored values: information is its live dict, not a copy
+        self.information: dict[int, str] = repository.load() if repository is not None else {}
+        self.key_index = repository.index if repository is not None else SortedKeyIndex((m + 7) // 8)
+        self.transfer_chunk_size = transfer_chunk_size
+        self.handoff_retries = handoff_retries
+        self.handoff_lock = threading.Lock()
+        self.handoff_cursors: OrderedDict[str, int] = OrderedDict()
         self.redundant_information: dict[int, str] = {}
-
+        self.lookup_cache = LookupCache(lookup_cache_size)
+        self.min_maintenance_interval = min_maintenance_interval
+        self.max_maintenance_interval = max_maintenance_interval
+        self.scheduler = AdaptiveScheduler(f'node-{node_id}-maintenance')
+        self.inflight = SingleFlight(coalesce_timeout)
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self.log_reader = LogReader(log_path)
+        self.lookup_hops = self.metrics.histogram('chord_lookup_hops', 'Hops taken by iterative lookups',
+                                                  HOP_BUCKETS, node=node_id)
+        self.lookup_duration = self.metrics.histogram('chord_lookup_duration_seconds',
+                                                      'Time to resolve the owner of a key', node=node_id)
+        self.lookup_failures = self.metrics.counter('chord_lookup_failures', 'Lookups that found no owner',
+                                                    node=node_id)
+        self.lookups_in_flight = self.metrics.gauge('chord_lookups_in_flight', 'Lookups being resolved',
+                                                    node=node_id)
+
+        self.stats_lock = threading.Lock()
         self.stats = {
             'lookups': 0,
             'stabilization': 0,
             'finger_fixes': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'lookup_latency_ms': None,
             'join_time': None
         }
 
+    @property
+    def successor(self) -> int | None:
+        return self.routing.successor
+
+    @successor.setter
+    def successor(self, node_id: int | None):
+        self.update_routing(successor=node_id)
+
+    @property
+    def predecessor(self) -> int | None:
+        return self.routing.predecessor
+
+    @predecessor.setter
+    def predecessor(self, node_id: int | None):
+        self.update_routing(predecessor=node_id)
+
+    @property
+    def successor_list(self) -> list[int]:
+        return list(self.routing.successor_list)
+
+    @successor_list.setter
+    def successor_list(self, successors: list[int]):
+        self.update_routing(successor_list=successors)
+
+    @property
+    def finger_table(self) -> list[int | None]:
+        return list(self.routing.finger_table)
+
+    @finger_table.setter
+    def finger_table(self, fingers: list[int | None]):
+        self.update_routing(finger_table=fingers)
+
+    def update_routing(self, **changes):
+        with self.routing_lock:
+            self.routing = self.routing.replace(**changes)
+
+    def set_finger(self, i: int, node_id: int | None):
+        with self.routing_lock:
+            self.routing = self.routing.with_finger(i, node_id)
+
+    def set_successor(self, node_id: int | None):
+        self.successor = node_id
+
+    def set_predecessor(self, node_id: int | None):
+        self.predecessor = node_id
+
+    def count(self, name: str, amount: int = 1):
+        with self.stats_lock:
+            self.stats[name] += amount
+
     def join(self, bootstrap_node):
+        if self.resume() or self.join_ring(bootstrap_node):
+            self.pull_keys()
+
+    def restore_routing(self, state: dict | None) -> list[int]:
+        """Installs a journaled snapshot as is and returns the successors to validate it against."""
+        if (state is None or state.get('node_id') != self.node_id or state.get('m') != self.m
+                or len(state.get('finger_table', [])) != self.m):
+            return []
+        candidates = [node_id for node_id in dict.fromkeys([state['successor'], *state['successor_list']])
+                      if node_id not in ("", None, "None") and node_id != self.node_id]
+        if candidates:
+            self.update_routing(successor=candidates[0], predecessor=state['predecessor'],
+                                successor_list=candidates[:self.successor_list_size],
+                                finger_table=state['finger_table'])
+        return candidates
+
+    def resume(self) -> bool:
+        """Warm start from the membership journal; False when the node has to join from scratch.
+
+        Only the successor is checked up front. Fingers and the predecessor are used as
+        recorded and corrected by handle_dead_node and the maintenance loop when they fail.
+        """
+        if self.journal is None:
+            return False
+        for candidate in self.restore_routing(self.journal.load()):
+            # get_neighbors prunes a dead candidate from the restored table before we try the next
+            if self.network.get_neighbors(candidate) is not None:
+                self.successor = candidate
+                self.stabilize()
+                self.mark_joined(f"Resumed from the membership journal with successor {candidate}")
+                return True
+        self.reset_routing()
+        return False
+
+    def reset_routing(self):
+        self.routing = RoutingState(None, None, (), [self.node_id] * self.m)
+
+    def mark_joined(self, message: str | None = None):
+        with self.stats_lock:
+            self.stats['join_time'] = time.ctime()
+        if message:
+            logging.info(f"[Node {self.node_id}] {message}")
+
+    def save_routing(self) -> bool:
+        routing = self.routing
+        if self.journal is None or routing is self.journaled or routing.successor in ("", None, "None"):
+            return False
+        self.journaled = routing
+        return self.journal.append({'node_id': self.node_id, 'm': self.m, 'successor': routing.successor,
+                                    'predecessor': routing.predecessor,
+                                    'successor_list': list(routing.successor_list),
+                                    'finger_table': list(routing.finger_table)})
+
+    def join_ring(self, bootstrap_node) -> bool:
+        """Routing half of join; True when an existing ring was joined and keys still have to be pulled."""
+        joined = False
         if bootstrap_node not in ("", None, "None"):
-            self.init_finger_table(bootstrap_node)
-            if self.successor not in ("", None, "None"):
-                self.update_others()
+            seeded = self.init_finger_table(bootstrap_node)
+            if self.join_failed(bootstrap_node):
+                return False
+            if seeded:
+                self.executor.submit(self.refine_routing)
+            else:
+                self.announce()
+            joined = True
         else:
-            for i in range(self.m):
-                self.finger_table[i] = self.node_id
-            self.successor = self.node_id
-            self.predecessor = self.node_id
+            self.create_ring()
+
+        self.mark_joined()
+        return joined
 
-        self.stats['join_time'] = time.ctime()
+    def create_ring(self):
+        self.update_routing(successor=self.node_id, predecessor=self.node_id, finger_table=[self.node_id] * self.m)
 
     def start(self, i):
-        return (self.node_id + (2 ** i)) % (2 ** self.m)
+        return self.finger_starts[i]
 
-    def init_finger_table(self, node: int):
-        self.finger_table[0] = self.network.find_successor(node, self.start(0))
-        self.successor = self.finger_table[0]
-        self.predecessor = self.network.get_predecessor(self.successor)
-        self.network.set_predecessor(self.successor, self.node_id)
+    def key_id(self, key: bytes | str | int) -> int:
+        return hash_key(key, self.m)
+
+    def init_finger_table(self, node: int) -> bool:
+        """Resolves our successor through node and fills the rest of the table; True when it was seeded in bulk."""
+        successor, state = self.locate_successor(node)
+        if successor is None:
+            return False
+        self.adopt_successor(successor)
+        if state is not UNSUPPORTED:
+            predecessor = self.seed_routing(successor, state)
+            self.network.set_predecessor(successor, self.node_id)
+            self.network.update_finger_table(predecessor, self.node_id, 0)
+            return True
+
+        self.predecessor = self.network.get_predecessor(successor)
+        self.network.set_predecessor(successor, self.node_id)
 
         for i in range(self.m - 1):
-            if self.in_range(self.start(i + 1), self.node_id, self.finger_table[i]):
-                self.finger_table[i + 1] = self.finger_table[i]
-            else:
-                self.finger_table[i + 1] = self.network.find_successor(self.node_id, self.start(i + 1))
+            finger = self.covering_finger(i + 1)
+            if finger is None:
+                finger = self.network.find_successor(node, self.start(i + 1))
+            self.set_finger(i + 1, finger)
         self.network.notify(self.predecessor, self.node_id)
+        return False
+
+    def locate_successor(self, bootstrap: int) -> tuple[int | None, RoutingState | Unsupported | None]:
+        """Looks our successor up through bootstrap, along with its routing state.
+
+        The lookup can name a node that has just died but is still its predecessor's successor;
+        we then take the next live node of that predecessor's successor list, and retry the whole
+        lookup up to JOIN_ATTEMPTS times.
+        """
+        for attempt in range(JOIN_ATTEMPTS):
+            successor = self.network.find_successor(bootstrap, self.start(0))
+            if successor in ("", None, "None"):
+                continue
+            state = self.network.get_routing_state(successor)
+            if state is not None:
+                return successor, state
+
+            logging.warning(f"[Node {self.node_id}] Successor {successor} found through {bootstrap} is dead")
+            predecessor, candidates = self.successors_after(bootstrap, successor)
+            for candidate in candidates:
+                if (state := self.network.get_routing_state(candidate)) is not None:
+                    # the candidate may still name the dead node as its predecessor
+                    return candidate, state if state is UNSUPPORTED else state.replace(predecessor=predecessor)
+        return None, None
+
+    def successors_after(self, bootstrap: int, dead: int) -> tuple[int | None, list[int]]:
+        # the node whose successor died, found by walking from bootstrap, and the rest of its successor list
+        predecessor, _, done, _ = self.walk(self.start(0), self.node_id, bootstrap)
+        neighbors = self.network.get_neighbors(predecessor) if done and predecessor != self.node_id else None
+        if neighbors is None:
+            return None, []
+        return predecessor, [node_id for node_id in neighbors[1] if node_id not in (dead, self.node_id, "", None, "None")]
+
+    def join_failed(self, bootstrap: int) -> bool:
+        # joining through a bootstrap must never leave us in a ring of our own
+        if self.successor not in ("", None, "None", self.node_id):
+            return False
+        logging.error(f"[Node {self.node_id}] Could not join the ring through {bootstrap}")
+        self.reset_routing()
+        return True
+
+    def adopt_successor(self, successor: int | None):
+        with self.routing_lock:
+            self.routing = self.routing.with_finger(0, successor).replace(successor=successor)
+
+    def covering_finger(self, i: int) -> int | None:
+        # a finger resolved to a crashed node is cleared by handle_dead_node while we are still joining
+        finger = self.routing.finger_table[i - 1]
+        if finger not in ("", None, "None") and self.in_range(self.start(i), self.node_id, finger):
+            return finger
+        return None
+
+    def seed_routing(self, successor: int, state: RoutingState) -> int:
+        """Builds a whole table from the successor's, whose fingers start just past ours; returns our predecessor.
+
+        Each finger becomes the first node known to follow its start, which is exact unless a
+        node sits between our start and the successor's. refine_routing corrects those.
+        """
+        predecessor = state.predecessor if state.predecessor not in ("", None, "None") else successor
+        known = {node_id for node_id in (successor, predecessor, *state.successor_list, *state.finger_table)
+                 if node_id not in ("", None, "None")}
+        known.add(self.node_id)
+        fingers = [successor] + [min(known, key=lambda node_id: (node_id - start) % self.ring_size)
+                                 for start in self.finger_starts[1:]]
+        successors = [node_id for node_id in dict.fromkeys([successor, *state.successor_list]) if node_id != self.node_id]
+        self.update_routing(successor=successor, predecessor=predecessor,
+                            successor_list=successors[:self.successor_list_size], finger_table=fingers)
+        return predecessor
+
+    def refine_routing(self):
+        # background half of a seeded join: look our fingers up exactly, then announce ourselves to the ring
+        self.fix_fingers()
+        self.announce()
+
+    def announce(self):
+        """Gets this node into other nodes' finger tables after a join.
+
+        Eager joins walk update_others. Lazy ones send a single finger hint to the predecessor,
+        if hints are enabled, and otherwise wait for the other nodes' fix_fingers.
+        """
+        if not self.lazy_join:
+            self.update_others()
+        elif (target := self.hint_target(self.node_id, self.finger_hint_hops + 1)) is not None:
+            self.executor.submit(self.network.finger_hint, target, self.node_id, self.finger_hint_hops)
+
+    def hint_target(self, new_node: int, hops: int) -> int | None:
+        """The predecessor a finger hint about new_node goes to next, or None when it stops here."""
+        predecessor = self.predecessor
+        if hops > 1 and predecessor not in ("", None, "None", self.node_id, new_node):
+            return predecessor
+        return None
+
+    def accept_finger_hint(self, new_node: int) -> bool:
+        """Points every finger new_node now owns at it; False when the hint was already seen and must not spread.
+
+        A hint counts as seen for one max_maintenance_interval, by which point fix_fingers has
+        caught up anyway and a node rejoining under the same id can be announced again.
+        """
+        now = time.monotonic()
+        with self.hint_lock:
+            seen = self.finger_hints_seen.get(new_node)
+            if seen is not None and now - seen < self.max_maintenance_interval:
+                return False
+            self.finger_hints_seen[new_node] = now
+            self.finger_hints_seen.move_to_end(new_node)
+            while len(self.finger_hints_seen) > 1024:
+                self.finger_hints_seen.popitem(last=False)
+        if new_node == self.node_id:
+            return False
+
+        with self.routing_lock:
+            routing = self.routing
+            fingers = [new_node if finger not in ("", None, "None")
+                       and (new_node - start) % self.ring_size < (finger - start) % self.ring_size else finger
+                       for start, finger in zip(self.finger_starts, routing.finger_table)]
+            if fingers[0] != routing.finger_table[0]:
+                routing = routing.replace(successor=new_node)
+            self.routing = routing.replace(finger_table=fingers)
+        self.lookup_cache.invalidate(new_node)
+        return True
+
+    def finger_hint(self, new_node: int, hops: int):
+        if self.accept_finger_hint(new_node) and (target := self.hint_target(new_node, hops)) is not None:
+            self.executor.submit(self.network.finger_hint, target, new_node, hops - 1)
 
     def update_others(self):
         for i in range(self.m):
-            id_to_update = (self.node_id - 2 ** i) % (2 ** self.m)
+            id_to_update = (self.node_id - (1 << i)) % self.ring_size
             p = self.find_predecessor(id_to_update)
             self.network.update_finger_table(p, self.node_id, i)
 
     def update_finger_table(self, s: int, i: int):
-        if self.finger_table[i] in ("", None, "None") or self.in_range(s, self.node_id, self.finger_table[i]):
-            self.finger_table[i] = s
-            if self.predecessor not in ("", None, "None") and self.predecessor != self.node_id:
-                self.network.update_finger_table(self.predecessor, s, i)
+        predecessor = self.adopt_finger_update(s, i)
+        if predecessor is not None:
+            self.network.update_finger_table(predecessor, s, i)
+
+    def adopt_finger_update(self, s: int, i: int) -> int | None:
+        """Applies update_finger_table locally; returns the predecessor to pass it on to, if any."""
+        with self.routing_lock:
+            # finger 0 is cleared when the successor dies, the successor that replaced it still bounds the update
+            finger = self.routing.successor if i == 0 else self.routing.finger_table[i]
+            if finger not in ("", None, "None") and not self.in_range(s, self.node_id, finger):
+                return None
+            routing = self.routing.with_finger(i, s)
+            self.routing = routing.replace(successor=s) if i == 0 else routing
+        self.lookup_cache.invalidate(s)
+        predecessor = self.routing.predecessor
+        if not self.lazy_join and predecessor not in ("", None, "None") and predecessor != self.node_id:
+            return predecessor
+        return None
 
     @staticmethod
     def in_range(key, start, end, include_start=False, include_end=False):
-
-        #logging.info(f' start: {start}, end: {end}, key: {key}')
-
         start = int(start)
         end = int(end)
         key = int(key)
 
         if start == end:
             return key != start
+        after_start = start <= key if include_start else start < key
+        before_end = key <= end if include_end else key < end
         if start < end:
-            if include_start and include_end:
-                return start <= key <= end
-            elif include_start:
-                return start <= key < end
-            elif include_end:
-                return start < key <= end
-            else:
-                return start < key < end
-        else:
-            if include_start and include_end:
-                return key >= start or key <= end
-            elif include_start:
-                return key >= start or key < end
-            elif include_end:
-                return key > start or key <= end
-            else:
-                return key > start or key < end
+            return after_start and before_end
+        return after_start or before_end
 
-    def find_successor(self, key: int) -> int:
-        self.stats['lookups'] += 1
+    def find_successor(self, key: int, coalesce: bool = True) -> int:
+        """Resolves the owner of `key`.
+
+        Lookups served for another node pass coalesce=False: in recursive mode such a
+        request can be the ring routing our own lookup back to us, and waiting on that
+        lookup's flight would block until the coalescing timeout.
+        """
+        self.count('lookups')
         if self.successor == self.node_id:
             return self.node_id
+        with self.lookups_in_flight.track():
+            if coalesce:
+                owner = self.inflight.do(('successor', key), lambda: self.resolve_successor(key))
+            else:
+                owner = self.resolve_successor(key, coalesce=False)
+        return self.lookup_finished(owner)
 
-        n = self.find_predecessor(key)
-        if n == self.node_id:
-            return self.successor
-        return self.network.find_successor(n, key)
+    def lookup_finished(self, owner: int | None) -> int | None:
+        if owner is None:
+            self.lookup_failures.inc()
+        return owner
 
-    def find_predecessor(self, key: int):
-        self.stats['lookups'] += 1
-        if self.successor == self.node_id:
+    def resolve_successor(self, key: int, coalesce: bool = True) -> int | None:
+        started = time.monotonic()
+        try:
+            if self.iterative_lookup:
+                return self.find_successor_iterative(key)
+
+            n = self.find_predecessor(key, coalesce)
+            if n == self.node_id:
+                return self.successor
+            return self.network.find_successor(n, key)
+        finally:
+            self.record_lookup_latency(time.monotonic() - started)
+
+    def find_predecessor(self, key: int, coalesce: bool = True):
+        self.count('lookups')
+        successor = self.successor
+        if successor == self.node_id:
             return self.node_id
 
         n = self.node_id
-        successor = self.successor
         iterations = 0
-        while not self.in_range(key, n, successor, include_end=True) and iterations < self.m + 1:
+        # a failed lookup leaves no successor to compare against, so we settle for the closest node so far
+        while (successor is not None and not self.in_range(key, n, successor, include_end=True)
+               and iterations < self.m + 1):
             prev_n = n
-            n = self.closest_preceding_node(key)
+            n = self.route_toward(key)
             if n == prev_n:
                 break
-            successor = self.network.find_successor(self.node_id, n)
+            successor = self.find_successor(n, coalesce)
             iterations += 1
 
         return n
 
-    def closest_preceding_node(self, key):
+    def find_successor_iterative(self, key: int) -> int | None:
+        next_hop, done = self.find_next_hop(key)
+        _, next_hop, done, hops = self.walk(key, self.node_id, next_hop, done)
+        self.lookup_hops.observe(hops)
+        return self.iterative_owner(key, next_hop, done)
+
+    def walk(self, key: int, previous: int, next_hop: int, done: bool = False) -> tuple[int, int, bool, int]:
+        """Follows find_next_hop answers toward key; returns the last node that answered, its answer and the hops."""
+        hops, dead = 0, set()
+        while not done and hops < 2 * self.m:
+            answer = self.network.find_next_hop(next_hop, key)
+            if answer is not None:
+                previous = next_hop
+            elif previous != self.node_id:
+                # only our own table was pruned, the node that sent us there would send us again
+                dead.add(next_hop)
+                answer = self.detour(key, previous, dead, self.network.get_neighbors(previous))
+            else:
+                answer = self.find_next_hop(key)
+            next_hop, done = answer
+            hops += 1
+        return previous, next_hop, done, hops
+
+    def detour(self, key: int, previous: int, dead: set[int],
+               neighbors: tuple[int | None, list[int]] | None) -> tuple[int, bool]:
+        """Steps past dead hops along the successor list of the node that referred us to them."""
+        successors = [node_id for node_id in (neighbors[1] if neighbors else [])
+                      if node_id not in dead and node_id not in (previous, "", None, "None")]
+        preceding = [node_id for node_id in successors if self.in_range(node_id, previous, key)]
+        if preceding:
+            return preceding[-1], False
+        if successors:
+            return successors[0], True
+        return self.find_next_hop(key)
+
+    def iterative_owner(self, key: int, next_hop: int, done: bool) -> int | None:
+        # an unfinished walk stops at a node that only precedes the key, never hand that out as the owner
+        if not done:
+            logging.warning(f"[Node {self.node_id}] Lookup of {key} ran out of hops at {next_hop}")
+            return None
+        return next_hop
+
+    def find_next_hop(self, key: int) -> tuple[int, bool]:
+        routing = self.routing
+        successor = routing.successor
+        if successor in ("", None, "None") or successor == self.node_id:
+            return self.node_id, True
+        if self.in_range(key, self.node_id, successor, include_end=True):
+            return successor, True
+
+        n = self.route_toward(key, routing)
+        if n == self.node_id:
+            return successor, True
+        return n, False
+
+    def route_toward(self, key: int, routing: RoutingState | None = None) -> int:
+        routing = routing or self.routing
+        best = self.closest_preceding_node(key, routing)
+        if not self.proximity_routing or best == self.node_id:
+            return best
+
+        # any peer left at most twice the best remaining distance from the key costs at most one more hop
+        best_gap = (key - best) % self.ring_size
+        candidates = {node_id for node_id in [*routing.finger_table, *routing.successor_list]
+                      if node_id not in ("", None, "None") and self.in_range(node_id, self.node_id, key)
+                      and (key - node_id) % self.ring_size <= 2 * best_gap}
+        measured = [(rtt, node_id) for node_id in candidates
+                    if (rtt := self.network.peer_latency(node_id)) is not None]
+        return min(measured)[1] if measured else best
+
+    def record_lookup_latency(self, seconds: float):
+        self.lookup_duration.observe(seconds)
+        sample = seconds * 1000
+        with self.stats_lock:
+            previous = self.stats['lookup_latency_ms']
+            self.stats['lookup_latency_ms'] = sample if previous is None else previous + 0.2 * (sample - previous)
+
+    def closest_preceding_node(self, key, routing: RoutingState | None = None):
+        routing = routing or self.routing
+        fingers = routing.finger_table
         for i in range(self.m - 1, -1, -1):
-            node_id = self.finger_table[i]
+            node_id = fingers[i]
+            if node_id not in ("", None, "None") and self.in_range(node_id, self.node_id, key):
+                return node_id
+        # a dead successor clears finger 0 until fix_fingers runs, its replacements still precede the key
+        for node_id in (*reversed(routing.successor_list), routing.successor):
             if node_id not in ("", None, "None") and self.in_range(node_id, self.node_id, key):
                 return node_id
         return self.node_id
 
     def handle_dead_node(self, dead_node: int):
         #logging.info(f'Ajung aici in handle_dead_node cu dead_node = {dead_node}')
+        self.lookup_cache.invalidate(dead_node)
+        self.scheduler.signal_churn()
+        with self.routing_lock:
+            routing = self.routing
+            predecessor_died = routing.predecessor == dead_node
+            self.routing = RoutingState(
+                routing.successor,
+                None if predecessor_died else routing.predecessor,
+                [node_id for node_id in routing.successor_list if node_id != dead_node],
+                [None if node_id == dead_node else node_id for node_id in routing.finger_table])
         if self.successor == dead_node:
             self.successor = self.find_alive_successor()
+        # replicas of a dead predecessor are promoted by notify, once the next live predecessor bounds its range
 
-        if self.predecessor == dead_node:
-            self.predecessor = None
+    def find_alive_successor(self) -> int:
+        routing = self.routing
+        if routing.successor_list:
+            return routing.successor_list[0]
 
-        for i in range(self.m):
-            if self.finger_table[i] == dead_node:
-                self.finger_table[i] = None
+        # no probing here: the dead successor is skipped and the next stabilize round validates the choice
+        for node_id in routing.finger_table:
+            if node_id not in ("", None, "None") and node_id != self.node_id and node_id != routing.successor:
+                return node_id
+        return self.node_id
 
-    def find_alive_successor(self) -> int:
-        for node_id in self.finger_table:
-            if node_id and node_id != self.node_id:
-                try:
-                    self.network.find_successor(self.node_id, node_id)
-                    return node_id
-                except grpc.RpcError:
+    def update_successor_list(self, successors: list[int]):
+        with self.routing_lock:
+            routing = self.routing
+            successor_list = []
+            for node_id in [routing.successor, *successors]:
+                if node_id in ("", None, "None") or node_id == self.node_id or node_id in successor_list:
                     continue
-        return self.node_id
+                successor_list.append(node_id)
+            successor_list = successor_list[:self.successor_list_size]
+            self.routing = routing.replace(successor_list=successor_list)
+
+        new_replicas = [node_id for node_id in successor_list[:self.replication_factor]
+                        if node_id not in routing.successor_list[:self.replication_factor]]
+        if new_replicas and self.information:
+            self.sync_replicas(new_replicas)
 
     def print_predecessor_successor(self) -> str:
         return f'Node {self.node_id} successor: {self.successor}, predecessor: {self.predecessor}\n'
 
     def get_node_info(self):
-
+        routing = self.routing
         finger_table = {}
 
         for i in range(self.m):
-            node = self.finger_table[i]
+            node = routing.finger_table[i]
             finger_table[self.start(i)] = node
 
         return {
-            'successor': self.successor,
-            'predecessor': self.predecessor,
+            'successor': routing.successor,
+            'successor_list': list(routing.successor_list),
+            'predecessor': routing.predecessor,
             'finger_table': finger_table,
         }
 
     def print_finger_table(self) -> str:
         output: str = ''
         output = output + f'Node {self.node_id} finger table:\n'
-        if self.finger_table:
+        finger_table = self.routing.finger_table
+        if finger_table:
             for i in range(self.m):
-                node = self.finger_table[i]
+                node = finger_table[i]
                 output = output + f'\tsucc({self.start(i)}): {node}\n'
         else:
             output += 'No finger table elements to show\n'
@@ -192,79 +647,272 @@ class Node:
         output += f'\tLookups: {self.stats["lookups"]}\n'
         output += f'\tStabilization: {self.stats["stabilization"]}\n'
         output += f'\tFinger fixes: {self.stats["finger_fixes"]}\n'
+        output += f'\tLookup cache hits/misses: {self.stats["cache_hits"]}/{self.stats["cache_misses"]}\n'
+        output += f'\tLookup latency (EWMA): {self.stats["lookup_latency_ms"]} ms\n'
+        coalescing = self.inflight.counters()
+        output += (f'\tCoalesced requests: {coalescing["coalesced"]} '
+                   f'({coalescing["coalescing_rate"]:.1%}), {coalescing["coalesce_timeouts"]} wait timeouts\n')
         output += f'\tJoining time: {self.stats["join_time"]}\n'
+        for name, timings in self.get_task_timings().items():
+            output += (f'\t{name}: every {timings["interval"]:.1f}s, {timings["runs"]} runs, '
+                       f'{timings["changes"]} changes, {timings["errors"]} errors, '
+                       f'avg {timings["avg_duration"] * 1000:.1f}ms\n')
 
         return output
 
-    def get_logs(self):
-        logs = []
-        with open('/app/logs/app.log') as logs_file:
-            for line in logs_file.readlines():
-                logs.append(line)
-        return logs
+    def get_logs(self, max_lines: int = 1000) -> list[str]:
+        return [line + '\n' for line in self.log_reader.tail(max_lines).lines]
 
-    def get_stats(self) -> dict[str, int | None]:
-        return self.stats
+    def get_stats(self) -> dict[str, int | float | None]:
+        with self.stats_lock:
+            self.stats.update(self.inflight.counters())
+            return dict(self.stats)
 
-    def leave(self):
-        if self.successor and self.successor != self.node_id:
-            for key, value in self.information.items():
-                self.network.add_information(self.successor, key, value)
+    def pull_keys(self):
+        source = self.handoff_source()
+        if source is not None and not self.network.request_handoff(source[0], self.node_id, source[1], self.node_id):
+            self.handoff_incomplete(*source)
+
+    def handoff_source(self) -> tuple[int, int] | None:
+        """The successor that holds our keys and the low end of the range (low, node_id] we own."""
+        routing = self.routing
+        if routing.successor in ("", None, "None") or routing.successor == self.node_id:
+            return None
+        low = routing.predecessor if routing.predecessor not in ("", None, "None") else routing.successor
+        return routing.successor, low
 
-        if self.predecessor != self.node_id:
-            self.network.set_successor(self.predecessor, self.successor)
+    def handoff_incomplete(self, successor: int, low: int):
+        logging.warning(f"[Node {self.node_id}] Handoff of ({low}, {self.node_id}] from {successor} incomplete")
 
-        if self.successor != self.node_id:
-            self.network.set_predecessor(self.successor, self.predecessor)
+    def handoff_chunks(self, info_keys: list[int], position: int = 0):
+        for i in range(position, len(info_keys), self.transfer_chunk_size):
+            yield self.get_local_information(info_keys[i:i + self.transfer_chunk_size])
+
+    @staticmethod
+    def resume_position(info_keys: list[int], cursor: int | None, position: int) -> int:
+        if cursor is None:
+            return position
+        try:
+            return info_keys.index(cursor) + 1
+        except ValueError:
+            return position
+
+    def hand_off(self, target_id: int, info_keys: list[int], release: bool = False) -> bool:
+        # chunks are produced lazily, so the stream only reads ahead as far as gRPC flow control lets it
+        session_id = uuid.uuid4().hex
+        position = 0
+        for attempt in range(self.handoff_retries):
+            if self.network.hand_off(target_id, session_id, self.handoff_chunks(info_keys, position)):
+                if release:
+                    self.release_keys(info_keys)
+                return True
+            cursor = self.network.get_handoff_cursor(target_id, session_id)
+            position = self.handoff_interrupted(target_id, info_keys, cursor, position, attempt)
+        return False
+
+    def serve_handoff(self, requester_id: int, start: int, end: int) -> bool:
+        """Starts pushing the keys in (start, end] to requester_id and returns once the push is queued.
+
+        The RequestHandoff handler answers right away, so a server thread is never parked
+        on the nested Handoff stream.
+        """
+        self.executor.submit(self.push_keys, requester_id, self.get_range(start, end))
+        return True
 
-        if self.predecessor != self.node_id:
-            self.network.notify(self.predecessor, self.successor)
-        if self.successor != self.node_id:
-            self.network.notify(self.successor, self.predecessor)
+    def push_keys(self, requester_id: int, info_keys: list[int]):
+        if not self.hand_off(requester_id, info_keys, release=True):
+            self.push_failed(requester_id, info_keys)
+
+    def push_failed(self, requester_id: int, info_keys: list[int]):
+        logging.warning(f"[Node {self.node_id}] Could not hand off {len(info_keys)} keys to {requester_id}")
+
+    def handoff_interrupted(self, target_id: int, info_keys: list[int], cursor: int | None, position: int,
+                            attempt: int) -> int:
+        position = self.resume_position(info_keys, cursor, position)
+        logging.warning(f"[Node {self.node_id}] Handoff to {target_id} interrupted, "
+                        f"resuming at {position}/{len(info_keys)} (attempt {attempt + 1})")
+        return position
+
+    def receive_handoff(self, session_id: str, chunk: dict[int, str]) -> int | None:
+        # handed-off keys already have replicas further along the ring, so they are only written here
+        for info_key, info in chunk.items():
+            self.write_information(info_key, info)
+        with self.handoff_lock:
+            if chunk:
+                self.handoff_cursors[session_id] = next(reversed(chunk))
+                self.handoff_cursors.move_to_end(session_id)
+                while len(self.handoff_cursors) > 64:
+                    self.handoff_cursors.popitem(last=False)
+            return self.handoff_cursors.get(session_id)
+
+    def get_handoff_cursor(self, session_id: str) -> int | None:
+        with self.handoff_lock:
+            return self.handoff_cursors.get(session_id)
+
+    def get_range(self, start: int, end: int) -> list[int]:
+        return self.key_index.range(start, end)
+
+    def release_keys(self, info_keys):
+        # handed-off keys stay here as replicas: the new owner is our predecessor
+        for info_key in info_keys:
+            with self.key_locks(info_key):
+                info = self.drop_information(info_key)
+                if info is None:
+                    continue
+                if self.replication_factor > 0:
+                    self.redundant_information[info_key] = info
 
-    def fix_fingers(self):
-        self.stats['finger_fixes'] += 1
+    def leave(self):
+        if self.successor and self.successor != self.node_id:
+            if not self.hand_off(self.successor, list(self.key_index)):
+                logging.error(f"[Node {self.node_id}] Could not hand off keys to {self.successor} before leaving")
+
+        for method, target_id, node_id in self.departure_messages():
+            getattr(self.network, method)(target_id, node_id)
+
+    def departure_messages(self) -> list[tuple[str, int, int]]:
+        """The network calls, in order, that splice this node out of the ring."""
+        routing = self.routing
+        predecessor, successor = routing.predecessor, routing.successor
+        messages = []
+        if predecessor != self.node_id:
+            messages.append(('set_successor', predecessor, successor))
+        if successor != self.node_id:
+            messages.append(('set_predecessor', successor, predecessor))
+        if predecessor != self.node_id:
+            messages.append(('notify', predecessor, successor))
+        if successor != self.node_id:
+            messages.append(('notify', successor, predecessor))
+        return messages
+
+    def finger_boundaries(self) -> list[int]:
+        # the current table predicts where the owner changes; only those fingers need a lookup
+        fingers = self.routing.finger_table
+        return [i for i in range(self.m) if i == 0 or fingers[i] != fingers[i - 1]]
+
+    def reuse_fingers(self, starts: list[int], resolved: dict[int, int | None]) -> tuple[list[int | None], list[int]]:
+        fingers: list[int | None] = [None] * self.m
+        pending = []
+        covering_start, covering = None, None
         for i in range(self.m):
-            try:
-                successor = self.network.find_successor(self.node_id, self.start(i))
-                if successor is not None:
-                    self.finger_table[i] = successor
-            except grpc.RpcError:
-                continue
+            if i in resolved:
+                covering_start, covering = starts[i], resolved[i]
+                fingers[i] = covering
+            elif (covering is not None and covering_start != covering
+                  and self.in_range(starts[i], covering_start, covering, include_end=True)):
+                fingers[i] = covering
+            else:
+                if covering is not None or i == 0 or i - 1 in resolved:
+                    pending.append(i)
+                covering_start, covering = None, None
+        return fingers, pending
 
-    def stabilize(self):
-        self.stats['stabilization'] += 1
+    def lookup_finger(self, start: int) -> int | None:
         try:
-            x = self.network.get_predecessor(self.successor)
-            if x and self.in_range(x, self.node_id, self.successor, include_end=True):
-                self.successor = x
+            return self.find_successor(start)
         except grpc.RpcError:
-            logging.error(f"[Node {self.node_id}] Detected dead successor: {self.successor}")
-            self.successor = self.find_alive_successor()
+            return None
+
+    def fix_fingers(self) -> bool:
+        self.count('finger_fixes')
+        starts = [self.start(i) for i in range(self.m)]
+        resolved: dict[int, int | None] = {}
+        pending = self.finger_boundaries()
+        while pending:
+            results = self.finger_executor.map(self.lookup_finger, [starts[i] for i in pending])
+            resolved.update(zip(pending, results))
+            fingers, pending = self.reuse_fingers(starts, resolved)
+
+        return self.apply_fingers(fingers)
+
+    def apply_fingers(self, fingers: list[int | None]) -> bool:
+        with self.routing_lock:
+            current = self.routing.finger_table
+            updated = [successor if successor is not None else finger for successor, finger in zip(fingers, current)]
+            changed = tuple(updated) != current
+            if changed:
+                self.routing = self.routing.replace(finger_table=updated)
+        return changed
+
+    def stabilize(self) -> bool:
+        self.count('stabilization')
+        before = self.routing
+        try:
+            self.adopt_neighbors(self.network.get_neighbors(self.successor))
+        except grpc.RpcError:
+            self.lose_successor()
 
         try:
-            self.network.notify(self.successor, self.node_id)
+            successors = self.network.notify(self.successor, self.node_id)
+            if successors is not None:
+                self.update_successor_list(successors)
         except grpc.RpcError:
             self.successor = self.find_alive_successor()
 
-        if self.predecessor is not None:
-            try:
-                _ = self.network.get_predecessor(self.predecessor)
-            except grpc.RpcError:
-                logging.error(f"[Node {self.node_id}] Detected dead predecessor: {self.predecessor}")
-                self.predecessor = None
+        return self.settle_alone(before)
+
+    def adopt_neighbors(self, neighbors: tuple[int | None, list[int]] | None):
+        if neighbors is None:
+            return
+        x, successors = neighbors
+        if x and self.in_range(x, self.node_id, self.successor, include_end=True):
+            if x != self.successor:
+                self.lookup_cache.invalidate(x)
+            self.successor = x
         else:
-            self.predecessor = self.node_id
+            self.update_successor_list(successors)
+
+    def lose_successor(self):
+        logging.error(f"[Node {self.node_id}] Detected dead successor: {self.successor}")
+        self.lookup_cache.invalidate(self.successor)
+        self.successor = self.find_alive_successor()
+
+    def settle_alone(self, before: RoutingState) -> bool:
+        # a node that is its own successor with no other predecessor is a ring of one
+        with self.routing_lock:
+            routing = self.routing
+            if routing.successor == self.node_id and routing.predecessor in (None, self.node_id):
+                self.routing = routing.replace(successor=self.node_id, predecessor=self.node_id)
+        after = self.routing
+        return (after.successor, after.successor_list) != (before.successor, before.successor_list)
+
+    def check_predecessor(self) -> bool:
+        predecessor = self.predecessor
+        if self.claim_missing_predecessor(predecessor):
+            return True
+        try:
+            _ = self.network.get_predecessor(predecessor)
+        except grpc.RpcError:
+            self.forget_predecessor(predecessor)
+            return True
+        return False
 
-        if self.successor == self.node_id and (self.predecessor is None or self.predecessor == self.node_id):
+    def claim_missing_predecessor(self, predecessor: int | None) -> bool:
+        if predecessor is None:
             self.predecessor = self.node_id
-            self.successor = self.node_id
+            return True
+        return False
+
+    def forget_predecessor(self, predecessor: int):
+        logging.error(f"[Node {self.node_id}] Detected dead predecessor: {predecessor}")
+        with self.routing_lock:
+            # a notify may have installed a new predecessor while we were probing the old one
+            if self.routing.predecessor == predecessor:
+                self.predecessor = None
 
     def notify(self, node: int):
-        logging.info(f"[Node {self.node_id}] Received notify({node}) with current predecessor = {self.predecessor}")
-        if self.predecessor is None or self.in_range(node, self.predecessor, self.node_id):
-            logging.info(f"[Node {self.node_id}] Updating predecessor from {self.predecessor} to {node}")
-            self.predecessor = node
+        with self.routing_lock:
+            predecessor = self.routing.predecessor
+            logging.info(f"[Node {self.node_id}] Received notify({node}) with current predecessor = {predecessor}")
+            updated = predecessor is None or self.in_range(node, predecessor, self.node_id)
+            if updated:
+                logging.info(f"[Node {self.node_id}] Updating predecessor from {predecessor} to {node}")
+                self.predecessor = node
+        if updated:
+            self.lookup_cache.invalidate(node)
+            self.scheduler.signal_churn()
+            if self.replication_factor > 0:
+                self.promote_replicas(node)
         else:
             logging.info(f"[Node {self.node_id}] Did NOT update predecessor")
 
@@ -273,46 +921,89 @@ class Node:
         if self.information.__contains__(info):
             # print(f"Info found: {self.information[info]}")
             return self.information[info]
+        if info in self.redundant_information and self.is_responsible_for(info):
+            return self.redundant_information[info]
         # print(f"Info not found...")
         return None
 
-    def get_information(self, info_key: int):
-        responsible_node = self.find_successor(info_key)
+    def is_responsible_for(self, info_key: int) -> bool:
+        if self.predecessor in ("", None, "None"):
+            return True
+        return self.in_range(info_key, self.predecessor, self.node_id, include_end=True)
+
+    def find_owner(self, info_key: int) -> tuple[int | None, bool]:
+        owner = self.cached_owner(info_key)
+        if owner is not None:
+            return owner, True
+        return self.remember_owner(info_key, self.find_successor(info_key)), False
+
+    def cached_owner(self, info_key: int) -> int | None:
+        owner = self.lookup_cache.get(info_key)
+        self.count('cache_hits' if owner is not None else 'cache_misses')
+        return owner
+
+    def remember_owner(self, info_key: int, owner: int | None, stale_owner: int | None = None) -> int | None:
+        if owner is not None:
+            if stale_owner is not None:
+                self.lookup_cache.invalidate(stale_owner)
+            self.lookup_cache.put(info_key, owner)
+        return owner
+
+    def refresh_owner(self, info_key: int, stale_owner: int | None) -> int | None:
+        owner = self.find_successor(info_key)
+        if owner is not None and owner != stale_owner:
+            return self.remember_owner(info_key, owner, stale_owner)
+        return None
+
+    def lookup_information(self, info_key: int) -> tuple[int | None, str | None]:
+        responsible_node, cached = self.find_owner(info_key)
         # print(f"[get_information] {info_key} predecessor is {responsible_node}")
+        if responsible_node is None:
+            return None, None
         if responsible_node == self.node_id:
-            return self.node_has_info(info_key)
+            return responsible_node, self.node_has_info(info_key)
 
         information = self.network.get_information(responsible_node, info_key)
+        if self.owner_may_be_stale(information, cached):
+            owner = self.refresh_owner(info_key, responsible_node)
+            if owner is not None:
+                responsible_node = owner
+                if owner == self.node_id:
+                    information = self.node_has_info(info_key)
+                else:
+                    information = self.network.get_information(owner, info_key)
+
+        return responsible_node, information if information != 'None' else None
+
+    def owner_may_be_stale(self, information: str | None, cached: bool) -> bool:
+        # a cached owner may have lost the key to a join we never saw; a dead owner's replica
+        # is served by its successor
+        return (information == 'None' and cached) or (information is None and self.replication_factor > 0)
 
-        return information if information != 'None' else None
+    def get_information(self, info_key: int):
+        return self.inflight.do(('information', info_key), lambda: self.lookup_information(info_key))[1]
 
     def get_all_node_info(self) -> dict[int, str]:
-        return self.information
+        # a copy, so callers can iterate while writes go on
+        if self.repository is not None:
+            return self.repository.copy()
+        return dict(self.information)
 
     def create_info(self, info_key: int, info: str) -> bool:
-        info_already_exists = self.get_information(info_key)
+        responsible_node, info_already_exists = self.lookup_information(info_key)
 
-        if info_already_exists:
+        if info_already_exists or responsible_node is None:
             return False
-        responsible_node = self.find_successor(info_key)
         if responsible_node == self.node_id:
-            self.add_information(info_key, info)
-            return True
+            return self.add_information(info_key, info)
 
-        self.network.add_information(responsible_node, info_key, info)
-
-        # successor_node = self.network.find_successor(self.node_id, responsible_node)
-        # for _ in range(2):
-        #     successor_node.__add_redundant_info(info_key, info)
-        #     successor_node = self.network.find_successor(self.node_id, successor_node)
-        return True
+        return self.network.add_information(responsible_node, info_key, info)
 
     def remove_info(self, info_key: int):
-        info_already_exists = self.get_information(info_key)
+        responsible_node, info_already_exists = self.lookup_information(info_key)
 
-        if not info_already_exists:
+        if not info_already_exists or responsible_node is None:
             return False
-        responsible_node = self.find_successor(info_key)
         if responsible_node == self.node_id:
             self.remove_information(info_key)
             return True
@@ -320,25 +1011,220 @@ class Node:
         self.network.remove_information(responsible_node, info_key)
         return True
 
+    def put(self, key: bytes | str, info: str) -> bool:
+        return self.create_info(self.key_id(key), info)
+
+    def get(self, key: bytes | str) -> str | None:
+        return self.get_information(self.key_id(key))
+
+    def delete(self, key: bytes | str) -> bool:
+        return self.remove_info(self.key_id(key))
+
+    def group_keys_by_owner(self, keys) -> dict[int | None, list[int]]:
+        groups: dict[int | None, list[int]] = {}
+        owner = None
+        low = None
+        for key in sorted(set(keys)):
+            if self.owner_covers(key, low, owner):
+                groups[owner].append(key)
+                continue
+            owner, _ = self.find_owner(key)
+            low = key
+            groups.setdefault(owner, []).append(key)
+        return groups
+
+    def owner_covers(self, key: int, low: int | None, owner: int | None) -> bool:
+        # once succ(low) = owner is known, every key in [low, owner] has the same owner
+        return owner is not None and low != owner and self.in_range(key, low, owner, include_end=True)
+
+    @staticmethod
+    def merge_found(keys, found: list[dict[int, str]]) -> dict[int, str | None]:
+        results = {key: None for key in keys}
+        for owner_found in found:
+            results.update(owner_found)
+        return results
+
+    @staticmethod
+    def mark_keys(keys, done: list[list[int]]) -> dict[int, bool]:
+        results = {key: False for key in keys}
+        for owner_done in done:
+            for key in owner_done:
+                results[key] = True
+        return results
+
+    def _fan_out(self, request, groups: dict) -> list:
+        if len(groups) == 1:
+            return [request(owner, owner_keys) for owner, owner_keys in groups.items()]
+
+        pending = [self.executor.submit(request, owner, owner_keys) for owner, owner_keys in groups.items()]
+        return [future.result() for future in pending]
+
+    def get_many(self, keys) -> dict[int, str | None]:
+        def request(owner, owner_keys):
+            if owner is None:
+                return {}
+            if owner == self.node_id:
+                return self.get_local_information(owner_keys)
+            return self.network.get_many(owner, owner_keys) or {}
+
+        return self.merge_found(keys, self._fan_out(request, self.group_keys_by_owner(keys)))
+
+    def create_many(self, items: dict[int, str]) -> dict[int, bool]:
+        def request(owner, owner_keys):
+            owner_items = {key: items[key] for key in owner_keys}
+            if owner is None:
+                return []
+            if owner == self.node_id:
+                return self.add_many_information(owner_items)
+            return self.network.put_many(owner, owner_items) or []
+
+        return self.mark_keys(items, self._fan_out(request, self.group_keys_by_owner(items.keys())))
+
+    def remove_many(self, keys) -> dict[int, bool]:
+        def request(owner, owner_keys):
+            if owner is None:
+                return []
+            if owner == self.node_id:
+                return self.remove_many_information(owner_keys)
+            return self.network.remove_many(owner, owner_keys) or []
+
+        return self.mark_keys(keys, self._fan_out(request, self.group_keys_by_owner(keys)))
+
+    def schedule_maintenance(self):
+        # fingers drift more slowly than successors, so they back off to twice the interval
+        self.scheduler.add('stabilize', self.stabilize, self.min_maintenance_interval, self.max_maintenance_interval)
+        self.scheduler.add('check_predecessor', self.check_predecessor,
+                           self.min_maintenance_interval, self.max_maintenance_interval)
+        self.scheduler.add('fix_fingers', self.fix_fingers,
+                           self.min_maintenance_interval, 2 * self.max_maintenance_interval)
+        if self.journal is not None:
+            self.scheduler.add('journal', self.save_routing, self.min_maintenance_interval,
+                               self.max_maintenance_interval)
+
     def start_background_tasks(self):
-        def loop():
-            while True:
-                logging.info(f'[start_background_tasks][{self.node_id}] stabilization and fixing fingers')
-                self.stabilize()
-                self.fix_fingers()
-                time.sleep(5)
+        self.schedule_maintenance()
+        return self.scheduler.start()
+
+    def stop_background_tasks(self):
+        self.scheduler.stop()
+        self.save_routing()
 
-        t = threading.Thread(target=loop, daemon=True)
-        t.start()
+    def get_task_timings(self) -> dict[str, dict[str, float | int]]:
+        return self.scheduler.timings()
 
     def remove_redundant_info(self, info_key: int):
         self.redundant_information.pop(info_key, None)
 
+    def drop_information(self, info_key: int) -> str | None:
+        # with a repository, self.information is the repository's own dict and only it may change it
+        if self.repository is not None:
+            return self.repository.delete(info_key)
+        info = self.information.pop(info_key, None)
+        with self.index_lock:
+            self.key_index.discard(info_key)
+        return info
+
     def remove_information(self, info_key: int):
-        self.information.pop(info_key, None)
+        with self.key_locks(info_key):
+            self.drop_information(info_key)
+        self.remove_replicas(info_key)
+
+    def write_information(self, info_key: int, info: str):
+        # the dict, the index and the file agree for a key whenever its stripe is free
+        with self.key_locks(info_key):
+            self.redundant_information.pop(info_key, None)
+            if self.repository is not None:
+                self.repository.put(info_key, info)
+            else:
+                self.information[info_key] = info
+                with self.index_lock:
+                    self.key_index.add(info_key)
+
+    def add_information(self, info_key: int, info: str) -> bool:
+        """Stores the key and replicates it; False when the write quorum was not reached."""
+        self.write_information(info_key, info)
+        return self.replicate(info_key, info)
+
+    def write_new_information(self, info_key: int, info: str) -> bool:
+        with self.key_locks(info_key):
+            if info_key in self.information:
+                return False
+            self.write_information(info_key, info)
+        return True
+
+    def add_new_information(self, info_key: int, info: str) -> bool:
+        if not self.write_new_information(info_key, info):
+            return False
+        self.replicate(info_key, info)
+        return True
+
+    def replicate(self, info_key: int, info: str) -> bool:
+        pending = [self.replication_executor.submit(self.network.add_redundant_info, node_id, info_key, info)
+                   for node_id in self.routing.successor_list[:self.replication_factor]]
+        return self.await_quorum(pending, f'key {info_key}')
+
+    def replicate_many(self, items: dict[int, str]) -> bool:
+        """Replicates a batch with one call per successor instead of one per key and successor."""
+        if not items:
+            return True
+        pending = [self.replication_executor.submit(self.network.add_redundant_many, node_id, items)
+                   for node_id in self.routing.successor_list[:self.replication_factor]]
+        return self.await_quorum(pending, f'{len(items)} keys')
+
+    def await_quorum(self, pending: list[futures.Future], what: str) -> bool:
+        if self.write_quorum <= 0 or not pending:
+            return True
 
-    def add_information(self, info_key: int, info: str):
-        self.information[info_key] = info
+        acks = 0
+        for future in futures.as_completed(pending):
+            if future.exception() is None and future.result():
+                acks += 1
+            if acks >= self.write_quorum:
+                return True
+        logging.warning(f"[Node {self.node_id}] Write quorum not reached for {what}: {acks}/{self.write_quorum}")
+        return False
+
+    def remove_replicas(self, info_key: int):
+        for node_id in self.routing.successor_list[:self.replication_factor]:
+            self.replication_executor.submit(self.network.remove_redundant_info, node_id, info_key)
+
+    def sync_replicas(self, replicas: list[int]):
+        for node_id in replicas:
+            for items in self.handoff_chunks(list(self.key_index)):
+                self.replication_executor.submit(self.network.add_redundant_many, node_id, items)
+
+    def promote_replicas(self, low: int):
+        # replication handlers keep writing replicas while we scan
+        promoted = [info_key for info_key in list(self.redundant_information)
+                    if self.in_range(info_key, low, self.node_id, include_end=True)]
+        for info_key in promoted:
+            info = self.redundant_information.pop(info_key, None)
+            # our successors already hold these as replicas of the node that left
+            if info is not None:
+                self.write_new_information(info_key, info)
+        if promoted:
+            logging.info(f"[Node {self.node_id}] Promoted {len(promoted)} replicas in ({low}, {self.node_id}]")
 
     def add_redundant_info(self, info_key: int, info: str):
         self.redundant_information[info_key] = info
+
+    def add_redundant_many(self, items: dict[int, str]):
+        self.redundant_information.update(items)
+
+    def get_local_information(self, info_keys) -> dict[int, str]:
+        return {key: self.information[key] for key in info_keys if key in self.information}
+
+    def add_many_information(self, items: dict[int, str]) -> list[int]:
+        created = [info_key for info_key, info in items.items() if self.write_new_information(info_key, info)]
+        self.replicate_many({info_key: items[info_key] for info_key in created})
+        return created
+
+    def remove_many_information(self, info_keys) -> list[int]:
+        removed = []
+        for info_key in info_keys:
+            with self.key_locks(info_key):
+                if self.drop_information(info_key) is None:
+                    continue
+            self.remove_replicas(info_key)
+            removed.append(info_key)
+        return removed
@@ -1,25 +1,66 @@
+from collections.abc import Iterable
+
+from business.routing_state import RoutingState
+
+
+class Unsupported:
+    """Returned by a call the peer does not implement; None still means the peer did not answer."""
+
+    def __repr__(self):
+        return 'UNSUPPORTED'
+
+
+UNSUPPORTED = Unsupported()
+
+
 class NodeNetworkInterface:
     def find_successor(self, target_id: int, key: int) -> int: ...
 
+    def peer_latency(self, node_id: int) -> float | None:
+        return None
+
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None: ...
+
     def get_predecessor(self, target_id: int) -> int: ...
 
+    def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None: ...
+
+    def get_routing_state(self, target_id: int) -> RoutingState | Unsupported | None:
+        return UNSUPPORTED
+
     def set_predecessor(self, target_id: int, new_predecessor_id: int): ...
 
     def set_successor(self, target_id: int, new_successor_id: int): ...
 
     def get_successor(self, target_id: int) -> int: ...
 
-    def notify(self, target_id: int, sender_id: int): ...
+    def notify(self, target_id: int, sender_id: int) -> list[int] | None: ...
 
     def update_finger_table(self, target_id: int, new_node_id: int, index: int): ...
 
+    def finger_hint(self, target_id: int, new_node_id: int, hops: int): ...
+
     def get_information(self, target_node_id: int, info_key: int) -> [str | None]: ...
 
-    def add_information(self, target_node_id: int, info_key: int, info: str): ...
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool: ...
 
     def remove_information(self, target_node_id: int, info_key: int): ...
 
-    def add_redundant_info(self, target_node_id: int, info_key: int, info: str): ...
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None: ...
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None: ...
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None: ...
+
+    def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool: ...
+
+    def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None: ...
+
+    def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool: ...
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None: ...
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None: ...
 
     def remove_redundant_info(self, target_node_id: int, info_key: int): ...
 
@@ -0,0 +1,36 @@
+import logging
+
+STARTING = 'starting'
+SERVING = 'serving'
+JOINED = 'joined'
+SYNCED = 'synced'
+DRAINING = 'draining'
+
+STAGES = (STARTING, SERVING, JOINED, SYNCED)
+
+
+class Readiness:
+    """Startup stage of the process: the gRPC server is up, the ring is joined, then owned keys are pulled.
+
+    Only a synced process that is not draining reports ready.
+    """
+
+    def __init__(self):
+        self.stage = STARTING
+        self.draining = False
+
+    def advance(self, stage: str):
+        if STAGES.index(stage) > STAGES.index(self.stage):
+            self.stage = stage
+            logging.info(f"[readiness] {stage}")
+
+    def drain(self):
+        self.draining = True
+        logging.info("[readiness] draining")
+
+    @property
+    def ready(self) -> bool:
+        return self.stage == SYNCED and not self.draining
+
+    def status(self) -> str:
+        return DRAINING if self.draining else self.stage
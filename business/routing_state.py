@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+
+class RoutingState:
+    """A node's neighbours at one instant. Never modified in place: every change builds a new
+    snapshot and swaps it in, so readers walk a consistent table without taking a lock.
+    """
+
+    __slots__ = ('successor', 'predecessor', 'successor_list', 'finger_table')
+
+    def __init__(self, successor: int | None, predecessor: int | None, successor_list: tuple[int, ...] = (),
+                 finger_table: tuple[int | None, ...] = ()):
+        object.__setattr__(self, 'successor', successor)
+        object.__setattr__(self, 'predecessor', predecessor)
+        object.__setattr__(self, 'successor_list', tuple(successor_list))
+        object.__setattr__(self, 'finger_table', tuple(finger_table))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"RoutingState is immutable, cannot set {name}")
+
+    def replace(self, **changes) -> RoutingState:
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return RoutingState(**fields)
+
+    def with_finger(self, i: int, node_id: int | None) -> RoutingState:
+        fingers = list(self.finger_table)
+        fingers[i] = node_id
+        return self.replace(finger_table=fingers)
+
+    def __repr__(self):
+        return (f'RoutingState(successor={self.successor}, predecessor={self.predecessor}, '
+                f'successor_list={list(self.successor_list)}, finger_table={list(self.finger_table)})')
@@ -0,0 +1,149 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Callable
+
+
+class AdaptiveTask:
+    def __init__(self, name: str, action: Callable, min_interval: float, max_interval: float,
+                 backoff: float = 2.0):
+        self.name = name
+        self.action = action
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.next_run = 0.0
+        self.runs = 0
+        self.changes = 0
+        self.errors = 0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+
+    def record(self, changed: bool, duration: float, now: float):
+        self.runs += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if changed:
+            self.changes += 1
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        self.next_run = now + self.interval
+
+    def timings(self) -> dict[str, float | int]:
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'changes': self.changes,
+            'errors': self.errors,
+            'last_duration': self.last_duration,
+            'avg_duration': self.total_duration / self.runs if self.runs else 0.0,
+        }
+
+
+class AdaptiveScheduler:
+    """Runs periodic maintenance with per-task intervals.
+
+    A task that reports no change backs off exponentially up to its max interval;
+    a change, an error or an external churn signal drops it back to the minimum.
+    """
+
+    def __init__(self, name: str = 'scheduler'):
+        self.name = name
+        self.tasks: dict[str, AdaptiveTask] = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.async_wakeup: asyncio.Event | None = None
+        self.thread: threading.Thread | None = None
+
+    def add(self, name: str, action: Callable, min_interval: float, max_interval: float, backoff: float = 2.0):
+        self.tasks[name] = AdaptiveTask(name, action, min_interval, max_interval, backoff)
+
+    def signal_churn(self, *names: str):
+        now = time.monotonic()
+        with self.lock:
+            for task in self.tasks.values():
+                if names and task.name not in names:
+                    continue
+                task.interval = task.min_interval
+                task.next_run = min(task.next_run, now)
+        self.wakeup.set()
+        if self.async_wakeup is not None:
+            self.async_wakeup.set()
+
+    def due(self, now: float) -> list[AdaptiveTask]:
+        with self.lock:
+            return [task for task in self.tasks.values() if task.next_run <= now]
+
+    def delay(self, now: float) -> float:
+        with self.lock:
+            if not self.tasks:
+                return 1.0
+            return max(min(task.next_run for task in self.tasks.values()) - now, 0.0)
+
+    def finish(self, task: AdaptiveTask, changed: bool, started: float):
+        now = time.monotonic()
+        with self.lock:
+            task.record(changed, now - started, now)
+
+    def fail(self, task: AdaptiveTask, error: Exception, started: float):
+        logging.error(f'[{self.name}] {task.name} failed: {error}')
+        task.errors += 1
+        self.finish(task, True, started)
+
+    def run_pending(self):
+        for task in self.due(time.monotonic()):
+            started = time.monotonic()
+            try:
+                changed = bool(task.action())
+            except Exception as e:
+                self.fail(task, e, started)
+                continue
+            self.finish(task, changed, started)
+
+    def run_forever(self):
+        while not self.stopped.is_set():
+            self.run_pending()
+            self.wakeup.wait(self.delay(time.monotonic()))
+            self.wakeup.clear()
+
+    def start(self) -> threading.Thread:
+        self.thread = threading.Thread(target=self.run_forever, name=self.name, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def stop(self):
+        self.stopped.set()
+        self.wakeup.set()
+
+    async def run_pending_async(self):
+        for task in self.due(time.monotonic()):
+            started = time.monotonic()
+            try:
+                # plain functions are allowed too, for tasks that never touch the network
+                changed = task.action()
+                if inspect.isawaitable(changed):
+                    changed = await changed
+                changed = bool(changed)
+            except Exception as e:
+                self.fail(task, e, started)
+                continue
+            self.finish(task, changed, started)
+
+    async def run_forever_async(self):
+        self.async_wakeup = asyncio.Event()
+        while not self.stopped.is_set():
+            await self.run_pending_async()
+            try:
+                await asyncio.wait_for(self.async_wakeup.wait(), timeout=self.delay(time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+            self.async_wakeup.clear()
+
+    def timings(self) -> dict[str, dict[str, float | int]]:
+        with self.lock:
+            return {name: task.timings() for name, task in self.tasks.items()}
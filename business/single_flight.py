@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class Flight:
+    def __init__(self, owner):
+        self.owner = owner
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Lets concurrent callers asking for the same key share one in-flight call.
+
+    A call made again from the thread that is already resolving the key (the ring
+    routing a lookup back through this node) runs on its own instead of waiting for
+    itself, and a follower that waits longer than `timeout` gives up and calls directly.
+    """
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+        self.flights: dict[Hashable, Flight] = {}
+        self.lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        me = threading.get_ident()
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is None:
+                flight = self.flights[key] = Flight(me)
+                self.executed += 1
+                leader = True
+            else:
+                leader = False
+                if flight.owner != me:
+                    self.coalesced += 1
+
+        if leader:
+            try:
+                flight.result = fn()
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self.lock:
+                    del self.flights[key]
+                flight.done.set()
+
+        if flight.owner == me:
+            return fn()
+        if not flight.done.wait(self.timeout):
+            with self.lock:
+                self.timeouts += 1
+            return fn()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def counters(self) -> dict[str, int | float]:
+        with self.lock:
+            total = self.executed + self.coalesced
+            return {
+                'coalesced': self.coalesced,
+                'coalesce_timeouts': self.timeouts,
+                'coalescing_rate': self.coalesced / total if total else 0.0,
+            }
+
+
+class AsyncSingleFlight(SingleFlight):
+    """SingleFlight for coroutines; the owner of a flight is the task that started it."""
+
+    def __init__(self, timeout: float = 5.0):
+        super().__init__(timeout)
+        self.futures: dict[Hashable, tuple[asyncio.Task | None, asyncio.Future]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        me = asyncio.current_task()
+        flight = self.futures.get(key)
+        if flight is None:
+            future = asyncio.get_running_loop().create_future()
+            self.futures[key] = (me, future)
+            self.executed += 1
+            try:
+                result = await fn()
+                future.set_result(result)
+                return result
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # followers re-raise it; mark it retrieved so an unshared failure is not logged
+                future.exception()
+                raise
+            finally:
+                del self.futures[key]
+
+        owner, future = flight
+        if owner is me:
+            return await fn()
+        self.coalesced += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return await fn()
+        except asyncio.CancelledError:
+            # the leader was cancelled, not us
+            if not future.cancelled():
+                raise
+            return await fn()
@@ -0,0 +1,15 @@
+import threading
+
+
+class StripedLock:
+    """A fixed pool of reentrant locks picked by key.
+
+    Writers to different keys rarely share a stripe, so they proceed in parallel, while all
+    writers to one key are serialized. Readers do not lock at all.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self.locks = [threading.RLock() for _ in range(stripes)]
+
+    def __call__(self, key) -> threading.RLock:
+        return self.locks[hash(key) % len(self.locks)]
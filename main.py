@@ -1,19 +1,31 @@
+import asyncio
 import os
 import sys
 import threading
 import time
 import logging
 import signal
-from time import sleep
 
-from presentation.chord_server import serve
+import grpc
+
+from presentation.async_chord_server import start_async_server
+from presentation.async_kubernetes_network import AsyncKubernetesNetwork
+from presentation.chord_server import start_server
+from presentation.http_endpoint import HttpEndpoint
+from business.async_node import AsyncNode
+from business.identifiers import MAX_ID_BITS
 from business.node import Node
+from business.readiness import JOINED, SERVING, SYNCED, Readiness
 from presentation.kubernetes_network import KubernetesNetwork
+from presentation.kubernetes_v2_network import KubernetesV2Network
+from persistence.file_repository import FileRepository
+from persistence.log_reader import DEFAULT_LOG_PATH
+from persistence.membership_journal import MembershipJournal
 
 logging.basicConfig(
     level=logging.INFO,
     filemode='a',
-    filename='/app/logs/app.log',
+    filename=DEFAULT_LOG_PATH,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -30,56 +42,212 @@ def extract_node_id_from_pod_name(pod_name: str) -> int:
         raise
 
 
-def launch_node(node_id: int, m: int) -> Node:
-    logger.info(f"Launching node {node_id} with m={m}")
+def create_node(node_class, node_id: int, m: int, network, data_dir: str, **kwargs):
+    return node_class(node_id, m, network,
+                      replication_factor=int(os.getenv("CHORD_REPLICATION_FACTOR", "0")),
+                      write_quorum=int(os.getenv("CHORD_WRITE_QUORUM", "0")),
+                      min_maintenance_interval=float(os.getenv("CHORD_MIN_MAINTENANCE_INTERVAL", "1")),
+                      max_maintenance_interval=float(os.getenv("CHORD_MAX_MAINTENANCE_INTERVAL", "60")),
+                      proximity_routing=os.getenv("CHORD_PROXIMITY_ROUTING", "0") == "1",
+                      lazy_join=os.getenv("CHORD_LAZY_JOIN", "0") == "1",
+                      finger_hint_hops=int(os.getenv("CHORD_FINGER_HINT_HOPS", "0")),
+                      repository=FileRepository(data_dir, key_width=(m + 7) // 8),
+                      journal=MembershipJournal(data_dir) if os.getenv("CHORD_WARM_START", "1") == "1" else None,
+                      **kwargs)
+
+
+def create_virtual_nodes(node_class, ordinal: int, m: int, network, virtual_nodes: int, **kwargs) -> list:
+    data_dir = os.getenv("CHORD_DATA_DIR", "/app/data")
+    node_ids = network.node_ids_for_pod(f"chord-{ordinal}", virtual_nodes)
+    nodes = [create_node(node_class, node_id, m, network,
+                         data_dir if v == 0 else os.path.join(data_dir, f"vnode-{v}"), **kwargs)
+             for v, node_id in enumerate(node_ids)]
+    network.set_local_node(nodes[0])
+    for node in nodes[1:]:
+        network.add_virtual_node(node)
+    return nodes
+
+
+def drain_timeout() -> float:
+    # keep below terminationGracePeriodSeconds so the pod is never killed mid hand-off
+    return float(os.getenv("CHORD_DRAIN_TIMEOUT", "20"))
+
+
+def start_http_endpoint(readiness: Readiness) -> HttpEndpoint:
+    endpoint = HttpEndpoint(int(os.getenv("CHORD_METRICS_PORT", "9100")))
+    endpoint.route('/ready', lambda: (200 if readiness.ready else 503, 'text/plain', f'{readiness.status()}\n'))
+    endpoint.start()
+    logger.info(f"Metrics and readiness served on port {endpoint.port}")
+    return endpoint
 
-    network = KubernetesNetwork(
+
+def launch_node(ordinal: int, m: int, readiness: Readiness, hash_node_ids: bool = False,
+                virtual_nodes: int = 1) -> tuple[list[Node], grpc.Server]:
+    logger.info(f"Launching pod {ordinal} with m={m} and {virtual_nodes} virtual node(s)")
+
+    network_class = KubernetesV2Network if os.getenv("CHORD_PROTOCOL_VERSION", "1") == "2" else KubernetesNetwork
+    network = network_class(
         namespace=os.getenv("POD_NAMESPACE", "chord-dht"),
         headless_service="chord-headless",
-        app_label="chord-node"
+        app_label="chord-node",
+        id_bits=m if hash_node_ids else None,
+        virtual_nodes=virtual_nodes
     )
-    node = Node(node_id, m, network)
-    network.set_local_node(node)
+    iterative_lookup = os.getenv("CHORD_LOOKUP_MODE", "recursive") == "iterative"
+    nodes = create_virtual_nodes(Node, ordinal, m, network, virtual_nodes, iterative_lookup=iterative_lookup)
+    node = nodes[0]
+    node_id = node.node_id
 
-    server_thread = threading.Thread(target=serve, args=(node, 50050), daemon=True)
-    server_thread.start()
+    server = start_server(node, 50050, nodes[1:])
+    readiness.advance(SERVING)
     logger.info(f"gRPC server started for node {node_id}")
 
-    logger.info(f"Node {node_id} discovering bootstrap nodes...")
-    bootstrap_id = network.discover_bootstrap()
-
-    if bootstrap_id:
-        logger.info(f"Node {node_id} joined with bootstrap {bootstrap_id}")
-    else:
-        logger.info(f"Node {node_id} joined without bootstrap")
+    # nodes that can pick up where the membership journal left off skip bootstrap discovery
+    joined = [virtual_node for virtual_node in nodes if virtual_node.resume()]
+    if len(joined) < len(nodes):
+        logger.info(f"Node {node_id} discovering bootstrap nodes...")
+        bootstrap_id = network.discover_bootstrap() if node not in joined else node_id
 
-    node.join(bootstrap_id)
+        if bootstrap_id:
+            logger.info(f"Node {node_id} joined with bootstrap {bootstrap_id}")
+        else:
+            logger.info(f"Node {node_id} joined without bootstrap")
+
+        joined += [virtual_node for virtual_node in nodes if virtual_node not in joined
+                   and virtual_node.join_ring(bootstrap_id if virtual_node is node else node_id)]
+        stranded = [virtual_node.node_id for virtual_node in nodes if virtual_node.successor in ("", None, "None")]
+        if stranded:
+            # exiting lets the pod restart and join again instead of serving outside the ring
+            raise RuntimeError(f"Nodes {stranded} could not join the ring through {bootstrap_id}")
+    readiness.advance(JOINED)
     logger.info(f"Node {node_id} joined the Chord ring")
 
-    node.start_background_tasks()
+    for virtual_node in nodes:
+        virtual_node.start_background_tasks()
     logger.info(f"Node {node_id} background tasks started")
 
-    return node
-
+    for virtual_node in joined:
+        virtual_node.pull_keys()
+    readiness.advance(SYNCED)
+    logger.info(f"Node {node_id} pulled the keys it owns")
 
-def signal_handler(signum, node, network):
-    logger.info(f"Received signal {signum}. Shutting down gracefully...")
+    return nodes, server
 
-    try:
-        node.leave()
-        logger.info("Node left the Chord ring")
 
-        network.cleanup()
-        logger.info("Network connections cleaned up")
+async def run_async_node(ordinal: int, m: int, hash_node_ids: bool = False, virtual_nodes: int = 1):
+    logger.info(f"Launching async pod {ordinal} with m={m} and {virtual_nodes} virtual node(s)")
 
-    except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+    network = AsyncKubernetesNetwork(
+        namespace=os.getenv("POD_NAMESPACE", "chord-dht"),
+        headless_service="chord-headless",
+        app_label="chord-node",
+        id_bits=m if hash_node_ids else None,
+        virtual_nodes=virtual_nodes
+    )
+    nodes = create_virtual_nodes(AsyncNode, ordinal, m, network, virtual_nodes)
+    node = nodes[0]
+
+    readiness = Readiness()
+    endpoint = start_http_endpoint(readiness)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    server = await start_async_server(node, 50050, nodes[1:])
+    readiness.advance(SERVING)
+    logger.info(f"Async gRPC server started for node {node.node_id}")
+
+    joined = [virtual_node for virtual_node in nodes if await virtual_node.resume()]
+    if len(joined) < len(nodes):
+        bootstrap_id = await network.discover_bootstrap() if node not in joined else node.node_id
+        joined += [virtual_node for virtual_node in nodes if virtual_node not in joined
+                   and await virtual_node.join_ring(bootstrap_id if virtual_node is node else node.node_id)]
+        stranded = [virtual_node.node_id for virtual_node in nodes if virtual_node.successor in ("", None, "None")]
+        if stranded:
+            raise RuntimeError(f"Nodes {stranded} could not join the ring through {bootstrap_id}")
+    readiness.advance(JOINED)
+    logger.info(f"Node {node.node_id} joined the Chord ring")
+
+    background = [virtual_node.start_background_tasks() for virtual_node in nodes]
+    for virtual_node in joined:
+        await virtual_node.pull_keys()
+    readiness.advance(SYNCED)
+
+    await stop.wait()
+    logger.info("Received stop signal. Shutting down gracefully...")
+    readiness.drain()
+    timeout = drain_timeout()
+    deadline = time.monotonic() + timeout
+    for task in background:
+        task.cancel()
+
+    async def leave_all():
+        for virtual_node in nodes:
+            try:
+                await virtual_node.leave()
+                logger.info(f"Node {virtual_node.node_id} left the Chord ring")
+            except Exception as e:
+                logger.error(f"Error during shutdown: {e}")
 
-    sys.exit(0)
+    try:
+        await asyncio.wait_for(leave_all(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Leaving the ring took longer than {timeout}s; stopping without finishing the hand-off")
+    await server.stop(grace=max(deadline - time.monotonic(), 1.0))
+    endpoint.stop()
+    await network.cleanup()
+    for virtual_node in nodes:
+        virtual_node.save_routing()
+        if virtual_node.repository is not None:
+            virtual_node.repository.close()
+        if virtual_node.journal is not None:
+            virtual_node.journal.close()
+
+
+def leave_ring(nodes: list[Node]):
+    for node in nodes:
+        try:
+            node.leave()
+            logger.info(f"Node {node.node_id} left the Chord ring")
+        except Exception as e:
+            logger.error(f"Error during shutdown: {e}")
+
+
+def shutdown(nodes: list[Node], server: grpc.Server, endpoint: HttpEndpoint, readiness: Readiness, timeout: float):
+    # stop advertising readiness first so no new traffic is routed here while keys are handed off
+    readiness.drain()
+    deadline = time.monotonic() + timeout
+    for node in nodes:
+        node.stop_background_tasks()
+
+    leaving = threading.Thread(target=leave_ring, args=(nodes,), name='leave-ring', daemon=True)
+    leaving.start()
+    leaving.join(timeout)
+    if leaving.is_alive():
+        logger.warning(f"Leaving the ring took longer than {timeout}s; stopping without finishing the hand-off")
+
+    server.stop(grace=max(deadline - time.monotonic(), 1.0)).wait()
+    nodes[0].network.cleanup()
+    logger.info("Network connections cleaned up")
+    endpoint.stop()
+    for node in nodes:
+        if node.repository is not None:
+            node.repository.close()
+        if node.journal is not None:
+            node.journal.close()
 
 
 def main():
-    m = 6
+    m = int(os.getenv("CHORD_ID_BITS", "6"))
+    if not (1 <= m <= MAX_ID_BITS):
+        logger.error(f"CHORD_ID_BITS must be between 1 and {MAX_ID_BITS}, got {m}")
+        sys.exit(1)
+    # filled from the chord.dht/virtual-nodes pod annotation through the downward API
+    virtual_nodes = max(int(os.getenv("CHORD_VIRTUAL_NODES") or "1"), 1)
+    hash_node_ids = os.getenv("CHORD_HASH_NODE_IDS", "0") == "1" or virtual_nodes > 1
+    if hash_node_ids and m < 32:
+        logger.warning(f"Hashed node ids in a {m}-bit ring are likely to collide; raise CHORD_ID_BITS")
 
     node_id = 0
 
@@ -103,29 +271,33 @@ def main():
         logger.error("No valid node ID found. Set POD_NAME environment variable or provide as argument.")
         sys.exit(1)
 
-    if not (0 <= node_id < 2 ** m):
+    # hashed ids place pods uniformly on the ring; the network maps them back to pod ordinals
+    if not hash_node_ids and not (0 <= node_id < 2 ** m):
         logger.error(f"Node ID {node_id} is out of range [0, {2 ** m - 1}]")
         sys.exit(1)
 
-    try:
-        node = launch_node(node_id, m)
-        network = node.network
-
-        signal.signal(signal.SIGTERM, lambda s, f: signal_handler(s, f, node, network))
-        signal.signal(signal.SIGINT, lambda s, f: signal_handler(s, f, node, network))
+    if os.getenv("CHORD_RUNTIME") == "async":
+        asyncio.run(run_async_node(node_id, m, hash_node_ids, virtual_nodes))
+        return
 
-        logger.info(f"Node {node_id} is running. Press Ctrl+C to stop.")
+    readiness = Readiness()
+    endpoint = start_http_endpoint(readiness)
+    # installed before joining so a pod stopped during a slow start still leaves cleanly
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda received, frame: stop.set())
 
-        while True:
-            continue
-
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt")
-        signal_handler(signal.SIGINT, None, node, network)
+    try:
+        nodes, server = launch_node(node_id, m, readiness, hash_node_ids, virtual_nodes)
     except Exception as e:
-        logger.error(f"Unexpected error in main loop: {e}")
+        logger.error(f"Unexpected error while starting: {e}")
         sys.exit(1)
 
+    logger.info(f"Node {node_id} is running. Press Ctrl+C to stop.")
+    stop.wait()
+    logger.info("Received stop signal. Shutting down gracefully...")
+    shutdown(nodes, server, endpoint, readiness, drain_timeout())
+
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,150 @@
+import json
+import logging
+import os
+import threading
+
+from persistence.key_index import SortedKeyIndex
+
 
 class FileRepository:
-    def __init__(self):
-        pass
+    """Append-only log plus compacted snapshot for a node's key store.
+
+    Every write is appended to the log; once the log holds compact_every records the
+    current state is written to a new snapshot and the log starts over. The sorted key
+    index is written next to each snapshot, stamped with the snapshot's generation, and
+    memory-mapped on load.
+
+    The repository owns the key/value dict: load() hands out the live dict rather than a
+    copy, and every change to it must go through put() and delete().
+    """
+
+    def __init__(self, directory: str, compact_every: int = 1000, fsync: bool = False, key_width: int = 20):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, 'snapshot.json')
+        self.log_path = os.path.join(directory, 'append.log')
+        self.index_path = os.path.join(directory, 'keys.idx')
+        self.index = SortedKeyIndex(key_width)
+        self.compact_every = compact_every
+        self.fsync = fsync
+
+        self.lock = threading.Lock()
+        self.data: dict[int, str] = {}
+        self.generation = 0
+        self.log_records = 0
+        self.log_file = None
+
+    def load(self) -> dict[int, str]:
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            self.data = self._read_snapshot()
+            self._load_index()
+            self.log_records = self._replay_log()
+            self.log_file = open(self.log_path, 'a', encoding='utf-8')
+            logging.info(f'[FileRepository] Loaded {len(self.data)} keys ({self.log_records} log records)')
+            return self.data
+
+    def put(self, key: int, value: str):
+        with self.lock:
+            self.data[key] = value
+            self.index.add(key)
+            self._append({'op': 'put', 'key': key, 'value': value})
+
+    def delete(self, key: int) -> str | None:
+        with self.lock:
+            value = self.data.pop(key, None)
+            if value is not None:
+                self.index.discard(key)
+                self._append({'op': 'delete', 'key': key})
+            return value
+
+    def copy(self) -> dict[int, str]:
+        with self.lock:
+            return dict(self.data)
+
+    def compact(self):
+        with self.lock:
+            self._compact()
+
+    def close(self):
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
+            self.index.close()
+
+    def _read_snapshot(self) -> dict[int, str]:
+        if not os.path.exists(self.snapshot_path):
+            return {}
+        with open(self.snapshot_path, encoding='utf-8') as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        if 'data' in snapshot:
+            self.generation = snapshot['generation']
+            snapshot = snapshot['data']
+        return {int(key): value for key, value in snapshot.items()}
+
+    def _load_index(self):
+        self.index.close()
+        self.index = SortedKeyIndex(self.index.key_width, self.index_path)
+        if self.index.generation != self.generation or len(self.index) != len(self.data):
+            # the index file is written after the snapshot, so a crash in between leaves it stale
+            if os.path.exists(self.index_path):
+                logging.warning(f'[FileRepository] Key index is stale (generation {self.index.generation}, '
+                                f'snapshot {self.generation}), rebuilding')
+            self.index.rebuild(self.data.keys(), self.index_path, self.generation)
+
+    def _replay_log(self) -> int:
+        if not os.path.exists(self.log_path):
+            return 0
+
+        records = 0
+        valid_bytes = 0
+        with open(self.log_path, 'rb') as log_file:
+            for line in log_file:
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                if record['op'] == 'put':
+                    self.data[record['key']] = record['value']
+                    self.index.add(record['key'])
+                else:
+                    self.data.pop(record['key'], None)
+                    self.index.discard(record['key'])
+                records += 1
+                valid_bytes += len(line)
+
+        if valid_bytes < os.path.getsize(self.log_path):
+            # a crash mid-append leaves a torn last record; drop it so new appends start on a clean line
+            logging.warning(f'[FileRepository] Truncating torn log tail at byte {valid_bytes}')
+            with open(self.log_path, 'r+b') as log_file:
+                log_file.truncate(valid_bytes)
+        return records
+
+    def _append(self, record: dict):
+        self.log_file.write(json.dumps(record) + '\n')
+        self.log_file.flush()
+        if self.fsync:
+            os.fsync(self.log_file.fileno())
+
+        self.log_records += 1
+        if self.log_records >= self.compact_every:
+            self._compact()
+
+    def _compact(self):
+        generation = self.generation + 1
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as snapshot_file:
+            json.dump({'generation': generation, 'data': {str(key): value for key, value in self.data.items()}},
+                      snapshot_file)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self.generation = generation
+        self.index.dump(self.index_path, generation)
+
+        if self.log_file is not None:
+            self.log_file.close()
+        self.log_file = open(self.log_path, 'w', encoding='utf-8')
+        self.log_records = 0
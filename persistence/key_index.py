@@ -0,0 +1,148 @@
+import bisect
+import heapq
+import mmap
+import os
+
+MAGIC = b'CHORDIDX'
+HEADER_SIZE = len(MAGIC) + 8
+
+
+class MappedKeys:
+    """Read-only sequence over a file of sorted, fixed-width, big-endian keys.
+
+    The keys follow a header holding the generation the file was written for; a file
+    without the header (an older index) has generation None.
+    """
+
+    def __init__(self, path: str | None, key_width: int):
+        self.key_width = key_width
+        self.buffer = None
+        self.length = 0
+        self.offset = 0
+        self.generation: int | None = None
+        if path is not None and os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as index_file:
+                self.buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.buffer[:len(MAGIC)] == MAGIC:
+                self.generation = int.from_bytes(self.buffer[len(MAGIC):HEADER_SIZE], 'big')
+                self.offset = HEADER_SIZE
+            self.length = (len(self.buffer) - self.offset) // key_width
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self.length:
+            raise IndexError(i)
+        offset = self.offset + i * self.key_width
+        return int.from_bytes(self.buffer[offset:offset + self.key_width], 'big')
+
+    def close(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+            self.length = 0
+
+
+class SortedKeyIndex:
+    """Sorted index of ring positions: a memory-mapped base file plus an in-memory overlay.
+
+    Lookups binary-search the mapped base directly, so range(start, end) costs
+    O(log n + k). dump() merges the overlay into a new base file.
+    """
+
+    def __init__(self, key_width: int = 20, path: str | None = None):
+        self.key_width = key_width
+        self.path = path
+        self.base = MappedKeys(path, key_width)
+        self.added: list[int] = []
+        self.removed: set[int] = set()
+
+    def __len__(self):
+        return len(self.base) - len(self.removed) + len(self.added)
+
+    def __contains__(self, key: int) -> bool:
+        if self._in_added(key):
+            return True
+        return key not in self.removed and self._in_base(key)
+
+    def __iter__(self):
+        return iter(self._slice(-1, None))
+
+    @property
+    def generation(self) -> int | None:
+        return self.base.generation
+
+    def add(self, key: int):
+        if key in self.removed:
+            self.removed.discard(key)
+            return
+        if self._in_base(key):
+            return
+        i = bisect.bisect_left(self.added, key)
+        if i == len(self.added) or self.added[i] != key:
+            self.added.insert(i, key)
+
+    def discard(self, key: int):
+        i = bisect.bisect_left(self.added, key)
+        if i < len(self.added) and self.added[i] == key:
+            del self.added[i]
+        elif self._in_base(key):
+            self.removed.add(key)
+
+    def range(self, start: int, end: int) -> list[int]:
+        """Keys in the ring interval (start, end], in ring order starting after start."""
+        if start < end:
+            return self._slice(start, end)
+        return self._slice(start, None) + self._slice(-1, end)
+
+    def dump(self, path: str | None = None, generation: int | None = None):
+        path = path or self.path
+        if generation is None:
+            generation = self.generation or 0
+        keys = list(self)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as index_file:
+            index_file.write(MAGIC + generation.to_bytes(8, 'big'))
+            for key in keys:
+                index_file.write(key.to_bytes(self.key_width, 'big'))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        os.replace(tmp_path, path)
+
+        self.base.close()
+        self.path = path
+        self.base = MappedKeys(path, self.key_width)
+        self.added = []
+        self.removed = set()
+
+    def rebuild(self, keys, path: str | None = None, generation: int | None = None):
+        self.base.close()
+        self.base = MappedKeys(None, self.key_width)
+        self.added = sorted(set(keys))
+        self.removed = set()
+        if path or self.path:
+            self.dump(path, generation)
+
+    def close(self):
+        self.base.close()
+
+    def _in_base(self, key: int) -> bool:
+        i = bisect.bisect_left(self.base, key)
+        return i < len(self.base) and self.base[i] == key
+
+    def _in_added(self, key: int) -> bool:
+        i = bisect.bisect_left(self.added, key)
+        return i < len(self.added) and self.added[i] == key
+
+    def _slice(self, low: int, high: int | None) -> list[int]:
+        # keys with low < key <= high (high=None means no upper bound)
+        base_lo = bisect.bisect_right(self.base, low)
+        base_hi = len(self.base) if high is None else bisect.bisect_right(self.base, high)
+        added_lo = bisect.bisect_right(self.added, low)
+        added_hi = len(self.added) if high is None else bisect.bisect_right(self.added, high)
+
+        base_keys = (self.base[i] for i in range(base_lo, base_hi))
+        if self.removed:
+            base_keys = (key for key in base_keys if key not in self.removed)
+        return list(heapq.merge(base_keys, self.added[added_lo:added_hi]))
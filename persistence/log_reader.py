@@ -0,0 +1,136 @@
+import logging
+import os
+
+DEFAULT_LOG_PATH = '/app/logs/app.log'
+
+
+def line_level(line: str) -> int | None:
+    # '%(asctime)s - %(name)s - %(levelname)s - %(message)s'; anything else continues the previous record
+    parts = line.split(' - ', 3)
+    if len(parts) < 4:
+        return None
+    level = logging.getLevelName(parts[2])
+    return level if isinstance(level, int) else None
+
+
+class LogPage:
+    def __init__(self, lines: list[tuple[int, int, str]], start: int, cursor: int):
+        self.entries = lines
+        self.start = start
+        self.cursor = cursor
+
+    @property
+    def lines(self) -> list[str]:
+        return [text for _, _, text in self.entries]
+
+
+class LogReader:
+    """Pages through a growing log file by byte offset.
+
+    tail() seeks backward from the end one block at a time, so its cost follows the
+    number of lines returned rather than the size of the file; read() continues
+    forward from a cursor handed out by an earlier page. A line still being written
+    (no trailing newline yet) is never returned.
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_PATH, block_size: int = 64 * 1024):
+        self.path = path
+        self.block_size = block_size
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def decode(raw: bytes) -> str:
+        return raw.decode('utf-8', errors='replace').rstrip('\r')
+
+    def line_boundary(self, file, offset: int) -> int:
+        """Largest line start at or before offset."""
+        position = offset
+        while position > 0:
+            step = min(self.block_size, position)
+            file.seek(position - step)
+            newline = file.read(step).rfind(b'\n')
+            if newline >= 0:
+                return position - step + newline + 1
+            position -= step
+        return 0
+
+    def tail(self, max_lines: int, min_level: int = 0, before: int | None = None) -> LogPage:
+        if not os.path.exists(self.path) or max_lines <= 0:
+            return LogPage([], 0, 0)
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            end = self.line_boundary(file, size if before is None else min(before, size))
+            newest_first: list[tuple[int, int, str]] = []
+            continuation: list[tuple[int, int, str]] = []
+
+            def take(start: int, raw: bytes):
+                entry = (start, start + len(raw) + 1, self.decode(raw))
+                level = line_level(entry[2])
+                if level is None:
+                    continuation.append(entry)
+                    return
+                if level >= min_level:
+                    newest_first.extend(continuation)
+                    newest_first.append(entry)
+                continuation.clear()
+
+            # every line in [0, end) is terminated by a newline; walk them from the newest
+            line_end = end - 1
+            position = line_end
+            carry = b''
+            while position > 0 and len(newest_first) < max_lines:
+                step = min(self.block_size, position)
+                position -= step
+                file.seek(position)
+                parts = (file.read(step) + carry).split(b'\n')
+                carry = parts[0]
+                for raw in reversed(parts[1:]):
+                    start = line_end - len(raw)
+                    take(start, raw)
+                    line_end = start - 1
+            if position == 0 and line_end >= 0 and len(newest_first) < max_lines:
+                take(0, carry)
+            if min_level <= 0:
+                # lines left without a header are only kept when nothing is filtered out
+                newest_first.extend(continuation)
+
+        entries = list(reversed(newest_first[:max_lines]))
+        return LogPage(entries, entries[0][0] if entries else end, end)
+
+    def read(self, cursor: int, max_lines: int, min_level: int = 0) -> LogPage:
+        if not os.path.exists(self.path) or max_lines <= 0:
+            return LogPage([], cursor, cursor)
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if cursor > size:
+                # the file was rotated or truncated underneath the reader
+                cursor = 0
+            if cursor > 0:
+                file.seek(cursor - 1)
+                if file.read(1) != b'\n':
+                    file.readline()
+                    cursor = file.tell()
+            file.seek(cursor)
+
+            entries: list[tuple[int, int, str]] = []
+            offset = cursor
+            keep = min_level <= 0
+            for raw in file:
+                if not raw.endswith(b'\n'):
+                    break
+                text = self.decode(raw[:-1])
+                level = line_level(text)
+                if level is not None:
+                    keep = level >= min_level
+                if keep:
+                    entries.append((offset, offset + len(raw), text))
+                offset += len(raw)
+                if len(entries) >= max_lines:
+                    break
+
+        return LogPage(entries, entries[0][0] if entries else cursor, offset)
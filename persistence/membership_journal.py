@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import threading
+import zlib
+
+
+class MembershipJournal:
+    """Append-only journal of a node's last known place in the ring.
+
+    Each record is one full routing snapshot on its own line, prefixed with the CRC32 of
+    its JSON so a torn or corrupted tail is recognised and dropped on load. Only the
+    newest record matters, so once compact_every records pile up the file is rewritten
+    with just that one.
+    """
+
+    def __init__(self, directory: str, compact_every: int = 256, fsync: bool = False):
+        self.directory = directory
+        self.path = os.path.join(directory, 'membership.journal')
+        self.compact_every = compact_every
+        self.fsync = fsync
+
+        self.lock = threading.Lock()
+        self.records = 0
+        self.last_line: str | None = None
+        self.journal_file = None
+
+    @staticmethod
+    def encode(state: dict) -> str:
+        payload = json.dumps(state, sort_keys=True, separators=(',', ':'))
+        return f'{zlib.crc32(payload.encode()):08x} {payload}\n'
+
+    @staticmethod
+    def decode(line: bytes) -> dict | None:
+        if not line.endswith(b'\n'):
+            return None
+        checksum, _, payload = line[:-1].partition(b' ')
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    def load(self) -> dict | None:
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            state = None
+            valid_bytes = 0
+            self.records = 0
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as journal_file:
+                    for line in journal_file:
+                        record = self.decode(line)
+                        if record is None:
+                            break
+                        state = record
+                        self.last_line = line.decode()
+                        self.records += 1
+                        valid_bytes += len(line)
+                if valid_bytes < os.path.getsize(self.path):
+                    logging.warning(f'[MembershipJournal] Dropping corrupt journal tail at byte {valid_bytes}')
+                    with open(self.path, 'r+b') as journal_file:
+                        journal_file.truncate(valid_bytes)
+            return state
+
+    def append(self, state: dict) -> bool:
+        line = self.encode(state)
+        with self.lock:
+            if line == self.last_line:
+                return False
+            if self.journal_file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self.journal_file = open(self.path, 'a', encoding='utf-8')
+            self.journal_file.write(line)
+            self.journal_file.flush()
+            if self.fsync:
+                os.fsync(self.journal_file.fileno())
+            self.last_line = line
+            self.records += 1
+            if self.records >= self.compact_every:
+                self._compact()
+            return True
+
+    def close(self):
+        with self.lock:
+            if self.journal_file is not None:
+                self.journal_file.close()
+                self.journal_file = None
+
+    def _compact(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(self.last_line)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, self.path)
+
+        self.journal_file.close()
+        self.journal_file = open(self.path, 'a', encoding='utf-8')
+        self.records = 1
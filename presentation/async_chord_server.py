@@ -0,0 +1,204 @@
+import asyncio
+
+import grpc
+
+from business.async_node import AsyncNode
+from . import chord_pb2_grpc
+from . import chord_pb2
+from presentation.chord_pb2_grpc import ChordServicer
+from presentation.channel_pool import SERVER_KEEPALIVE_OPTIONS
+from presentation.instrumentation import AsyncServerMetricsInterceptor, RpcMetrics, node_stats_response
+from presentation.log_stream import FOLLOW_INTERVAL, LogStream
+from presentation.node_router import NodeRouter
+
+
+class AsyncChordServer(ChordServicer, NodeRouter):
+
+    def __init__(self, node: AsyncNode, virtual_nodes: list[AsyncNode] | None = None):
+        NodeRouter.__init__(self, node, virtual_nodes)
+
+    async def FindSuccessor(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        successor = await node.find_successor(int(request.key), coalesce=False)
+        return chord_pb2.FindSuccessorResponse(successor_id=str(successor))
+
+    async def FindNextHop(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        next_hop, done = node.find_next_hop(int(request.key))
+        return chord_pb2.FindNextHopResponse(next_hop_id=str(next_hop), done=done)
+
+    async def FindPredecessor(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        routing = node.routing
+        predecessor = routing.predecessor
+        if predecessor is None:
+            predecessor = node.node_id
+        return chord_pb2.FindPredecessorResponse(predecessor_id=str(predecessor),
+                                                 successor_list=[str(n) for n in routing.successor_list])
+
+    async def GetRoutingState(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        routing = node.routing
+        return chord_pb2.GetRoutingStateResponse(node_id=str(node.node_id), predecessor_id=str(routing.predecessor),
+                                                 successor_list=[str(n) for n in routing.successor_list],
+                                                 finger_table=[str(n) for n in routing.finger_table])
+
+    async def SetSuccessor(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.set_successor(int(request.new_successor_id))
+        return chord_pb2.SetSuccessorResponse()
+
+    async def SetPredecessor(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.set_predecessor(int(request.new_predecessor_id))
+        return chord_pb2.SetPredecessorResponse()
+
+    async def Notify(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.notify(int(request.sender_id))
+        return chord_pb2.NotifyResponse(successor_list=[str(n) for n in node.successor_list])
+
+    async def UpdateFingerTable(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        await node.update_finger_table(int(request.new_node_id), int(request.index))
+        return chord_pb2.UpdateFingerTableResponse()
+
+    async def FingerHint(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.finger_hint(int(request.new_node_id), request.hops)
+        return chord_pb2.FingerHintResponse()
+
+    async def FixFingers(self, request, context):
+        await self.node.fix_fingers()
+        return chord_pb2.FixFingersResponse()
+
+    async def Stabilize(self, request, context):
+        await self.node.stabilize()
+        return chord_pb2.StabilizeResponse()
+
+    async def GetInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        info = node.node_has_info(int(request.key))
+        return chord_pb2.GetInfoResponse(information=info if info is not None else "None")
+
+    async def AddInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        if not await node.store_information(int(request.info_key), request.info):
+            await context.abort(grpc.StatusCode.ABORTED, f"Write quorum not reached for key {request.info_key}")
+        return chord_pb2.AddInfoResponse()
+
+    async def RemoveInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        await node.remove_info(int(request.info_key))
+        return chord_pb2.RemoveInfoResponse()
+
+    async def AddRedundantInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.add_redundant_info(int(request.info_key), request.info)
+        return chord_pb2.AddInfoResponse()
+
+    async def AddRedundantMany(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.add_redundant_many({int(line.info_key): line.info_val for line in request.info_line})
+        return chord_pb2.AddInfoResponse()
+
+    async def RemoveRedundantInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node.remove_redundant_info(int(request.info_key))
+        return chord_pb2.RemoveInfoResponse()
+
+    async def GetMany(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        info = node.get_local_information(int(key) for key in request.keys)
+        info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=v) for k, v in info.items()]
+        return chord_pb2.GetManyResponse(info_line=info_lines)
+
+    async def PutMany(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        created = node.add_many_information({int(line.info_key): line.info_val for line in request.info_line})
+        return chord_pb2.PutManyResponse(created_keys=[str(key) for key in created])
+
+    async def DeleteMany(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        removed = node.remove_many_information(int(key) for key in request.keys)
+        return chord_pb2.DeleteManyResponse(removed_keys=[str(key) for key in removed])
+
+    async def Handoff(self, request_iterator, context):
+        received = 0
+        cursor = None
+        async for request in request_iterator:
+            chunk = {int(line.info_key): line.info_val for line in request.info_line}
+            node = await self.route_async(request.target_id, context)
+            cursor = node.receive_handoff(request.session_id, chunk)
+            received += len(chunk)
+        return chord_pb2.HandoffResponse(cursor=str(cursor) if cursor is not None else "", received=received)
+
+    async def GetHandoffCursor(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        cursor = node.get_handoff_cursor(request.session_id)
+        return chord_pb2.HandoffCursorResponse(cursor=str(cursor) if cursor is not None else "")
+
+    async def RequestHandoff(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        accepted = node.serve_handoff(int(request.requester_id), int(request.start), int(request.end))
+        return chord_pb2.RequestHandoffResponse(completed=accepted)
+
+    async def GetNodeInformation(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        node_info = node.get_node_info()
+
+        finger_table = [
+            chord_pb2.FingerEntry(index=str(k), finger_val=str(v))
+            for k, v in node_info["finger_table"].items()
+        ]
+
+        return chord_pb2.GetNodeInfoResponse(node_id=str(node.node_id),
+                                             successor=str(node_info["successor"]),
+                                             predecessor=str(node_info["predecessor"]),
+                                             finger_table=finger_table,
+                                             successor_list=[str(n) for n in node_info["successor_list"]])
+
+    async def GetNodeStats(self, request, context):
+        return node_stats_response(await self.route_async(request.target_id, context))
+
+    async def GetLogs(self, request, context):
+        logs = await asyncio.to_thread(self.node.get_logs, request.max_lines or 1000)
+
+        return chord_pb2.LogsResponse(log_line=logs)
+
+    async def StreamLogs(self, request, context):
+        try:
+            stream = LogStream(self.node.log_reader, request)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        for chunk in await asyncio.to_thread(stream.first):
+            yield chunk
+        while stream.follow and not context.done():
+            await asyncio.sleep(FOLLOW_INTERVAL)
+            for chunk in await asyncio.to_thread(stream.poll):
+                yield chunk
+
+    async def GetAllNodeInfo(self, request, context):
+        node = await self.route_async(request.target_id, context)
+        info = node.get_all_node_info()
+
+        info_lines = [
+            chord_pb2.InfoLine(info_key=str(k), info_val=str(v))
+            for k, v in info.items()
+        ]
+        return chord_pb2.GetAllInfoResponse(info_line=info_lines)
+
+
+async def start_async_server(node: AsyncNode, port, virtual_nodes: list[AsyncNode] | None = None) -> grpc.aio.Server:
+    server = grpc.aio.server(interceptors=[AsyncServerMetricsInterceptor(RpcMetrics('server', node.metrics))],
+                             options=SERVER_KEEPALIVE_OPTIONS)
+    chord_pb2_grpc.add_ChordServicer_to_server(AsyncChordServer(node, virtual_nodes), server)
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    print(f'Node {node.node_id} async gRPC Server running on port {port}')
+    return server
+
+
+async def serve_async(node: AsyncNode, port):
+    server = await start_async_server(node, port)
+    await server.wait_for_termination()
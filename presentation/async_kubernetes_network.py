@@ -0,0 +1,264 @@
+import asyncio
+import logging
+from collections.abc import Iterable
+
+import grpc
+
+from business.async_node_network_interface import AsyncNodeNetworkInterface
+from business.node_network_interface import UNSUPPORTED, Unsupported
+from business.routing_state import RoutingState
+from presentation import chord_pb2
+from presentation.channel_pool import AsyncChannelPool
+from presentation.kubernetes_network import KubernetesNetwork
+from presentation.instrumentation import AsyncClientMetricsInterceptor
+from presentation.latency import AsyncLatencyInterceptor
+
+
+class AsyncKubernetesNetwork(KubernetesNetwork, AsyncNodeNetworkInterface):
+    """grpc.aio client for the same StatefulSet layout as KubernetesNetwork.
+
+    Pod discovery and address resolution are shared with the blocking client; every
+    RPC is a coroutine so one event loop can keep thousands of calls in flight.
+    """
+
+    def _create_pool(self) -> AsyncChannelPool:
+        return AsyncChannelPool(self._resolve_address,
+                                lambda node_id: [AsyncClientMetricsInterceptor(self.rpc_metrics),
+                                                 AsyncLatencyInterceptor(node_id, self.latency)])
+
+    async def discover_bootstrap(self):
+        candidates = await asyncio.to_thread(self.discover_all_nodes)
+        for node_id in candidates:
+            if node_id in self.local_nodes:
+                continue
+            try:
+                stub = self._get_stub(node_id)
+                await stub.FindPredecessor(chord_pb2.FindPredecessorRequest(target_id=str(node_id)), timeout=2)
+                self.address_map[node_id] = self._resolve_address(node_id)
+                logging.info(f"Discovered bootstrap node: {node_id}")
+                return node_id
+            except grpc.RpcError as rpc_error:
+                logging.debug(f"Node {node_id} not responsive: {rpc_error}")
+                continue
+
+        logging.info("No responsive bootstrap nodes found. Starting as initial node.")
+        return None
+
+    async def find_successor(self, target_id: int, key: int) -> int | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindSuccessorRequest(target_id=str(target_id), key=str(key))
+            res = await stub.FindSuccessor(req, timeout=2)
+            if res.successor_id == "None" or not res.successor_id:
+                return None
+            return int(res.successor_id)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindNextHopRequest(target_id=str(target_id), key=str(key))
+            res = await stub.FindNextHop(req, timeout=2)
+            return int(res.next_hop_id), res.done
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def get_predecessor(self, target_id: int) -> int | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindPredecessorRequest(target_id=str(target_id))
+            res = await stub.FindPredecessor(req, timeout=2)
+            if res.predecessor_id == "None":
+                return None
+            return int(res.predecessor_id)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindPredecessorRequest(target_id=str(target_id))
+            res = await stub.FindPredecessor(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            return predecessor, [int(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def get_routing_state(self, target_id: int) -> RoutingState | Unsupported | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.GetRoutingStateRequest(target_id=str(target_id))
+            res = await stub.GetRoutingState(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            successors = [int(node_id) for node_id in res.successor_list]
+            return RoutingState(successors[0] if successors else None, predecessor, successors,
+                                [None if node_id == "None" else int(node_id) for node_id in res.finger_table])
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return UNSUPPORTED
+            self.handle_dead_node(target_id)
+            return None
+
+    async def set_predecessor(self, target_id: int, new_predecessor_id: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.SetPredecessorRequest(target_id=str(target_id), new_predecessor_id=str(new_predecessor_id))
+            await stub.SetPredecessor(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def set_successor(self, target_id: int, successor_id: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.SetSuccessorRequest(target_id=str(target_id), new_successor_id=str(successor_id))
+            await stub.SetSuccessor(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def notify(self, target_id: int, sender_id: int) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.NotifyRequest(target_id=str(target_id), sender_id=str(sender_id))
+            res = await stub.Notify(req, timeout=2)
+            return [int(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def update_finger_table(self, target_id: int, new_node_id: int, index: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.UpdateFingerTableRequest(target_id=str(target_id), new_node_id=str(new_node_id),
+                                                     index=str(index))
+            await stub.UpdateFingerTable(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def finger_hint(self, target_id: int, new_node_id: int, hops: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FingerHintRequest(target_id=str(target_id), new_node_id=str(new_node_id), hops=hops)
+            await stub.FingerHint(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    async def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.GetInfoRequest(target_id=str(target_node_id), key=str(info_key))
+            res = await stub.GetInformation(req, timeout=2)
+            return res.information
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.AddInfoRequest(target_id=str(target_node_id), info_key=str(info_key), info=str(info))
+            await stub.AddInformation(req, timeout=2)
+            return True
+        except grpc.RpcError as e:
+            # ABORTED means the owner stored the key but missed its write quorum; it is alive
+            if e.code() != grpc.StatusCode.ABORTED:
+                self.handle_dead_node(target_node_id)
+            return False
+
+    async def remove_information(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RemoveInfoRequest(target_id=str(target_node_id), info_key=str(info_key))
+            await stub.RemoveInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool:
+        async def requests():
+            for chunk in chunks:
+                yield chord_pb2.HandoffChunk(target_id=str(target_node_id), session_id=session_id,
+                                             info_line=[chord_pb2.InfoLine(info_key=str(k), info_val=v)
+                                                        for k, v in chunk.items()])
+
+        try:
+            stub = self._get_stub(target_node_id)
+            await stub.Handoff(requests(), timeout=60)
+            return True
+        except grpc.RpcError as e:
+            logging.warning(f"[hand_off] stream to {target_node_id} interrupted: {e.code()}")
+            return False
+
+    async def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.HandoffCursorRequest(target_id=str(target_node_id), session_id=session_id)
+            res = await stub.GetHandoffCursor(req, timeout=2)
+            return int(res.cursor) if res.cursor else None
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RequestHandoffRequest(target_id=str(target_node_id), requester_id=str(requester_id),
+                                                  start=str(start), end=str(end))
+            return (await stub.RequestHandoff(req, timeout=2)).completed
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+            return False
+
+    async def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.AddInfoRequest(target_id=str(target_node_id), info_key=str(info_key), info=str(info))
+            await stub.AddRedundantInformation(req, timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            await stub.AddRedundantMany(chord_pb2.PutManyRequest(target_id=str(target_node_id), info_line=info_lines),
+                                        timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def remove_redundant_info(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RemoveInfoRequest(target_id=str(target_node_id), info_key=str(info_key))
+            await stub.RemoveRedundantInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.GetManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = await stub.GetMany(req, timeout=2)
+            return {int(line.info_key): line.info_val for line in res.info_line}
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            req = chord_pb2.PutManyRequest(target_id=str(target_node_id), info_line=info_lines)
+            res = await stub.PutMany(req, timeout=2)
+            return [int(key) for key in res.created_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.DeleteManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = await stub.DeleteMany(req, timeout=2)
+            return [int(key) for key in res.removed_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    async def cleanup(self):
+        await self.pool.close()
@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable
+
+import grpc
+
+from presentation.chord_pb2_grpc import ChordStub
+
+KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# servers must accept the client pings above, otherwise they answer with GOAWAY(too_many_pings)
+SERVER_KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 5000),
+    ("grpc.http2.max_ping_strikes", 0),
+]
+
+FAILURE_CODES = {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+
+
+class PeerUnavailable(grpc.RpcError):
+    """Raised without touching the network while a peer's circuit is open."""
+
+    def __init__(self, node_id: int, retry_in: float):
+        super().__init__(f"circuit open for node {node_id}, retry in {retry_in:.2f}s")
+        self.node_id = node_id
+        self.retry_in = retry_in
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return str(self)
+
+
+class CircuitBreaker:
+    """Opens after consecutive transport failures and lets one probe through per backoff window.
+
+    A failed probe doubles the window up to max_backoff; any success closes the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 3, base_backoff: float = 1.0, max_backoff: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.backoff = base_backoff
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def retry_in(self, now: float | None = None) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + self.backoff - (now or time.monotonic()), 0.0)
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or self.retry_in() > 0:
+                return False
+            self.probing = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+            self.backoff = self.base_backoff
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.probing:
+                self.probing = False
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+                self.opened_at = time.monotonic()
+            elif self.opened_at is None and self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class BreakerInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.StreamUnaryClientInterceptor):
+    def __init__(self, node_id: int, breaker: CircuitBreaker):
+        self.node_id = node_id
+        self.breaker = breaker
+
+    def _guard(self, continuation, client_call_details, request):
+        if not self.breaker.allow():
+            raise PeerUnavailable(self.node_id, self.breaker.retry_in())
+        outcome = continuation(client_call_details, request)
+        error = outcome.exception() if outcome.done() else None
+        if isinstance(error, grpc.RpcError) and error.code() in FAILURE_CODES:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return outcome
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._guard(continuation, client_call_details, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return self._guard(continuation, client_call_details, request_iterator)
+
+
+class AsyncBreakerInterceptor(grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.StreamUnaryClientInterceptor):
+    """Records call outcomes on the breaker; AsyncChannelPool.stub refuses calls while it is open."""
+
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+
+    async def _record(self, call):
+        if await call.code() in FAILURE_CODES:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return call
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await self._record(await continuation(client_call_details, request))
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return await self._record(await continuation(client_call_details, request_iterator))
+
+
+class PooledChannel:
+    def __init__(self, raw: grpc.Channel, channel: grpc.Channel):
+        self.raw = raw
+        self.channel = channel
+        self.stubs = {}
+        self.last_used = time.monotonic()
+
+
+class ChannelPool:
+    """Thread-safe per-peer channels with keepalive, circuit breaking and idle eviction.
+
+    Breakers outlive the channels they guard, so a peer evicted while its circuit is
+    open still fails fast on the next call instead of paying a connect timeout.
+    """
+
+    def __init__(self, resolve: Callable[[int], str], interceptors: Callable[[int], list] | None = None,
+                 idle_timeout: float = 300.0, connect_timeout: float = 1.0, failure_threshold: int = 3,
+                 max_backoff: float = 30.0, options: list[tuple[str, int]] | None = None):
+        self.resolve = resolve
+        self.interceptors = interceptors or (lambda node_id: [])
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.failure_threshold = failure_threshold
+        self.max_backoff = max_backoff
+        self.options = KEEPALIVE_OPTIONS if options is None else options
+        self.entries: dict[int, PooledChannel] = {}
+        self.breakers: dict[int, CircuitBreaker] = {}
+        self.lock = threading.Lock()
+
+    def breaker(self, node_id: int) -> CircuitBreaker:
+        with self.lock:
+            return self._breaker(node_id)
+
+    def _breaker(self, node_id: int) -> CircuitBreaker:
+        if node_id not in self.breakers:
+            self.breakers[node_id] = CircuitBreaker(self.failure_threshold, max_backoff=self.max_backoff)
+        return self.breakers[node_id]
+
+    def _open(self, node_id: int) -> PooledChannel:
+        raw = grpc.insecure_channel(self.resolve(node_id), options=self.options)
+        channel = grpc.intercept_channel(raw, BreakerInterceptor(node_id, self.breaker(node_id)),
+                                         *self.interceptors(node_id))
+        return PooledChannel(raw, channel)
+
+    def _close(self, entry: PooledChannel):
+        entry.raw.close()
+
+    def _entry(self, node_id: int) -> PooledChannel:
+        with self.lock:
+            entry = self.entries.get(node_id)
+            if entry is not None:
+                entry.last_used = time.monotonic()
+                return entry
+        # resolving an address may block on DNS or service discovery, so no other peer waits on it
+        opened = self._open(node_id)
+        with self.lock:
+            entry = self.entries.setdefault(node_id, opened)
+            entry.last_used = time.monotonic()
+        if entry is not opened:
+            self._close(opened)
+        return entry
+
+    def channel(self, node_id: int) -> grpc.Channel:
+        return self._entry(node_id).channel
+
+    def stub(self, node_id: int, stub_class=ChordStub):
+        entry = self._entry(node_id)
+        with self.lock:
+            if stub_class not in entry.stubs:
+                entry.stubs[stub_class] = stub_class(entry.channel)
+            return entry.stubs[stub_class]
+
+    def is_open(self, node_id: int) -> bool:
+        breaker = self.breakers.get(node_id)
+        return breaker is not None and breaker.is_open
+
+    def discard(self, node_id: int):
+        with self.lock:
+            entry = self.entries.pop(node_id, None)
+        if entry is not None:
+            self._close(entry)
+
+    def evict_idle(self) -> list[int]:
+        now = time.monotonic()
+        with self.lock:
+            idle = [node_id for node_id, entry in self.entries.items() if now - entry.last_used > self.idle_timeout]
+            for node_id in idle:
+                if not self._breaker(node_id).is_open:
+                    self.breakers.pop(node_id, None)
+        for node_id in idle:
+            self.discard(node_id)
+        return idle
+
+    def reconnect(self, node_id: int) -> bool:
+        breaker = self.breaker(node_id)
+        if not breaker.allow():
+            return False
+        entry = self._open(node_id)
+        try:
+            grpc.channel_ready_future(entry.raw).result(timeout=self.connect_timeout)
+        except grpc.FutureTimeoutError:
+            entry.raw.close()
+            breaker.record_failure()
+            logging.debug(f"Reconnect to node {node_id} failed, next attempt in {breaker.retry_in():.1f}s")
+            return False
+        self._replace(node_id, entry)
+        breaker.record_success()
+        logging.info(f"Reconnected to node {node_id}")
+        return True
+
+    def _replace(self, node_id: int, entry: PooledChannel):
+        with self.lock:
+            previous = self.entries.get(node_id)
+            self.entries[node_id] = entry
+        if previous is not None:
+            self._close(previous)
+
+    def _due_probes(self) -> list[int]:
+        with self.lock:
+            return [node_id for node_id, breaker in self.breakers.items() if breaker.is_open]
+
+    def maintain(self) -> bool:
+        """Evicts idle channels and probes open circuits whose backoff has elapsed.
+
+        Reports a change while any circuit is still open so the scheduler keeps probing.
+        """
+        changed = bool(self.evict_idle())
+        pending = self._due_probes()
+        for node_id in pending:
+            if self.breakers[node_id].retry_in() == 0:
+                changed = self.reconnect(node_id) or changed
+        return changed or any(self.is_open(node_id) for node_id in pending)
+
+    def _drain(self) -> list[PooledChannel]:
+        with self.lock:
+            entries = list(self.entries.values())
+            self.entries.clear()
+        return entries
+
+    def close(self):
+        for entry in self._drain():
+            try:
+                entry.raw.close()
+            except Exception as e:
+                logging.error(f"Error closing gRPC channel: {e}")
+
+
+class AsyncChannelPool(ChannelPool):
+    """ChannelPool of grpc.aio channels, for use from a single event loop.
+
+    An open circuit makes stub() raise PeerUnavailable before any call is made; probing
+    and closing channels are coroutines.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.closing: set[asyncio.Task] = set()
+
+    def _open(self, node_id: int) -> PooledChannel:
+        raw = grpc.aio.insecure_channel(self.resolve(node_id), options=self.options,
+                                        interceptors=[AsyncBreakerInterceptor(self.breaker(node_id)),
+                                                      *self.interceptors(node_id)])
+        return PooledChannel(raw, raw)
+
+    def _close(self, entry: PooledChannel):
+        task = asyncio.get_running_loop().create_task(entry.raw.close())
+        self.closing.add(task)
+        task.add_done_callback(self.closing.discard)
+
+    def stub(self, node_id: int, stub_class=ChordStub):
+        breaker = self.breaker(node_id)
+        if not breaker.allow():
+            raise PeerUnavailable(node_id, breaker.retry_in())
+        return super().stub(node_id, stub_class)
+
+    async def reconnect(self, node_id: int) -> bool:
+        breaker = self.breaker(node_id)
+        if not breaker.allow():
+            return False
+        entry = self._open(node_id)
+        try:
+            await asyncio.wait_for(entry.raw.channel_ready(), self.connect_timeout)
+        except asyncio.TimeoutError:
+            await entry.raw.close()
+            breaker.record_failure()
+            logging.debug(f"Reconnect to node {node_id} failed, next attempt in {breaker.retry_in():.1f}s")
+            return False
+        self._replace(node_id, entry)
+        breaker.record_success()
+        logging.info(f"Reconnected to node {node_id}")
+        return True
+
+    async def maintain(self) -> bool:
+        changed = bool(self.evict_idle())
+        pending = self._due_probes()
+        for node_id in pending:
+            if self.breakers[node_id].retry_in() == 0:
+                changed = await self.reconnect(node_id) or changed
+        return changed or any(self.is_open(node_id) for node_id in pending)
+
+    async def close(self):
+        for entry in self._drain():
+            try:
+                await entry.raw.close()
+            except Exception as e:
+                logging.error(f"Error closing gRPC channel: {e}")
@@ -24,81 +24,131 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63hord.proto\x12\x05\x63hord\"\r\n\x0bLogsRequest\" \n\x0cLogsResponse\x12\x10\n\x08log_line\x18\x01 \x03(\t\"\'\n\x12GetNodeInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"x\n\x13GetNodeInfoResponse\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x11\n\tsuccessor\x18\x02 \x01(\t\x12\x13\n\x0bpredecessor\x18\x03 \x01(\t\x12(\n\x0c\x66inger_table\x18\x04 \x03(\x0b\x32\x12.chord.FingerEntry\"0\n\x0b\x46ingerEntry\x12\r\n\x05index\x18\x01 \x01(\t\x12\x12\n\nfinger_val\x18\x02 \x01(\t\"(\n\x13GetNodeStatsRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"`\n\x14GetNodeStatsResponse\x12\r\n\x05\x66ixes\x18\x01 \x01(\t\x12\x15\n\rstabilization\x18\x02 \x01(\t\x12\x0f\n\x07lookups\x18\x03 \x01(\t\x12\x11\n\tjoin_time\x18\x04 \x01(\t\"6\n\x14\x46indSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\"-\n\x15\x46indSuccessorResponse\x12\x14\n\x0csuccessor_id\x18\x01 \x01(\t\"+\n\x16\x46indPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"1\n\x17\x46indPredecessorResponse\x12\x16\n\x0epredecessor_id\x18\x01 \x01(\t\"B\n\x13SetSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x18\n\x10new_successor_id\x18\x02 \x01(\t\"\x16\n\x14SetSuccessorResponse\"F\n\x15SetPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x1a\n\x12new_predecessor_id\x18\x02 \x01(\t\"\x18\n\x16SetPredecessorResponse\"\'\n\x19NodeHasInformationRequest\x12\n\n\x02id\x18\x01 \x01(\t\"1\n\x1aNodeHasInformationResponse\x12\x13\n\x0binformation\x18\x02 \x01(\t\"5\n\rNotifyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x11\n\tsender_id\x18\x02 \x01(\t\"Q\n\x18UpdateFingerTableRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x13\n\x0bnew_node_id\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\t\"\x1b\n\x19UpdateFingerTableResponse\"\x10\n\x0eNotifyResponse\"0\n\x0eGetInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\"&\n\x0fGetInfoResponse\x12\x13\n\x0binformation\x18\x01 \x01(\t\"\x13\n\x11GetAllInfoRequest\"8\n\x12GetAllInfoResponse\x12\"\n\tinfo_line\x18\x01 \x03(\x0b\x32\x0f.chord.InfoLine\".\n\x08InfoLine\x12\x10\n\x08info_key\x18\x01 \x01(\t\x12\x10\n\x08info_val\x18\x02 \x01(\t\"0\n\x0e\x41\x64\x64InfoRequest\x12\x10\n\x08info_key\x18\x01 \x01(\t\x12\x0c\n\x04info\x18\x02 \x01(\t\"\x11\n\x0f\x41\x64\x64InfoResponse\"\x13\n\x11\x46ixFingersRequest\"\x14\n\x12\x46ixFingersResponse\"\x12\n\x10StabilizeRequest\"\x13\n\x11StabilizeResponse\"8\n\x11RemoveInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x10\n\x08info_key\x18\x02 \x01(\t\"\x14\n\x12RemoveInfoResponse2\x87\t\n\x05\x43hord\x12J\n\rFindSuccessor\x12\x1b.chord.FindSuccessorRequest\x1a\x1c.chord.FindSuccessorResponse\x12P\n\x0f\x46indPredecessor\x12\x1d.chord.FindPredecessorRequest\x1a\x1e.chord.FindPredecessorResponse\x12G\n\x0cSetSuccessor\x12\x1a.chord.SetSuccessorRequest\x1a\x1b.chord.SetSuccessorResponse\x12M\n\x0eSetPredecessor\x12\x1c.chord.SetPredecessorRequest\x1a\x1d.chord.SetPredecessorResponse\x12\x35\n\x06Notify\x12\x14.chord.NotifyRequest\x1a\x15.chord.NotifyResponse\x12V\n\x11UpdateFingerTable\x12\x1f.chord.UpdateFingerTableRequest\x1a .chord.UpdateFingerTableResponse\x12\x41\n\nFixFingers\x12\x18.chord.FixFingersRequest\x1a\x19.chord.FixFingersResponse\x12>\n\tStabilize\x12\x17.chord.StabilizeRequest\x1a\x18.chord.StabilizeResponse\x12?\n\x0eGetInformation\x12\x15.chord.GetInfoRequest\x1a\x16.chord.GetInfoResponse\x12Y\n\x12NodeHasInformation\x12 .chord.NodeHasInformationRequest\x1a!.chord.NodeHasInformationResponse\x12?\n\x0e\x41\x64\x64Information\x12\x15.chord.AddInfoRequest\x1a\x16.chord.AddInfoResponse\x12H\n\x11RemoveInformation\x12\x18.chord.RemoveInfoRequest\x1a\x19.chord.RemoveInfoResponse\x12K\n\x12GetNodeInformation\x12\x19.chord.GetNodeInfoRequest\x1a\x1a.chord.GetNodeInfoResponse\x12\x45\n\x0eGetAllNodeInfo\x12\x18.chord.GetAllInfoRequest\x1a\x19.chord.GetAllInfoResponse\x12G\n\x0cGetNodeStats\x12\x1a.chord.GetNodeStatsRequest\x1a\x1b.chord.GetNodeStatsResponse\x12\x32\n\x07GetLogs\x12\x12.chord.LogsRequest\x1a\x13.chord.LogsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x63hord.proto\x12\x05\x63hord\" \n\x0bLogsRequest\x12\x11\n\tmax_lines\x18\x01 \x01(\r\" \n\x0cLogsResponse\x12\x10\n\x08log_line\x18\x01 \x03(\t\"\x89\x01\n\x11StreamLogsRequest\x12\x13\n\x06\x63ursor\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x13\n\x06\x62\x65\x66ore\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x11\n\tmax_lines\x18\x03 \x01(\r\x12\x11\n\tmin_level\x18\x04 \x01(\t\x12\x0e\n\x06\x66ollow\x18\x05 \x01(\x08\x42\t\n\x07_cursorB\t\n\x07_before\";\n\x08LogChunk\x12\x10\n\x08log_line\x18\x01 \x03(\t\x12\r\n\x05start\x18\x02 \x01(\x03\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\x03\"\'\n\x12GetNodeInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"\x90\x01\n\x13GetNodeInfoResponse\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x11\n\tsuccessor\x18\x02 \x01(\t\x12\x13\n\x0bpredecessor\x18\x03 \x01(\t\x12(\n\x0c\x66inger_table\x18\x04 \x03(\x0b\x32\x12.chord.FingerEntry\x12\x16\n\x0esuccessor_list\x18\x05 \x03(\t\"0\n\x0b\x46ingerEntry\x12\r\n\x05index\x18\x01 \x01(\t\x12\x12\n\nfinger_val\x18\x02 \x01(\t\"(\n\x13GetNodeStatsRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"\xc9\x01\n\x11HistogramSnapshot\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x34\n\x06labels\x18\x02 \x03(\x0b\x32$.chord.HistogramSnapshot.LabelsEntry\x12\x0e\n\x06\x62ounds\x18\x03 \x03(\x01\x12\x15\n\rbucket_counts\x18\x04 \x03(\x04\x12\x0b\n\x03sum\x18\x05 \x01(\x01\x12\r\n\x05\x63ount\x18\x06 \x01(\x04\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xfc\x01\n\x14GetNodeStatsResponse\x12\r\n\x05\x66ixes\x18\x01 \x01(\t\x12\x15\n\rstabilization\x18\x02 \x01(\t\x12\x0f\n\x07lookups\x18\x03 \x01(\t\x12\x11\n\tjoin_time\x18\x04 \x01(\t\x12;\n\x08\x63ounters\x18\x05 \x03(\x0b\x32).chord.GetNodeStatsResponse.CountersEntry\x12,\n\nhistograms\x18\x06 \x03(\x0b\x32\x18.chord.HistogramSnapshot\x1a/\n\rCountersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"6\n\x14\x46indSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\"-\n\x15\x46indSuccessorResponse\x12\x14\n\x0csuccessor_id\x18\x01 \x01(\t\"4\n\x12\x46indNextHopRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\"8\n\x13\x46indNextHopResponse\x12\x13\n\x0bnext_hop_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64one\x18\x02 \x01(\x08\"+\n\x16\x46indPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"I\n\x17\x46indPredecessorResponse\x12\x16\n\x0epredecessor_id\x18\x01 \x01(\t\x12\x16\n\x0esuccessor_list\x18\x02 \x03(\t\"+\n\x16GetRoutingStateRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"p\n\x17GetRoutingStateResponse\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x16\n\x0epredecessor_id\x18\x02 \x01(\t\x12\x16\n\x0esuccessor_list\x18\x03 \x03(\t\x12\x14\n\x0c\x66inger_table\x18\x04 \x03(\t\"B\n\x13SetSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x18\n\x10new_successor_id\x18\x02 \x01(\t\"\x16\n\x14SetSuccessorResponse\"F\n\x15SetPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x1a\n\x12new_predecessor_id\x18\x02 \x01(\t\"\x18\n\x16SetPredecessorResponse\"\'\n\x19NodeHasInformationRequest\x12\n\n\x02id\x18\x01 \x01(\t\"1\n\x1aNodeHasInformationResponse\x12\x13\n\x0binformation\x18\x02 \x01(\t\"5\n\rNotifyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x11\n\tsender_id\x18\x02 \x01(\t\"Q\n\x18UpdateFingerTableRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x13\n\x0bnew_node_id\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\t\"\x1b\n\x19UpdateFingerTableResponse\"I\n\x11\x46ingerHintRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x13\n\x0bnew_node_id\x18\x02 \x01(\t\x12\x0c\n\x04hops\x18\x03 \x01(\r\"\x14\n\x12\x46ingerHintResponse\"(\n\x0eNotifyResponse\x12\x16\n\x0esuccessor_list\x18\x01 \x03(\t\"0\n\x0eGetInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\"&\n\x0fGetInfoResponse\x12\x13\n\x0binformation\x18\x01 \x01(\t\"&\n\x11GetAllInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\"8\n\x12GetAllInfoResponse\x12\"\n\tinfo_line\x18\x01 \x03(\x0b\x32\x0f.chord.InfoLine\".\n\x08InfoLine\x12\x10\n\x08info_key\x18\x01 \x01(\t\x12\x10\n\x08info_val\x18\x02 \x01(\t\"C\n\x0e\x41\x64\x64InfoRequest\x12\x10\n\x08info_key\x18\x01 \x01(\t\x12\x0c\n\x04info\x18\x02 \x01(\t\x12\x11\n\ttarget_id\x18\x03 \x01(\t\"\x11\n\x0f\x41\x64\x64InfoResponse\"\x13\n\x11\x46ixFingersRequest\"\x14\n\x12\x46ixFingersResponse\"\x12\n\x10StabilizeRequest\"\x13\n\x11StabilizeResponse\"8\n\x11RemoveInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x10\n\x08info_key\x18\x02 \x01(\t\"\x14\n\x12RemoveInfoResponse\"1\n\x0eGetManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0c\n\x04keys\x18\x02 \x03(\t\"5\n\x0fGetManyResponse\x12\"\n\tinfo_line\x18\x01 \x03(\x0b\x32\x0f.chord.InfoLine\"G\n\x0ePutManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\"\n\tinfo_line\x18\x02 \x03(\x0b\x32\x0f.chord.InfoLine\"\'\n\x0fPutManyResponse\x12\x14\n\x0c\x63reated_keys\x18\x01 \x03(\t\"4\n\x11\x44\x65leteManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0c\n\x04keys\x18\x02 \x03(\t\"*\n\x12\x44\x65leteManyResponse\x12\x14\n\x0cremoved_keys\x18\x01 \x03(\t\"Y\n\x0cHandoffChunk\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\"\n\tinfo_line\x18\x03 \x03(\x0b\x32\x0f.chord.InfoLine\"3\n\x0fHandoffResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\x12\x10\n\x08received\x18\x02 \x01(\x03\"=\n\x14HandoffCursorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\"\'\n\x15HandoffCursorResponse\x12\x0e\n\x06\x63ursor\x18\x01 \x01(\t\"\\\n\x15RequestHandoffRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x14\n\x0crequester_id\x18\x02 \x01(\t\x12\r\n\x05start\x18\x03 \x01(\t\x12\x0b\n\x03\x65nd\x18\x04 \x01(\t\"+\n\x16RequestHandoffResponse\x12\x11\n\tcompleted\x18\x01 \x01(\x08\x32\x8c\x10\n\x05\x43hord\x12J\n\rFindSuccessor\x12\x1b.chord.FindSuccessorRequest\x1a\x1c.chord.FindSuccessorResponse\x12\x44\n\x0b\x46indNextHop\x12\x19.chord.FindNextHopRequest\x1a\x1a.chord.FindNextHopResponse\x12P\n\x0f\x46indPredecessor\x12\x1d.chord.FindPredecessorRequest\x1a\x1e.chord.FindPredecessorResponse\x12P\n\x0fGetRoutingState\x12\x1d.chord.GetRoutingStateRequest\x1a\x1e.chord.GetRoutingStateResponse\x12G\n\x0cSetSuccessor\x12\x1a.chord.SetSuccessorRequest\x1a\x1b.chord.SetSuccessorResponse\x12M\n\x0eSetPredecessor\x12\x1c.chord.SetPredecessorRequest\x1a\x1d.chord.SetPredecessorResponse\x12\x35\n\x06Notify\x12\x14.chord.NotifyRequest\x1a\x15.chord.NotifyResponse\x12V\n\x11UpdateFingerTable\x12\x1f.chord.UpdateFingerTableRequest\x1a .chord.UpdateFingerTableResponse\x12\x41\n\nFingerHint\x12\x18.chord.FingerHintRequest\x1a\x19.chord.FingerHintResponse\x12\x41\n\nFixFingers\x12\x18.chord.FixFingersRequest\x1a\x19.chord.FixFingersResponse\x12>\n\tStabilize\x12\x17.chord.StabilizeRequest\x1a\x18.chord.StabilizeResponse\x12?\n\x0eGetInformation\x12\x15.chord.GetInfoRequest\x1a\x16.chord.GetInfoResponse\x12Y\n\x12NodeHasInformation\x12 .chord.NodeHasInformationRequest\x1a!.chord.NodeHasInformationResponse\x12?\n\x0e\x41\x64\x64Information\x12\x15.chord.AddInfoRequest\x1a\x16.chord.AddInfoResponse\x12H\n\x11RemoveInformation\x12\x18.chord.RemoveInfoRequest\x1a\x19.chord.RemoveInfoResponse\x12H\n\x17\x41\x64\x64RedundantInformation\x12\x15.chord.AddInfoRequest\x1a\x16.chord.AddInfoResponse\x12Q\n\x1aRemoveRedundantInformation\x12\x18.chord.RemoveInfoRequest\x1a\x19.chord.RemoveInfoResponse\x12\x41\n\x10\x41\x64\x64RedundantMany\x12\x15.chord.PutManyRequest\x1a\x16.chord.AddInfoResponse\x12\x38\n\x07GetMany\x12\x15.chord.GetManyRequest\x1a\x16.chord.GetManyResponse\x12\x38\n\x07PutMany\x12\x15.chord.PutManyRequest\x1a\x16.chord.PutManyResponse\x12\x41\n\nDeleteMany\x12\x18.chord.DeleteManyRequest\x1a\x19.chord.DeleteManyResponse\x12\x38\n\x07Handoff\x12\x13.chord.HandoffChunk\x1a\x16.chord.HandoffResponse(\x01\x12M\n\x10GetHandoffCursor\x12\x1b.chord.HandoffCursorRequest\x1a\x1c.chord.HandoffCursorResponse\x12M\n\x0eRequestHandoff\x12\x1c.chord.RequestHandoffRequest\x1a\x1d.chord.RequestHandoffResponse\x12K\n\x12GetNodeInformation\x12\x19.chord.GetNodeInfoRequest\x1a\x1a.chord.GetNodeInfoResponse\x12\x45\n\x0eGetAllNodeInfo\x12\x18.chord.GetAllInfoRequest\x1a\x19.chord.GetAllInfoResponse\x12G\n\x0cGetNodeStats\x12\x1a.chord.GetNodeStatsRequest\x1a\x1b.chord.GetNodeStatsResponse\x12\x32\n\x07GetLogs\x12\x12.chord.LogsRequest\x1a\x13.chord.LogsResponse\x12\x39\n\nStreamLogs\x12\x18.chord.StreamLogsRequest\x1a\x0f.chord.LogChunk0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chord_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_HISTOGRAMSNAPSHOT_LABELSENTRY']._loaded_options = None
+  _globals['_HISTOGRAMSNAPSHOT_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_GETNODESTATSRESPONSE_COUNTERSENTRY']._loaded_options = None
+  _globals['_GETNODESTATSRESPONSE_COUNTERSENTRY']._serialized_options = b'8\001'
   _globals['_LOGSREQUEST']._serialized_start=22
-  _globals['_LOGSREQUEST']._serialized_end=35
-  _globals['_LOGSRESPONSE']._serialized_start=37
-  _globals['_LOGSRESPONSE']._serialized_end=69
-  _globals['_GETNODEINFOREQUEST']._serialized_start=71
-  _globals['_GETNODEINFOREQUEST']._serialized_end=110
-  _globals['_GETNODEINFORESPONSE']._serialized_start=112
-  _globals['_GETNODEINFORESPONSE']._serialized_end=232
-  _globals['_FINGERENTRY']._serialized_start=234
-  _globals['_FINGERENTRY']._serialized_end=282
-  _globals['_GETNODESTATSREQUEST']._serialized_start=284
-  _globals['_GETNODESTATSREQUEST']._serialized_end=324
-  _globals['_GETNODESTATSRESPONSE']._serialized_start=326
-  _globals['_GETNODESTATSRESPONSE']._serialized_end=422
-  _globals['_FINDSUCCESSORREQUEST']._serialized_start=424
-  _globals['_FINDSUCCESSORREQUEST']._serialized_end=478
-  _globals['_FINDSUCCESSORRESPONSE']._serialized_start=480
-  _globals['_FINDSUCCESSORRESPONSE']._serialized_end=525
-  _globals['_FINDPREDECESSORREQUEST']._serialized_start=527
-  _globals['_FINDPREDECESSORREQUEST']._serialized_end=570
-  _globals['_FINDPREDECESSORRESPONSE']._serialized_start=572
-  _globals['_FINDPREDECESSORRESPONSE']._serialized_end=621
-  _globals['_SETSUCCESSORREQUEST']._serialized_start=623
-  _globals['_SETSUCCESSORREQUEST']._serialized_end=689
-  _globals['_SETSUCCESSORRESPONSE']._serialized_start=691
-  _globals['_SETSUCCESSORRESPONSE']._serialized_end=713
-  _globals['_SETPREDECESSORREQUEST']._serialized_start=715
-  _globals['_SETPREDECESSORREQUEST']._serialized_end=785
-  _globals['_SETPREDECESSORRESPONSE']._serialized_start=787
-  _globals['_SETPREDECESSORRESPONSE']._serialized_end=811
-  _globals['_NODEHASINFORMATIONREQUEST']._serialized_start=813
-  _globals['_NODEHASINFORMATIONREQUEST']._serialized_end=852
-  _globals['_NODEHASINFORMATIONRESPONSE']._serialized_start=854
-  _globals['_NODEHASINFORMATIONRESPONSE']._serialized_end=903
-  _globals['_NOTIFYREQUEST']._serialized_start=905
-  _globals['_NOTIFYREQUEST']._serialized_end=958
-  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_start=960
-  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_end=1041
-  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_start=1043
-  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_end=1070
-  _globals['_NOTIFYRESPONSE']._serialized_start=1072
-  _globals['_NOTIFYRESPONSE']._serialized_end=1088
-  _globals['_GETINFOREQUEST']._serialized_start=1090
-  _globals['_GETINFOREQUEST']._serialized_end=1138
-  _globals['_GETINFORESPONSE']._serialized_start=1140
-  _globals['_GETINFORESPONSE']._serialized_end=1178
-  _globals['_GETALLINFOREQUEST']._serialized_start=1180
-  _globals['_GETALLINFOREQUEST']._serialized_end=1199
-  _globals['_GETALLINFORESPONSE']._serialized_start=1201
-  _globals['_GETALLINFORESPONSE']._serialized_end=1257
-  _globals['_INFOLINE']._serialized_start=1259
-  _globals['_INFOLINE']._serialized_end=1305
-  _globals['_ADDINFOREQUEST']._serialized_start=1307
-  _globals['_ADDINFOREQUEST']._serialized_end=1355
-  _globals['_ADDINFORESPONSE']._serialized_start=1357
-  _globals['_ADDINFORESPONSE']._serialized_end=1374
-  _globals['_FIXFINGERSREQUEST']._serialized_start=1376
-  _globals['_FIXFINGERSREQUEST']._serialized_end=1395
-  _globals['_FIXFINGERSRESPONSE']._serialized_start=1397
-  _globals['_FIXFINGERSRESPONSE']._serialized_end=1417
-  _globals['_STABILIZEREQUEST']._serialized_start=1419
-  _globals['_STABILIZEREQUEST']._serialized_end=1437
-  _globals['_STABILIZERESPONSE']._serialized_start=1439
-  _globals['_STABILIZERESPONSE']._serialized_end=1458
-  _globals['_REMOVEINFOREQUEST']._serialized_start=1460
-  _globals['_REMOVEINFOREQUEST']._serialized_end=1516
-  _globals['_REMOVEINFORESPONSE']._serialized_start=1518
-  _globals['_REMOVEINFORESPONSE']._serialized_end=1538
-  _globals['_CHORD']._serialized_start=1541
-  _globals['_CHORD']._serialized_end=2700
+  _globals['_LOGSREQUEST']._serialized_end=54
+  _globals['_LOGSRESPONSE']._serialized_start=56
+  _globals['_LOGSRESPONSE']._serialized_end=88
+  _globals['_STREAMLOGSREQUEST']._serialized_start=91
+  _globals['_STREAMLOGSREQUEST']._serialized_end=228
+  _globals['_LOGCHUNK']._serialized_start=230
+  _globals['_LOGCHUNK']._serialized_end=289
+  _globals['_GETNODEINFOREQUEST']._serialized_start=291
+  _globals['_GETNODEINFOREQUEST']._serialized_end=330
+  _globals['_GETNODEINFORESPONSE']._serialized_start=333
+  _globals['_GETNODEINFORESPONSE']._serialized_end=477
+  _globals['_FINGERENTRY']._serialized_start=479
+  _globals['_FINGERENTRY']._serialized_end=527
+  _globals['_GETNODESTATSREQUEST']._serialized_start=529
+  _globals['_GETNODESTATSREQUEST']._serialized_end=569
+  _globals['_HISTOGRAMSNAPSHOT']._serialized_start=572
+  _globals['_HISTOGRAMSNAPSHOT']._serialized_end=773
+  _globals['_HISTOGRAMSNAPSHOT_LABELSENTRY']._serialized_start=728
+  _globals['_HISTOGRAMSNAPSHOT_LABELSENTRY']._serialized_end=773
+  _globals['_GETNODESTATSRESPONSE']._serialized_start=776
+  _globals['_GETNODESTATSRESPONSE']._serialized_end=1028
+  _globals['_GETNODESTATSRESPONSE_COUNTERSENTRY']._serialized_start=981
+  _globals['_GETNODESTATSRESPONSE_COUNTERSENTRY']._serialized_end=1028
+  _globals['_FINDSUCCESSORREQUEST']._serialized_start=1030
+  _globals['_FINDSUCCESSORREQUEST']._serialized_end=1084
+  _globals['_FINDSUCCESSORRESPONSE']._serialized_start=1086
+  _globals['_FINDSUCCESSORRESPONSE']._serialized_end=1131
+  _globals['_FINDNEXTHOPREQUEST']._serialized_start=1133
+  _globals['_FINDNEXTHOPREQUEST']._serialized_end=1185
+  _globals['_FINDNEXTHOPRESPONSE']._serialized_start=1187
+  _globals['_FINDNEXTHOPRESPONSE']._serialized_end=1243
+  _globals['_FINDPREDECESSORREQUEST']._serialized_start=1245
+  _globals['_FINDPREDECESSORREQUEST']._serialized_end=1288
+  _globals['_FINDPREDECESSORRESPONSE']._serialized_start=1290
+  _globals['_FINDPREDECESSORRESPONSE']._serialized_end=1363
+  _globals['_GETROUTINGSTATEREQUEST']._serialized_start=1365
+  _globals['_GETROUTINGSTATEREQUEST']._serialized_end=1408
+  _globals['_GETROUTINGSTATERESPONSE']._serialized_start=1410
+  _globals['_GETROUTINGSTATERESPONSE']._serialized_end=1522
+  _globals['_SETSUCCESSORREQUEST']._serialized_start=1524
+  _globals['_SETSUCCESSORREQUEST']._serialized_end=1590
+  _globals['_SETSUCCESSORRESPONSE']._serialized_start=1592
+  _globals['_SETSUCCESSORRESPONSE']._serialized_end=1614
+  _globals['_SETPREDECESSORREQUEST']._serialized_start=1616
+  _globals['_SETPREDECESSORREQUEST']._serialized_end=1686
+  _globals['_SETPREDECESSORRESPONSE']._serialized_start=1688
+  _globals['_SETPREDECESSORRESPONSE']._serialized_end=1712
+  _globals['_NODEHASINFORMATIONREQUEST']._serialized_start=1714
+  _globals['_NODEHASINFORMATIONREQUEST']._serialized_end=1753
+  _globals['_NODEHASINFORMATIONRESPONSE']._serialized_start=1755
+  _globals['_NODEHASINFORMATIONRESPONSE']._serialized_end=1804
+  _globals['_NOTIFYREQUEST']._serialized_start=1806
+  _globals['_NOTIFYREQUEST']._serialized_end=1859
+  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_start=1861
+  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_end=1942
+  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_start=1944
+  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_end=1971
+  _globals['_FINGERHINTREQUEST']._serialized_start=1973
+  _globals['_FINGERHINTREQUEST']._serialized_end=2046
+  _globals['_FINGERHINTRESPONSE']._serialized_start=2048
+  _globals['_FINGERHINTRESPONSE']._serialized_end=2068
+  _globals['_NOTIFYRESPONSE']._serialized_start=2070
+  _globals['_NOTIFYRESPONSE']._serialized_end=2110
+  _globals['_GETINFOREQUEST']._serialized_start=2112
+  _globals['_GETINFOREQUEST']._serialized_end=2160
+  _globals['_GETINFORESPONSE']._serialized_start=2162
+  _globals['_GETINFORESPONSE']._serialized_end=2200
+  _globals['_GETALLINFOREQUEST']._serialized_start=2202
+  _globals['_GETALLINFOREQUEST']._serialized_end=2240
+  _globals['_GETALLINFORESPONSE']._serialized_start=2242
+  _globals['_GETALLINFORESPONSE']._serialized_end=2298
+  _globals['_INFOLINE']._serialized_start=2300
+  _globals['_INFOLINE']._serialized_end=2346
+  _globals['_ADDINFOREQUEST']._serialized_start=2348
+  _globals['_ADDINFOREQUEST']._serialized_end=2415
+  _globals['_ADDINFORESPONSE']._serialized_start=2417
+  _globals['_ADDINFORESPONSE']._serialized_end=2434
+  _globals['_FIXFINGERSREQUEST']._serialized_start=2436
+  _globals['_FIXFINGERSREQUEST']._serialized_end=2455
+  _globals['_FIXFINGERSRESPONSE']._serialized_start=2457
+  _globals['_FIXFINGERSRESPONSE']._serialized_end=2477
+  _globals['_STABILIZEREQUEST']._serialized_start=2479
+  _globals['_STABILIZEREQUEST']._serialized_end=2497
+  _globals['_STABILIZERESPONSE']._serialized_start=2499
+  _globals['_STABILIZERESPONSE']._serialized_end=2518
+  _globals['_REMOVEINFOREQUEST']._serialized_start=2520
+  _globals['_REMOVEINFOREQUEST']._serialized_end=2576
+  _globals['_REMOVEINFORESPONSE']._serialized_start=2578
+  _globals['_REMOVEINFORESPONSE']._serialized_end=2598
+  _globals['_GETMANYREQUEST']._serialized_start=2600
+  _globals['_GETMANYREQUEST']._serialized_end=2649
+  _globals['_GETMANYRESPONSE']._serialized_start=2651
+  _globals['_GETMANYRESPONSE']._serialized_end=2704
+  _globals['_PUTMANYREQUEST']._serialized_start=2706
+  _globals['_PUTMANYREQUEST']._serialized_end=2777
+  _globals['_PUTMANYRESPONSE']._serialized_start=2779
+  _globals['_PUTMANYRESPONSE']._serialized_end=2818
+  _globals['_DELETEMANYREQUEST']._serialized_start=2820
+  _globals['_DELETEMANYREQUEST']._serialized_end=2872
+  _globals['_DELETEMANYRESPONSE']._serialized_start=2874
+  _globals['_DELETEMANYRESPONSE']._serialized_end=2916
+  _globals['_HANDOFFCHUNK']._serialized_start=2918
+  _globals['_HANDOFFCHUNK']._serialized_end=3007
+  _globals['_HANDOFFRESPONSE']._serialized_start=3009
+  _globals['_HANDOFFRESPONSE']._serialized_end=3060
+  _globals['_HANDOFFCURSORREQUEST']._serialized_start=3062
+  _globals['_HANDOFFCURSORREQUEST']._serialized_end=3123
+  _globals['_HANDOFFCURSORRESPONSE']._serialized_start=3125
+  _globals['_HANDOFFCURSORRESPONSE']._serialized_end=3164
+  _globals['_REQUESTHANDOFFREQUEST']._serialized_start=3166
+  _globals['_REQUESTHANDOFFREQUEST']._serialized_end=3258
+  _globals['_REQUESTHANDOFFRESPONSE']._serialized_start=3260
+  _globals['_REQUESTHANDOFFRESPONSE']._serialized_end=3303
+  _globals['_CHORD']._serialized_start=3306
+  _globals['_CHORD']._serialized_end=5366
 # @@protoc_insertion_point(module_scope)
@@ -7,8 +7,10 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class LogsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("max_lines",)
+    MAX_LINES_FIELD_NUMBER: _ClassVar[int]
+    max_lines: int
+    def __init__(self, max_lines: _Optional[int] = ...) -> None: ...
 
 class LogsResponse(_message.Message):
     __slots__ = ("log_line",)
@@ -16,6 +18,30 @@ class LogsResponse(_message.Message):
     log_line: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, log_line: _Optional[_Iterable[str]] = ...) -> None: ...
 
+class StreamLogsRequest(_message.Message):
+    __slots__ = ("cursor", "before", "max_lines", "min_level", "follow")
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    BEFORE_FIELD_NUMBER: _ClassVar[int]
+    MAX_LINES_FIELD_NUMBER: _ClassVar[int]
+    MIN_LEVEL_FIELD_NUMBER: _ClassVar[int]
+    FOLLOW_FIELD_NUMBER: _ClassVar[int]
+    cursor: int
+    before: int
+    max_lines: int
+    min_level: str
+    follow: bool
+    def __init__(self, cursor: _Optional[int] = ..., before: _Optional[int] = ..., max_lines: _Optional[int] = ..., min_level: _Optional[str] = ..., follow: bool = ...) -> None: ...
+
+class LogChunk(_message.Message):
+    __slots__ = ("log_line", "start", "cursor")
+    LOG_LINE_FIELD_NUMBER: _ClassVar[int]
+    START_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    log_line: _containers.RepeatedScalarFieldContainer[str]
+    start: int
+    cursor: int
+    def __init__(self, log_line: _Optional[_Iterable[str]] = ..., start: _Optional[int] = ..., cursor: _Optional[int] = ...) -> None: ...
+
 class GetNodeInfoRequest(_message.Message):
     __slots__ = ("target_id",)
     TARGET_ID_FIELD_NUMBER: _ClassVar[int]
@@ -23,16 +49,18 @@ class GetNodeInfoRequest(_message.Message):
     def __init__(self, target_id: _Optional[str] = ...) -> None: ...
 
 class GetNodeInfoResponse(_message.Message):
-    __slots__ = ("node_id", "successor", "predecessor", "finger_table")
+    __slots__ = ("node_id", "successor", "predecessor", "finger_table", "successor_list")
     NODE_ID_FIELD_NUMBER: _ClassVar[int]
     SUCCESSOR_FIELD_NUMBER: _ClassVar[int]
     PREDECESSOR_FIELD_NUMBER: _ClassVar[int]
     FINGER_TABLE_FIELD_NUMBER: _ClassVar[int]
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
     node_id: str
     successor: str
     predecessor: str
     finger_table: _containers.RepeatedCompositeFieldContainer[FingerEntry]
-    def __init__(self, node_id: _Optional[str] = ..., successor: _Optional[str] = ..., predecessor: _Optional[str] = ..., finger_table: _Optional[_Iterable[_Union[FingerEntry, _Mapping]]] = ...) -> None: ...
+    successor_list: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, node_id: _Optional[str] = ..., successor: _Optional[str] = ..., predecessor: _Optional[str] = ..., finger_table: _Optional[_Iterable[_Union[FingerEntry, _Mapping]]] = ..., successor_list: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class FingerEntry(_message.Message):
     __slots__ = ("index", "finger_val")
@@ -48,17 +76,51 @@ class GetNodeStatsRequest(_message.Message):
     target_id: str
     def __init__(self, target_id: _Optional[str] = ...) -> None: ...
 
+class HistogramSnapshot(_message.Message):
+    __slots__ = ("name", "labels", "bounds", "bucket_counts", "sum", "count")
+    class LabelsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    BOUNDS_FIELD_NUMBER: _ClassVar[int]
+    BUCKET_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    SUM_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    labels: _containers.ScalarMap[str, str]
+    bounds: _containers.RepeatedScalarFieldContainer[float]
+    bucket_counts: _containers.RepeatedScalarFieldContainer[int]
+    sum: float
+    count: int
+    def __init__(self, name: _Optional[str] = ..., labels: _Optional[_Mapping[str, str]] = ..., bounds: _Optional[_Iterable[float]] = ..., bucket_counts: _Optional[_Iterable[int]] = ..., sum: _Optional[float] = ..., count: _Optional[int] = ...) -> None: ...
+
 class GetNodeStatsResponse(_message.Message):
-    __slots__ = ("fixes", "stabilization", "lookups", "join_time")
+    __slots__ = ("fixes", "stabilization", "lookups", "join_time", "counters", "histograms")
+    class CountersEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: float
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[float] = ...) -> None: ...
     FIXES_FIELD_NUMBER: _ClassVar[int]
     STABILIZATION_FIELD_NUMBER: _ClassVar[int]
     LOOKUPS_FIELD_NUMBER: _ClassVar[int]
     JOIN_TIME_FIELD_NUMBER: _ClassVar[int]
+    COUNTERS_FIELD_NUMBER: _ClassVar[int]
+    HISTOGRAMS_FIELD_NUMBER: _ClassVar[int]
     fixes: str
     stabilization: str
     lookups: str
     join_time: str
-    def __init__(self, fixes: _Optional[str] = ..., stabilization: _Optional[str] = ..., lookups: _Optional[str] = ..., join_time: _Optional[str] = ...) -> None: ...
+    counters: _containers.ScalarMap[str, float]
+    histograms: _containers.RepeatedCompositeFieldContainer[HistogramSnapshot]
+    def __init__(self, fixes: _Optional[str] = ..., stabilization: _Optional[str] = ..., lookups: _Optional[str] = ..., join_time: _Optional[str] = ..., counters: _Optional[_Mapping[str, float]] = ..., histograms: _Optional[_Iterable[_Union[HistogramSnapshot, _Mapping]]] = ...) -> None: ...
 
 class FindSuccessorRequest(_message.Message):
     __slots__ = ("target_id", "key")
@@ -74,6 +136,22 @@ class FindSuccessorResponse(_message.Message):
     successor_id: str
     def __init__(self, successor_id: _Optional[str] = ...) -> None: ...
 
+class FindNextHopRequest(_message.Message):
+    __slots__ = ("target_id", "key")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    key: str
+    def __init__(self, target_id: _Optional[str] = ..., key: _Optional[str] = ...) -> None: ...
+
+class FindNextHopResponse(_message.Message):
+    __slots__ = ("next_hop_id", "done")
+    NEXT_HOP_ID_FIELD_NUMBER: _ClassVar[int]
+    DONE_FIELD_NUMBER: _ClassVar[int]
+    next_hop_id: str
+    done: bool
+    def __init__(self, next_hop_id: _Optional[str] = ..., done: bool = ...) -> None: ...
+
 class FindPredecessorRequest(_message.Message):
     __slots__ = ("target_id",)
     TARGET_ID_FIELD_NUMBER: _ClassVar[int]
@@ -81,10 +159,30 @@ class FindPredecessorRequest(_message.Message):
     def __init__(self, target_id: _Optional[str] = ...) -> None: ...
 
 class FindPredecessorResponse(_message.Message):
-    __slots__ = ("predecessor_id",)
+    __slots__ = ("predecessor_id", "successor_list")
     PREDECESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
     predecessor_id: str
-    def __init__(self, predecessor_id: _Optional[str] = ...) -> None: ...
+    successor_list: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, predecessor_id: _Optional[str] = ..., successor_list: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetRoutingStateRequest(_message.Message):
+    __slots__ = ("target_id",)
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    def __init__(self, target_id: _Optional[str] = ...) -> None: ...
+
+class GetRoutingStateResponse(_message.Message):
+    __slots__ = ("node_id", "predecessor_id", "successor_list", "finger_table")
+    NODE_ID_FIELD_NUMBER: _ClassVar[int]
+    PREDECESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
+    FINGER_TABLE_FIELD_NUMBER: _ClassVar[int]
+    node_id: str
+    predecessor_id: str
+    successor_list: _containers.RepeatedScalarFieldContainer[str]
+    finger_table: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, node_id: _Optional[str] = ..., predecessor_id: _Optional[str] = ..., successor_list: _Optional[_Iterable[str]] = ..., finger_table: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class SetSuccessorRequest(_message.Message):
     __slots__ = ("target_id", "new_successor_id")
@@ -144,10 +242,26 @@ class UpdateFingerTableResponse(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
-class NotifyResponse(_message.Message):
+class FingerHintRequest(_message.Message):
+    __slots__ = ("target_id", "new_node_id", "hops")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    NEW_NODE_ID_FIELD_NUMBER: _ClassVar[int]
+    HOPS_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    new_node_id: str
+    hops: int
+    def __init__(self, target_id: _Optional[str] = ..., new_node_id: _Optional[str] = ..., hops: _Optional[int] = ...) -> None: ...
+
+class FingerHintResponse(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class NotifyResponse(_message.Message):
+    __slots__ = ("successor_list",)
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
+    successor_list: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, successor_list: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class GetInfoRequest(_message.Message):
     __slots__ = ("target_id", "key")
     TARGET_ID_FIELD_NUMBER: _ClassVar[int]
@@ -163,8 +277,10 @@ class GetInfoResponse(_message.Message):
     def __init__(self, information: _Optional[str] = ...) -> None: ...
 
 class GetAllInfoRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("target_id",)
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    def __init__(self, target_id: _Optional[str] = ...) -> None: ...
 
 class GetAllInfoResponse(_message.Message):
     __slots__ = ("info_line",)
@@ -181,12 +297,14 @@ class InfoLine(_message.Message):
     def __init__(self, info_key: _Optional[str] = ..., info_val: _Optional[str] = ...) -> None: ...
 
 class AddInfoRequest(_message.Message):
-    __slots__ = ("info_key", "info")
+    __slots__ = ("info_key", "info", "target_id")
     INFO_KEY_FIELD_NUMBER: _ClassVar[int]
     INFO_FIELD_NUMBER: _ClassVar[int]
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
     info_key: str
     info: str
-    def __init__(self, info_key: _Optional[str] = ..., info: _Optional[str] = ...) -> None: ...
+    target_id: str
+    def __init__(self, info_key: _Optional[str] = ..., info: _Optional[str] = ..., target_id: _Optional[str] = ...) -> None: ...
 
 class AddInfoResponse(_message.Message):
     __slots__ = ()
@@ -219,3 +337,95 @@ class RemoveInfoRequest(_message.Message):
 class RemoveInfoResponse(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
+
+class GetManyRequest(_message.Message):
+    __slots__ = ("target_id", "keys")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEYS_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    keys: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, target_id: _Optional[str] = ..., keys: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetManyResponse(_message.Message):
+    __slots__ = ("info_line",)
+    INFO_LINE_FIELD_NUMBER: _ClassVar[int]
+    info_line: _containers.RepeatedCompositeFieldContainer[InfoLine]
+    def __init__(self, info_line: _Optional[_Iterable[_Union[InfoLine, _Mapping]]] = ...) -> None: ...
+
+class PutManyRequest(_message.Message):
+    __slots__ = ("target_id", "info_line")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    INFO_LINE_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    info_line: _containers.RepeatedCompositeFieldContainer[InfoLine]
+    def __init__(self, target_id: _Optional[str] = ..., info_line: _Optional[_Iterable[_Union[InfoLine, _Mapping]]] = ...) -> None: ...
+
+class PutManyResponse(_message.Message):
+    __slots__ = ("created_keys",)
+    CREATED_KEYS_FIELD_NUMBER: _ClassVar[int]
+    created_keys: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, created_keys: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DeleteManyRequest(_message.Message):
+    __slots__ = ("target_id", "keys")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEYS_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    keys: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, target_id: _Optional[str] = ..., keys: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DeleteManyResponse(_message.Message):
+    __slots__ = ("removed_keys",)
+    REMOVED_KEYS_FIELD_NUMBER: _ClassVar[int]
+    removed_keys: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, removed_keys: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class HandoffChunk(_message.Message):
+    __slots__ = ("target_id", "session_id", "info_line")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    SESSION_ID_FIELD_NUMBER: _ClassVar[int]
+    INFO_LINE_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    session_id: str
+    info_line: _containers.RepeatedCompositeFieldContainer[InfoLine]
+    def __init__(self, target_id: _Optional[str] = ..., session_id: _Optional[str] = ..., info_line: _Optional[_Iterable[_Union[InfoLine, _Mapping]]] = ...) -> None: ...
+
+class HandoffResponse(_message.Message):
+    __slots__ = ("cursor", "received")
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    RECEIVED_FIELD_NUMBER: _ClassVar[int]
+    cursor: str
+    received: int
+    def __init__(self, cursor: _Optional[str] = ..., received: _Optional[int] = ...) -> None: ...
+
+class HandoffCursorRequest(_message.Message):
+    __slots__ = ("target_id", "session_id")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    SESSION_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    session_id: str
+    def __init__(self, target_id: _Optional[str] = ..., session_id: _Optional[str] = ...) -> None: ...
+
+class HandoffCursorResponse(_message.Message):
+    __slots__ = ("cursor",)
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    cursor: str
+    def __init__(self, cursor: _Optional[str] = ...) -> None: ...
+
+class RequestHandoffRequest(_message.Message):
+    __slots__ = ("target_id", "requester_id", "start", "end")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    REQUESTER_ID_FIELD_NUMBER: _ClassVar[int]
+    START_FIELD_NUMBER: _ClassVar[int]
+    END_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    requester_id: str
+    start: str
+    end: str
+    def __init__(self, target_id: _Optional[str] = ..., requester_id: _Optional[str] = ..., start: _Optional[str] = ..., end: _Optional[str] = ...) -> None: ...
+
+class RequestHandoffResponse(_message.Message):
+    __slots__ = ("completed",)
+    COMPLETED_FIELD_NUMBER: _ClassVar[int]
+    completed: bool
+    def __init__(self, completed: bool = ...) -> None: ...
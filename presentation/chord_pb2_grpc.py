@@ -39,11 +39,21 @@ class ChordStub(object):
                 request_serializer=chord__pb2.FindSuccessorRequest.SerializeToString,
                 response_deserializer=chord__pb2.FindSuccessorResponse.FromString,
                 _registered_method=True)
+        self.FindNextHop = channel.unary_unary(
+                '/chord.Chord/FindNextHop',
+                request_serializer=chord__pb2.FindNextHopRequest.SerializeToString,
+                response_deserializer=chord__pb2.FindNextHopResponse.FromString,
+                _registered_method=True)
         self.FindPredecessor = channel.unary_unary(
                 '/chord.Chord/FindPredecessor',
                 request_serializer=chord__pb2.FindPredecessorRequest.SerializeToString,
                 response_deserializer=chord__pb2.FindPredecessorResponse.FromString,
                 _registered_method=True)
+        self.GetRoutingState = channel.unary_unary(
+                '/chord.Chord/GetRoutingState',
+                request_serializer=chord__pb2.GetRoutingStateRequest.SerializeToString,
+                response_deserializer=chord__pb2.GetRoutingStateResponse.FromString,
+                _registered_method=True)
         self.SetSuccessor = channel.unary_unary(
                 '/chord.Chord/SetSuccessor',
                 request_serializer=chord__pb2.SetSuccessorRequest.SerializeToString,
@@ -64,6 +74,11 @@ class ChordStub(object):
                 request_serializer=chord__pb2.UpdateFingerTableRequest.SerializeToString,
                 response_deserializer=chord__pb2.UpdateFingerTableResponse.FromString,
                 _registered_method=True)
+        self.FingerHint = channel.unary_unary(
+                '/chord.Chord/FingerHint',
+                request_serializer=chord__pb2.FingerHintRequest.SerializeToString,
+                response_deserializer=chord__pb2.FingerHintResponse.FromString,
+                _registered_method=True)
         self.FixFingers = channel.unary_unary(
                 '/chord.Chord/FixFingers',
                 request_serializer=chord__pb2.FixFingersRequest.SerializeToString,
@@ -94,6 +109,51 @@ class ChordStub(object):
                 request_serializer=chord__pb2.RemoveInfoRequest.SerializeToString,
                 response_deserializer=chord__pb2.RemoveInfoResponse.FromString,
                 _registered_method=True)
+        self.AddRedundantInformation = channel.unary_unary(
+                '/chord.Chord/AddRedundantInformation',
+                request_serializer=chord__pb2.AddInfoRequest.SerializeToString,
+                response_deserializer=chord__pb2.AddInfoResponse.FromString,
+                _registered_method=True)
+        self.RemoveRedundantInformation = channel.unary_unary(
+                '/chord.Chord/RemoveRedundantInformation',
+                request_serializer=chord__pb2.RemoveInfoRequest.SerializeToString,
+                response_deserializer=chord__pb2.RemoveInfoResponse.FromString,
+                _registered_method=True)
+        self.AddRedundantMany = channel.unary_unary(
+                '/chord.Chord/AddRedundantMany',
+                request_serializer=chord__pb2.PutManyRequest.SerializeToString,
+                response_deserializer=chord__pb2.AddInfoResponse.FromString,
+                _registered_method=True)
+        self.GetMany = channel.unary_unary(
+                '/chord.Chord/GetMany',
+                request_serializer=chord__pb2.GetManyRequest.SerializeToString,
+                response_deserializer=chord__pb2.GetManyResponse.FromString,
+                _registered_method=True)
+        self.PutMany = channel.unary_unary(
+                '/chord.Chord/PutMany',
+                request_serializer=chord__pb2.PutManyRequest.SerializeToString,
+                response_deserializer=chord__pb2.PutManyResponse.FromString,
+                _registered_method=True)
+        self.DeleteMany = channel.unary_unary(
+                '/chord.Chord/DeleteMany',
+                request_serializer=chord__pb2.DeleteManyRequest.SerializeToString,
+                response_deserializer=chord__pb2.DeleteManyResponse.FromString,
+                _registered_method=True)
+        self.Handoff = channel.stream_unary(
+                '/chord.Chord/Handoff',
+                request_serializer=chord__pb2.HandoffChunk.SerializeToString,
+                response_deserializer=chord__pb2.HandoffResponse.FromString,
+                _registered_method=True)
+        self.GetHandoffCursor = channel.unary_unary(
+                '/chord.Chord/GetHandoffCursor',
+                request_serializer=chord__pb2.HandoffCursorRequest.SerializeToString,
+                response_deserializer=chord__pb2.HandoffCursorResponse.FromString,
+                _registered_method=True)
+        self.RequestHandoff = channel.unary_unary(
+                '/chord.Chord/RequestHandoff',
+                request_serializer=chord__pb2.RequestHandoffRequest.SerializeToString,
+                response_deserializer=chord__pb2.RequestHandoffResponse.FromString,
+                _registered_method=True)
         self.GetNodeInformation = channel.unary_unary(
                 '/chord.Chord/GetNodeInformation',
                 request_serializer=chord__pb2.GetNodeInfoRequest.SerializeToString,
@@ -114,6 +174,11 @@ class ChordStub(object):
                 request_serializer=chord__pb2.LogsRequest.SerializeToString,
                 response_deserializer=chord__pb2.LogsResponse.FromString,
                 _registered_method=True)
+        self.StreamLogs = channel.unary_stream(
+                '/chord.Chord/StreamLogs',
+                request_serializer=chord__pb2.StreamLogsRequest.SerializeToString,
+                response_deserializer=chord__pb2.LogChunk.FromString,
+                _registered_method=True)
 
 
 class ChordServicer(object):
@@ -125,12 +190,24 @@ class ChordServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FindNextHop(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FindPredecessor(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetRoutingState(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SetSuccessor(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -155,6 +232,12 @@ class ChordServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FingerHint(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FixFingers(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -191,6 +274,60 @@ class ChordServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AddRedundantInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RemoveRedundantInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddRedundantMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PutMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Handoff(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetHandoffCursor(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RequestHandoff(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetNodeInformation(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -215,6 +352,12 @@ class ChordServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamLogs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ChordServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -223,11 +366,21 @@ def add_ChordServicer_to_server(servicer, server):
                     request_deserializer=chord__pb2.FindSuccessorRequest.FromString,
                     response_serializer=chord__pb2.FindSuccessorResponse.SerializeToString,
             ),
+            'FindNextHop': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindNextHop,
+                    request_deserializer=chord__pb2.FindNextHopRequest.FromString,
+                    response_serializer=chord__pb2.FindNextHopResponse.SerializeToString,
+            ),
             'FindPredecessor': grpc.unary_unary_rpc_method_handler(
                     servicer.FindPredecessor,
                     request_deserializer=chord__pb2.FindPredecessorRequest.FromString,
                     response_serializer=chord__pb2.FindPredecessorResponse.SerializeToString,
             ),
+            'GetRoutingState': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRoutingState,
+                    request_deserializer=chord__pb2.GetRoutingStateRequest.FromString,
+                    response_serializer=chord__pb2.GetRoutingStateResponse.SerializeToString,
+            ),
             'SetSuccessor': grpc.unary_unary_rpc_method_handler(
                     servicer.SetSuccessor,
                     request_deserializer=chord__pb2.SetSuccessorRequest.FromString,
@@ -248,6 +401,11 @@ def add_ChordServicer_to_server(servicer, server):
                     request_deserializer=chord__pb2.UpdateFingerTableRequest.FromString,
                     response_serializer=chord__pb2.UpdateFingerTableResponse.SerializeToString,
             ),
+            'FingerHint': grpc.unary_unary_rpc_method_handler(
+                    servicer.FingerHint,
+                    request_deserializer=chord__pb2.FingerHintRequest.FromString,
+                    response_serializer=chord__pb2.FingerHintResponse.SerializeToString,
+            ),
             'FixFingers': grpc.unary_unary_rpc_method_handler(
                     servicer.FixFingers,
                     request_deserializer=chord__pb2.FixFingersRequest.FromString,
@@ -278,6 +436,51 @@ def add_ChordServicer_to_server(servicer, server):
                     request_deserializer=chord__pb2.RemoveInfoRequest.FromString,
                     response_serializer=chord__pb2.RemoveInfoResponse.SerializeToString,
             ),
+            'AddRedundantInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddRedundantInformation,
+                    request_deserializer=chord__pb2.AddInfoRequest.FromString,
+                    response_serializer=chord__pb2.AddInfoResponse.SerializeToString,
+            ),
+            'RemoveRedundantInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.RemoveRedundantInformation,
+                    request_deserializer=chord__pb2.RemoveInfoRequest.FromString,
+                    response_serializer=chord__pb2.RemoveInfoResponse.SerializeToString,
+            ),
+            'AddRedundantMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddRedundantMany,
+                    request_deserializer=chord__pb2.PutManyRequest.FromString,
+                    response_serializer=chord__pb2.AddInfoResponse.SerializeToString,
+            ),
+            'GetMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMany,
+                    request_deserializer=chord__pb2.GetManyRequest.FromString,
+                    response_serializer=chord__pb2.GetManyResponse.SerializeToString,
+            ),
+            'PutMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.PutMany,
+                    request_deserializer=chord__pb2.PutManyRequest.FromString,
+                    response_serializer=chord__pb2.PutManyResponse.SerializeToString,
+            ),
+            'DeleteMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteMany,
+                    request_deserializer=chord__pb2.DeleteManyRequest.FromString,
+                    response_serializer=chord__pb2.DeleteManyResponse.SerializeToString,
+            ),
+            'Handoff': grpc.stream_unary_rpc_method_handler(
+                    servicer.Handoff,
+                    request_deserializer=chord__pb2.HandoffChunk.FromString,
+                    response_serializer=chord__pb2.HandoffResponse.SerializeToString,
+            ),
+            'GetHandoffCursor': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetHandoffCursor,
+                    request_deserializer=chord__pb2.HandoffCursorRequest.FromString,
+                    response_serializer=chord__pb2.HandoffCursorResponse.SerializeToString,
+            ),
+            'RequestHandoff': grpc.unary_unary_rpc_method_handler(
+                    servicer.RequestHandoff,
+                    request_deserializer=chord__pb2.RequestHandoffRequest.FromString,
+                    response_serializer=chord__pb2.RequestHandoffResponse.SerializeToString,
+            ),
             'GetNodeInformation': grpc.unary_unary_rpc_method_handler(
                     servicer.GetNodeInformation,
                     request_deserializer=chord__pb2.GetNodeInfoRequest.FromString,
@@ -298,6 +501,11 @@ def add_ChordServicer_to_server(servicer, server):
                     request_deserializer=chord__pb2.LogsRequest.FromString,
                     response_serializer=chord__pb2.LogsResponse.SerializeToString,
             ),
+            'StreamLogs': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamLogs,
+                    request_deserializer=chord__pb2.StreamLogsRequest.FromString,
+                    response_serializer=chord__pb2.LogChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'chord.Chord', rpc_method_handlers)
@@ -336,6 +544,33 @@ class Chord(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def FindNextHop(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/FindNextHop',
+            chord__pb2.FindNextHopRequest.SerializeToString,
+            chord__pb2.FindNextHopResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def FindPredecessor(request,
             target,
@@ -363,6 +598,33 @@ class Chord(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetRoutingState(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/GetRoutingState',
+            chord__pb2.GetRoutingStateRequest.SerializeToString,
+            chord__pb2.GetRoutingStateResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SetSuccessor(request,
             target,
@@ -471,6 +733,33 @@ class Chord(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def FingerHint(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/FingerHint',
+            chord__pb2.FingerHintRequest.SerializeToString,
+            chord__pb2.FingerHintResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def FixFingers(request,
             target,
@@ -633,6 +922,249 @@ class Chord(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def AddRedundantInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/AddRedundantInformation',
+            chord__pb2.AddInfoRequest.SerializeToString,
+            chord__pb2.AddInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RemoveRedundantInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/RemoveRedundantInformation',
+            chord__pb2.RemoveInfoRequest.SerializeToString,
+            chord__pb2.RemoveInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddRedundantMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/AddRedundantMany',
+            chord__pb2.PutManyRequest.SerializeToString,
+            chord__pb2.AddInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/GetMany',
+            chord__pb2.GetManyRequest.SerializeToString,
+            chord__pb2.GetManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PutMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/PutMany',
+            chord__pb2.PutManyRequest.SerializeToString,
+            chord__pb2.PutManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/DeleteMany',
+            chord__pb2.DeleteManyRequest.SerializeToString,
+            chord__pb2.DeleteManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Handoff(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/chord.Chord/Handoff',
+            chord__pb2.HandoffChunk.SerializeToString,
+            chord__pb2.HandoffResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetHandoffCursor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/GetHandoffCursor',
+            chord__pb2.HandoffCursorRequest.SerializeToString,
+            chord__pb2.HandoffCursorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RequestHandoff(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.Chord/RequestHandoff',
+            chord__pb2.RequestHandoffRequest.SerializeToString,
+            chord__pb2.RequestHandoffResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetNodeInformation(request,
             target,
@@ -740,3 +1272,30 @@ class Chord(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamLogs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chord.Chord/StreamLogs',
+            chord__pb2.StreamLogsRequest.SerializeToString,
+            chord__pb2.LogChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
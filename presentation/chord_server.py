@@ -108,6 +108,8 @@
 #     server.wait_for_termination()
 
 
+import threading
+import time
 from concurrent import futures
 
 import grpc
@@ -116,36 +118,72 @@ from business.node import Node
 from business.node_network_interface import NodeNetworkInterface
 from . import chord_pb2_grpc
 from . import chord_pb2
+from . import chord_v2_pb2_grpc
 from presentation.chord_pb2_grpc import ChordServicer
+from presentation.channel_pool import SERVER_KEEPALIVE_OPTIONS
+from presentation.chord_v2_server import ChordV2Server
+from presentation.instrumentation import RpcMetrics, ServerMetricsInterceptor, node_stats_response
+from presentation.log_stream import FOLLOW_INTERVAL, MAX_FOLLOWERS, LogStream
+from presentation.node_router import NodeRouter
 
 
-class ChordServer(ChordServicer):
+class ChordServer(ChordServicer, NodeRouter):
 
-    def __init__(self, node: Node):
-        self.node = node
+    def __init__(self, node: Node, virtual_nodes: list[Node] | None = None):
+        NodeRouter.__init__(self, node, virtual_nodes)
+        self.followers = threading.BoundedSemaphore(MAX_FOLLOWERS)
 
     def FindSuccessor(self, request, context):
-        successor = self.node.find_successor(int(request.key))
+        node = self.route(request.target_id, context)
+        successor = node.find_successor(int(request.key), coalesce=False)
         return chord_pb2.FindSuccessorResponse(successor_id=str(successor))
 
+    def FindNextHop(self, request, context):
+        node = self.route(request.target_id, context)
+        next_hop, done = node.find_next_hop(int(request.key))
+        return chord_pb2.FindNextHopResponse(next_hop_id=str(next_hop), done=done)
+
     def FindPredecessor(self, request, context):
-        predecessor = self.node.predecessor
+        node = self.route(request.target_id, context)
+        routing = node.routing
+        predecessor = routing.predecessor
         if predecessor is None:
-            predecessor = self.node.node_id
-        return chord_pb2.FindPredecessorResponse(predecessor_id=str(predecessor))
+            predecessor = node.node_id
+        return chord_pb2.FindPredecessorResponse(predecessor_id=str(predecessor),
+                                                 successor_list=[str(n) for n in routing.successor_list])
+
+    def GetRoutingState(self, request, context):
+        node = self.route(request.target_id, context)
+        routing = node.routing
+        return chord_pb2.GetRoutingStateResponse(node_id=str(node.node_id), predecessor_id=str(routing.predecessor),
+                                                 successor_list=[str(n) for n in routing.successor_list],
+                                                 finger_table=[str(n) for n in routing.finger_table])
+
+    def SetSuccessor(self, request, context):
+        node = self.route(request.target_id, context)
+        node.set_successor(int(request.new_successor_id))
+        return chord_pb2.SetSuccessorResponse()
 
     def SetPredecessor(self, request, context):
-        self.node.predecessor = int(request.new_predecessor_id)
+        node = self.route(request.target_id, context)
+        node.set_predecessor(int(request.new_predecessor_id))
         return chord_pb2.SetPredecessorResponse()
 
     def Notify(self, request, context):
-        self.node.notify(int(request.sender_id))
-        return chord_pb2.NotifyResponse()
+        node = self.route(request.target_id, context)
+        node.notify(int(request.sender_id))
+        return chord_pb2.NotifyResponse(successor_list=[str(n) for n in node.successor_list])
 
     def UpdateFingerTable(self, request, context):
-        self.node.update_finger_table(int(request.new_node_id), int(request.index))
+        node = self.route(request.target_id, context)
+        node.update_finger_table(int(request.new_node_id), int(request.index))
         return chord_pb2.UpdateFingerTableResponse()
 
+    def FingerHint(self, request, context):
+        node = self.route(request.target_id, context)
+        node.finger_hint(int(request.new_node_id), request.hops)
+        return chord_pb2.FingerHintResponse()
+
     def FixFingers(self, request, context):
         self.node.fix_fingers()
         return chord_pb2.FixFingersResponse()
@@ -155,56 +193,133 @@ class ChordServer(ChordServicer):
         return chord_pb2.StabilizeResponse()
 
     def GetInformation(self, request, context):
-        info = self.node.node_has_info(int(request.key))
+        node = self.route(request.target_id, context)
+        info = node.node_has_info(int(request.key))
         return chord_pb2.GetInfoResponse(information=info if info is not None else "None")
 
     def AddInformation(self, request, context):
-        self.node.add_information(int(request.info_key), request.info)
+        node = self.route(request.target_id, context)
+        if not node.add_information(int(request.info_key), request.info):
+            context.abort(grpc.StatusCode.ABORTED, f"Write quorum not reached for key {request.info_key}")
         return chord_pb2.AddInfoResponse()
 
     def RemoveInformation(self, request, context):
-        self.node.remove_info(int(request.info_key))
+        node = self.route(request.target_id, context)
+        node.remove_info(int(request.info_key))
+        return chord_pb2.RemoveInfoResponse()
+
+    def AddRedundantInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        node.add_redundant_info(int(request.info_key), request.info)
+        return chord_pb2.AddInfoResponse()
+
+    def AddRedundantMany(self, request, context):
+        node = self.route(request.target_id, context)
+        node.add_redundant_many({int(line.info_key): line.info_val for line in request.info_line})
+        return chord_pb2.AddInfoResponse()
+
+    def RemoveRedundantInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        node.remove_redundant_info(int(request.info_key))
         return chord_pb2.RemoveInfoResponse()
 
+    def GetMany(self, request, context):
+        node = self.route(request.target_id, context)
+        info = node.get_local_information(int(key) for key in request.keys)
+        info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=v) for k, v in info.items()]
+        return chord_pb2.GetManyResponse(info_line=info_lines)
+
+    def PutMany(self, request, context):
+        node = self.route(request.target_id, context)
+        created = node.add_many_information({int(line.info_key): line.info_val for line in request.info_line})
+        return chord_pb2.PutManyResponse(created_keys=[str(key) for key in created])
+
+    def DeleteMany(self, request, context):
+        node = self.route(request.target_id, context)
+        removed = node.remove_many_information(int(key) for key in request.keys)
+        return chord_pb2.DeleteManyResponse(removed_keys=[str(key) for key in removed])
+
+    def Handoff(self, request_iterator, context):
+        received = 0
+        cursor = None
+        for request in request_iterator:
+            chunk = {int(line.info_key): line.info_val for line in request.info_line}
+            cursor = self.route(request.target_id, context).receive_handoff(request.session_id, chunk)
+            received += len(chunk)
+        return chord_pb2.HandoffResponse(cursor=str(cursor) if cursor is not None else "", received=received)
+
+    def GetHandoffCursor(self, request, context):
+        node = self.route(request.target_id, context)
+        cursor = node.get_handoff_cursor(request.session_id)
+        return chord_pb2.HandoffCursorResponse(cursor=str(cursor) if cursor is not None else "")
+
+    def RequestHandoff(self, request, context):
+        node = self.route(request.target_id, context)
+        accepted = node.serve_handoff(int(request.requester_id), int(request.start), int(request.end))
+        return chord_pb2.RequestHandoffResponse(completed=accepted)
+
     def GetNodeInformation(self, request, context):
-        node_info = self.node.get_node_info()
+        node = self.route(request.target_id, context)
+        node_info = node.get_node_info()
 
         finger_table = [
             chord_pb2.FingerEntry(index=str(k), finger_val=str(v))
             for k, v in node_info["finger_table"].items()
         ]
 
-        return chord_pb2.GetNodeInfoResponse(node_id=str(self.node.node_id),
+        return chord_pb2.GetNodeInfoResponse(node_id=str(node.node_id),
                                              successor=str(node_info["successor"]),
                                              predecessor=str(node_info["predecessor"]),
-                                             finger_table=finger_table)
+                                             finger_table=finger_table,
+                                             successor_list=[str(n) for n in node_info["successor_list"]])
 
     def GetNodeStats(self, request, context):
-        node_stats = self.node.get_stats()
-        return chord_pb2.GetNodeStatsResponse(fixes=str(node_stats['fixes']),
-                                              stabilization=str(node_stats['stabilization']),
-                                              lookups=str(node_stats['lookups']),
-                                              join_time=str(node_stats['join_time']))
+        return node_stats_response(self.route(request.target_id, context))
 
     def GetLogs(self, request, context):
-        logs = self.node.get_logs()
+        logs = self.node.get_logs(request.max_lines or 1000)
 
         return chord_pb2.LogsResponse(log_line=logs)
 
+    def StreamLogs(self, request, context):
+        try:
+            stream = LogStream(self.node.log_reader, request)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        if stream.follow and not self.followers.acquire(blocking=False):
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"At most {MAX_FOLLOWERS} log followers at a time")
+        try:
+            yield from stream.first()
+            # a follower holds one server thread until the client goes away
+            while stream.follow and context.is_active():
+                time.sleep(FOLLOW_INTERVAL)
+                yield from stream.poll()
+        finally:
+            if stream.follow:
+                self.followers.release()
+
     def GetAllNodeInfo(self, request, context):
-        info = self.node.get_all_node_info()
+        node = self.route(request.target_id, context)
+        info = node.get_all_node_info()
 
         info_lines = [
-            chord_pb2.InfoLine(info_key=str(i), info_val=str(v))
-            for i, v in enumerate(info)
+            chord_pb2.InfoLine(info_key=str(k), info_val=str(v))
+            for k, v in info.items()
         ]
         return chord_pb2.GetAllInfoResponse(info_line=info_lines)
 
 
-def serve(node, port):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(node), server)
+def start_server(node, port, virtual_nodes: list[Node] | None = None) -> grpc.Server:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10),
+                         interceptors=[ServerMetricsInterceptor(RpcMetrics('server', node.metrics))],
+                         options=SERVER_KEEPALIVE_OPTIONS)
+    chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(node, virtual_nodes), server)
+    chord_v2_pb2_grpc.add_ChordV2Servicer_to_server(ChordV2Server(node, virtual_nodes), server)
     server.add_insecure_port(f'[::]:{port}')
     server.start()
     print(f'Node {node.node_id} gRPC Server running on port {port}')
-    server.wait_for_termination()
+    return server
+
+
+def serve(node, port, virtual_nodes: list[Node] | None = None):
+    start_server(node, port, virtual_nodes).wait_for_termination()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: chord_v2.proto
+# Protobuf Python Version: 6.31.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    0,
+    '',
+    'chord_v2.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x63hord_v2.proto\x12\x08\x63hord.v2\"6\n\x14\x46indSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0b\n\x03key\x18\x02 \x01(\x0c\"C\n\x15\x46indSuccessorResponse\x12\x19\n\x0csuccessor_id\x18\x01 \x01(\x0cH\x00\x88\x01\x01\x42\x0f\n\r_successor_id\"4\n\x12\x46indNextHopRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0b\n\x03key\x18\x02 \x01(\x0c\"8\n\x13\x46indNextHopResponse\x12\x13\n\x0bnext_hop_id\x18\x01 \x01(\x0c\x12\x0c\n\x04\x64one\x18\x02 \x01(\x08\"+\n\x16\x46indPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\"a\n\x17\x46indPredecessorResponse\x12\x1b\n\x0epredecessor_id\x18\x01 \x01(\x0cH\x00\x88\x01\x01\x12\x16\n\x0esuccessor_list\x18\x02 \x03(\x0c\x42\x11\n\x0f_predecessor_id\"\\\n\x13SetSuccessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x1d\n\x10new_successor_id\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x13\n\x11_new_successor_id\"\x16\n\x14SetSuccessorResponse\"b\n\x15SetPredecessorRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x1f\n\x12new_predecessor_id\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x15\n\x13_new_predecessor_id\"\x18\n\x16SetPredecessorResponse\"5\n\rNotifyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x11\n\tsender_id\x18\x02 \x01(\x0c\"(\n\x0eNotifyResponse\x12\x16\n\x0esuccessor_list\x18\x01 \x03(\x0c\"Q\n\x18UpdateFingerTableRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x13\n\x0bnew_node_id\x18\x02 \x01(\x0c\x12\r\n\x05index\x18\x03 \x01(\r\"\x1b\n\x19UpdateFingerTableResponse\"0\n\x0eGetInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0b\n\x03key\x18\x02 \x01(\x0c\";\n\x0fGetInfoResponse\x12\x18\n\x0binformation\x18\x01 \x01(\x0cH\x00\x88\x01\x01\x42\x0e\n\x0c_information\"E\n\x0e\x41\x64\x64InfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0b\n\x03key\x18\x02 \x01(\x0c\x12\x13\n\x0binformation\x18\x03 \x01(\x0c\"\x11\n\x0f\x41\x64\x64InfoResponse\"3\n\x11RemoveInfoRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0b\n\x03key\x18\x02 \x01(\x0c\"\x14\n\x12RemoveInfoResponse\"#\n\x05\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\"1\n\x0eGetManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\x0c\"3\n\x0fGetManyResponse\x12 \n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x0f.chord.v2.Entry\"E\n\x0ePutManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12 \n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x0f.chord.v2.Entry\"\'\n\x0fPutManyResponse\x12\x14\n\x0c\x63reated_keys\x18\x01 \x03(\x0c\"4\n\x11\x44\x65leteManyRequest\x12\x11\n\ttarget_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\x0c\"*\n\x12\x44\x65leteManyResponse\x12\x14\n\x0cremoved_keys\x18\x01 \x03(\x0c\x32\xd7\t\n\x07\x43hordV2\x12P\n\rFindSuccessor\x12\x1e.chord.v2.FindSuccessorRequest\x1a\x1f.chord.v2.FindSuccessorResponse\x12J\n\x0b\x46indNextHop\x12\x1c.chord.v2.FindNextHopRequest\x1a\x1d.chord.v2.FindNextHopResponse\x12V\n\x0f\x46indPredecessor\x12 .chord.v2.FindPredecessorRequest\x1a!.chord.v2.FindPredecessorResponse\x12M\n\x0cSetSuccessor\x12\x1d.chord.v2.SetSuccessorRequest\x1a\x1e.chord.v2.SetSuccessorResponse\x12S\n\x0eSetPredecessor\x12\x1f.chord.v2.SetPredecessorRequest\x1a .chord.v2.SetPredecessorResponse\x12;\n\x06Notify\x12\x17.chord.v2.NotifyRequest\x1a\x18.chord.v2.NotifyResponse\x12\\\n\x11UpdateFingerTable\x12\".chord.v2.UpdateFingerTableRequest\x1a#.chord.v2.UpdateFingerTableResponse\x12\x45\n\x0eGetInformation\x12\x18.chord.v2.GetInfoRequest\x1a\x19.chord.v2.GetInfoResponse\x12\x45\n\x0e\x41\x64\x64Information\x12\x18.chord.v2.AddInfoRequest\x1a\x19.chord.v2.AddInfoResponse\x12N\n\x11RemoveInformation\x12\x1b.chord.v2.RemoveInfoRequest\x1a\x1c.chord.v2.RemoveInfoResponse\x12N\n\x17\x41\x64\x64RedundantInformation\x12\x18.chord.v2.AddInfoRequest\x1a\x19.chord.v2.AddInfoResponse\x12W\n\x1aRemoveRedundantInformation\x12\x1b.chord.v2.RemoveInfoRequest\x1a\x1c.chord.v2.RemoveInfoResponse\x12G\n\x10\x41\x64\x64RedundantMany\x12\x18.chord.v2.PutManyRequest\x1a\x19.chord.v2.AddInfoResponse\x12>\n\x07GetMany\x12\x18.chord.v2.GetManyRequest\x1a\x19.chord.v2.GetManyResponse\x12>\n\x07PutMany\x12\x18.chord.v2.PutManyRequest\x1a\x19.chord.v2.PutManyResponse\x12G\n\nDeleteMany\x12\x1b.chord.v2.DeleteManyRequest\x1a\x1c.chord.v2.DeleteManyResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chord_v2_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_FINDSUCCESSORREQUEST']._serialized_start=28
+  _globals['_FINDSUCCESSORREQUEST']._serialized_end=82
+  _globals['_FINDSUCCESSORRESPONSE']._serialized_start=84
+  _globals['_FINDSUCCESSORRESPONSE']._serialized_end=151
+  _globals['_FINDNEXTHOPREQUEST']._serialized_start=153
+  _globals['_FINDNEXTHOPREQUEST']._serialized_end=205
+  _globals['_FINDNEXTHOPRESPONSE']._serialized_start=207
+  _globals['_FINDNEXTHOPRESPONSE']._serialized_end=263
+  _globals['_FINDPREDECESSORREQUEST']._serialized_start=265
+  _globals['_FINDPREDECESSORREQUEST']._serialized_end=308
+  _globals['_FINDPREDECESSORRESPONSE']._serialized_start=310
+  _globals['_FINDPREDECESSORRESPONSE']._serialized_end=407
+  _globals['_SETSUCCESSORREQUEST']._serialized_start=409
+  _globals['_SETSUCCESSORREQUEST']._serialized_end=501
+  _globals['_SETSUCCESSORRESPONSE']._serialized_start=503
+  _globals['_SETSUCCESSORRESPONSE']._serialized_end=525
+  _globals['_SETPREDECESSORREQUEST']._serialized_start=527
+  _globals['_SETPREDECESSORREQUEST']._serialized_end=625
+  _globals['_SETPREDECESSORRESPONSE']._serialized_start=627
+  _globals['_SETPREDECESSORRESPONSE']._serialized_end=651
+  _globals['_NOTIFYREQUEST']._serialized_start=653
+  _globals['_NOTIFYREQUEST']._serialized_end=706
+  _globals['_NOTIFYRESPONSE']._serialized_start=708
+  _globals['_NOTIFYRESPONSE']._serialized_end=748
+  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_start=750
+  _globals['_UPDATEFINGERTABLEREQUEST']._serialized_end=831
+  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_start=833
+  _globals['_UPDATEFINGERTABLERESPONSE']._serialized_end=860
+  _globals['_GETINFOREQUEST']._serialized_start=862
+  _globals['_GETINFOREQUEST']._serialized_end=910
+  _globals['_GETINFORESPONSE']._serialized_start=912
+  _globals['_GETINFORESPONSE']._serialized_end=971
+  _globals['_ADDINFOREQUEST']._serialized_start=973
+  _globals['_ADDINFOREQUEST']._serialized_end=1042
+  _globals['_ADDINFORESPONSE']._serialized_start=1044
+  _globals['_ADDINFORESPONSE']._serialized_end=1061
+  _globals['_REMOVEINFOREQUEST']._serialized_start=1063
+  _globals['_REMOVEINFOREQUEST']._serialized_end=1114
+  _globals['_REMOVEINFORESPONSE']._serialized_start=1116
+  _globals['_REMOVEINFORESPONSE']._serialized_end=1136
+  _globals['_ENTRY']._serialized_start=1138
+  _globals['_ENTRY']._serialized_end=1173
+  _globals['_GETMANYREQUEST']._serialized_start=1175
+  _globals['_GETMANYREQUEST']._serialized_end=1224
+  _globals['_GETMANYRESPONSE']._serialized_start=1226
+  _globals['_GETMANYRESPONSE']._serialized_end=1277
+  _globals['_PUTMANYREQUEST']._serialized_start=1279
+  _globals['_PUTMANYREQUEST']._serialized_end=1348
+  _globals['_PUTMANYRESPONSE']._serialized_start=1350
+  _globals['_PUTMANYRESPONSE']._serialized_end=1389
+  _globals['_DELETEMANYREQUEST']._serialized_start=1391
+  _globals['_DELETEMANYREQUEST']._serialized_end=1443
+  _globals['_DELETEMANYRESPONSE']._serialized_start=1445
+  _globals['_DELETEMANYRESPONSE']._serialized_end=1487
+  _globals['_CHORDV2']._serialized_start=1490
+  _globals['_CHORDV2']._serialized_end=2729
+# @@protoc_insertion_point(module_scope)
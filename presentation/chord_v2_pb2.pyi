@@ -0,0 +1,193 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class FindSuccessorRequest(_message.Message):
+    __slots__ = ("target_id", "key")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    key: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., key: _Optional[bytes] = ...) -> None: ...
+
+class FindSuccessorResponse(_message.Message):
+    __slots__ = ("successor_id",)
+    SUCCESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    successor_id: bytes
+    def __init__(self, successor_id: _Optional[bytes] = ...) -> None: ...
+
+class FindNextHopRequest(_message.Message):
+    __slots__ = ("target_id", "key")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    key: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., key: _Optional[bytes] = ...) -> None: ...
+
+class FindNextHopResponse(_message.Message):
+    __slots__ = ("next_hop_id", "done")
+    NEXT_HOP_ID_FIELD_NUMBER: _ClassVar[int]
+    DONE_FIELD_NUMBER: _ClassVar[int]
+    next_hop_id: bytes
+    done: bool
+    def __init__(self, next_hop_id: _Optional[bytes] = ..., done: bool = ...) -> None: ...
+
+class FindPredecessorRequest(_message.Message):
+    __slots__ = ("target_id",)
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    def __init__(self, target_id: _Optional[bytes] = ...) -> None: ...
+
+class FindPredecessorResponse(_message.Message):
+    __slots__ = ("predecessor_id", "successor_list")
+    PREDECESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
+    predecessor_id: bytes
+    successor_list: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, predecessor_id: _Optional[bytes] = ..., successor_list: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class SetSuccessorRequest(_message.Message):
+    __slots__ = ("target_id", "new_successor_id")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    NEW_SUCCESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    new_successor_id: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., new_successor_id: _Optional[bytes] = ...) -> None: ...
+
+class SetSuccessorResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class SetPredecessorRequest(_message.Message):
+    __slots__ = ("target_id", "new_predecessor_id")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    NEW_PREDECESSOR_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    new_predecessor_id: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., new_predecessor_id: _Optional[bytes] = ...) -> None: ...
+
+class SetPredecessorResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class NotifyRequest(_message.Message):
+    __slots__ = ("target_id", "sender_id")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    SENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    sender_id: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., sender_id: _Optional[bytes] = ...) -> None: ...
+
+class NotifyResponse(_message.Message):
+    __slots__ = ("successor_list",)
+    SUCCESSOR_LIST_FIELD_NUMBER: _ClassVar[int]
+    successor_list: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, successor_list: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class UpdateFingerTableRequest(_message.Message):
+    __slots__ = ("target_id", "new_node_id", "index")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    NEW_NODE_ID_FIELD_NUMBER: _ClassVar[int]
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    new_node_id: bytes
+    index: int
+    def __init__(self, target_id: _Optional[bytes] = ..., new_node_id: _Optional[bytes] = ..., index: _Optional[int] = ...) -> None: ...
+
+class UpdateFingerTableResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class GetInfoRequest(_message.Message):
+    __slots__ = ("target_id", "key")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    key: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., key: _Optional[bytes] = ...) -> None: ...
+
+class GetInfoResponse(_message.Message):
+    __slots__ = ("information",)
+    INFORMATION_FIELD_NUMBER: _ClassVar[int]
+    information: bytes
+    def __init__(self, information: _Optional[bytes] = ...) -> None: ...
+
+class AddInfoRequest(_message.Message):
+    __slots__ = ("target_id", "key", "information")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    INFORMATION_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    key: bytes
+    information: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., key: _Optional[bytes] = ..., information: _Optional[bytes] = ...) -> None: ...
+
+class AddInfoResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class RemoveInfoRequest(_message.Message):
+    __slots__ = ("target_id", "key")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    key: bytes
+    def __init__(self, target_id: _Optional[bytes] = ..., key: _Optional[bytes] = ...) -> None: ...
+
+class RemoveInfoResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class Entry(_message.Message):
+    __slots__ = ("key", "value")
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    key: bytes
+    value: bytes
+    def __init__(self, key: _Optional[bytes] = ..., value: _Optional[bytes] = ...) -> None: ...
+
+class GetManyRequest(_message.Message):
+    __slots__ = ("target_id", "keys")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEYS_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    keys: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, target_id: _Optional[bytes] = ..., keys: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class GetManyResponse(_message.Message):
+    __slots__ = ("entries",)
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    entries: _containers.RepeatedCompositeFieldContainer[Entry]
+    def __init__(self, entries: _Optional[_Iterable[_Union[Entry, _Mapping]]] = ...) -> None: ...
+
+class PutManyRequest(_message.Message):
+    __slots__ = ("target_id", "entries")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    entries: _containers.RepeatedCompositeFieldContainer[Entry]
+    def __init__(self, target_id: _Optional[bytes] = ..., entries: _Optional[_Iterable[_Union[Entry, _Mapping]]] = ...) -> None: ...
+
+class PutManyResponse(_message.Message):
+    __slots__ = ("created_keys",)
+    CREATED_KEYS_FIELD_NUMBER: _ClassVar[int]
+    created_keys: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, created_keys: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class DeleteManyRequest(_message.Message):
+    __slots__ = ("target_id", "keys")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    KEYS_FIELD_NUMBER: _ClassVar[int]
+    target_id: bytes
+    keys: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, target_id: _Optional[bytes] = ..., keys: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class DeleteManyResponse(_message.Message):
+    __slots__ = ("removed_keys",)
+    REMOVED_KEYS_FIELD_NUMBER: _ClassVar[int]
+    removed_keys: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, removed_keys: _Optional[_Iterable[bytes]] = ...) -> None: ...
@@ -0,0 +1,748 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import chord_v2_pb2 as chord__v2__pb2
+
+GRPC_GENERATED_VERSION = '1.73.1'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in chord_v2_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ChordV2Stub(object):
+    """Ring identifiers (node ids and keys) are unsigned big-endian integers in bytes fields, so the
+    same message layout works for any identifier width m.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.FindSuccessor = channel.unary_unary(
+                '/chord.v2.ChordV2/FindSuccessor',
+                request_serializer=chord__v2__pb2.FindSuccessorRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.FindSuccessorResponse.FromString,
+                _registered_method=True)
+        self.FindNextHop = channel.unary_unary(
+                '/chord.v2.ChordV2/FindNextHop',
+                request_serializer=chord__v2__pb2.FindNextHopRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.FindNextHopResponse.FromString,
+                _registered_method=True)
+        self.FindPredecessor = channel.unary_unary(
+                '/chord.v2.ChordV2/FindPredecessor',
+                request_serializer=chord__v2__pb2.FindPredecessorRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.FindPredecessorResponse.FromString,
+                _registered_method=True)
+        self.SetSuccessor = channel.unary_unary(
+                '/chord.v2.ChordV2/SetSuccessor',
+                request_serializer=chord__v2__pb2.SetSuccessorRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.SetSuccessorResponse.FromString,
+                _registered_method=True)
+        self.SetPredecessor = channel.unary_unary(
+                '/chord.v2.ChordV2/SetPredecessor',
+                request_serializer=chord__v2__pb2.SetPredecessorRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.SetPredecessorResponse.FromString,
+                _registered_method=True)
+        self.Notify = channel.unary_unary(
+                '/chord.v2.ChordV2/Notify',
+                request_serializer=chord__v2__pb2.NotifyRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.NotifyResponse.FromString,
+                _registered_method=True)
+        self.UpdateFingerTable = channel.unary_unary(
+                '/chord.v2.ChordV2/UpdateFingerTable',
+                request_serializer=chord__v2__pb2.UpdateFingerTableRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.UpdateFingerTableResponse.FromString,
+                _registered_method=True)
+        self.GetInformation = channel.unary_unary(
+                '/chord.v2.ChordV2/GetInformation',
+                request_serializer=chord__v2__pb2.GetInfoRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.GetInfoResponse.FromString,
+                _registered_method=True)
+        self.AddInformation = channel.unary_unary(
+                '/chord.v2.ChordV2/AddInformation',
+                request_serializer=chord__v2__pb2.AddInfoRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.AddInfoResponse.FromString,
+                _registered_method=True)
+        self.RemoveInformation = channel.unary_unary(
+                '/chord.v2.ChordV2/RemoveInformation',
+                request_serializer=chord__v2__pb2.RemoveInfoRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.RemoveInfoResponse.FromString,
+                _registered_method=True)
+        self.AddRedundantInformation = channel.unary_unary(
+                '/chord.v2.ChordV2/AddRedundantInformation',
+                request_serializer=chord__v2__pb2.AddInfoRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.AddInfoResponse.FromString,
+                _registered_method=True)
+        self.RemoveRedundantInformation = channel.unary_unary(
+                '/chord.v2.ChordV2/RemoveRedundantInformation',
+                request_serializer=chord__v2__pb2.RemoveInfoRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.RemoveInfoResponse.FromString,
+                _registered_method=True)
+        self.AddRedundantMany = channel.unary_unary(
+                '/chord.v2.ChordV2/AddRedundantMany',
+                request_serializer=chord__v2__pb2.PutManyRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.AddInfoResponse.FromString,
+                _registered_method=True)
+        self.GetMany = channel.unary_unary(
+                '/chord.v2.ChordV2/GetMany',
+                request_serializer=chord__v2__pb2.GetManyRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.GetManyResponse.FromString,
+                _registered_method=True)
+        self.PutMany = channel.unary_unary(
+                '/chord.v2.ChordV2/PutMany',
+                request_serializer=chord__v2__pb2.PutManyRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.PutManyResponse.FromString,
+                _registered_method=True)
+        self.DeleteMany = channel.unary_unary(
+                '/chord.v2.ChordV2/DeleteMany',
+                request_serializer=chord__v2__pb2.DeleteManyRequest.SerializeToString,
+                response_deserializer=chord__v2__pb2.DeleteManyResponse.FromString,
+                _registered_method=True)
+
+
+class ChordV2Servicer(object):
+    """Ring identifiers (node ids and keys) are unsigned big-endian integers in bytes fields, so the
+    same message layout works for any identifier width m.
+    """
+
+    def FindSuccessor(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FindNextHop(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FindPredecessor(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetSuccessor(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetPredecessor(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Notify(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateFingerTable(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RemoveInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddRedundantInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RemoveRedundantInformation(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddRedundantMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PutMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ChordV2Servicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'FindSuccessor': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindSuccessor,
+                    request_deserializer=chord__v2__pb2.FindSuccessorRequest.FromString,
+                    response_serializer=chord__v2__pb2.FindSuccessorResponse.SerializeToString,
+            ),
+            'FindNextHop': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindNextHop,
+                    request_deserializer=chord__v2__pb2.FindNextHopRequest.FromString,
+                    response_serializer=chord__v2__pb2.FindNextHopResponse.SerializeToString,
+            ),
+            'FindPredecessor': grpc.unary_unary_rpc_method_handler(
+                    servicer.FindPredecessor,
+                    request_deserializer=chord__v2__pb2.FindPredecessorRequest.FromString,
+                    response_serializer=chord__v2__pb2.FindPredecessorResponse.SerializeToString,
+            ),
+            'SetSuccessor': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetSuccessor,
+                    request_deserializer=chord__v2__pb2.SetSuccessorRequest.FromString,
+                    response_serializer=chord__v2__pb2.SetSuccessorResponse.SerializeToString,
+            ),
+            'SetPredecessor': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetPredecessor,
+                    request_deserializer=chord__v2__pb2.SetPredecessorRequest.FromString,
+                    response_serializer=chord__v2__pb2.SetPredecessorResponse.SerializeToString,
+            ),
+            'Notify': grpc.unary_unary_rpc_method_handler(
+                    servicer.Notify,
+                    request_deserializer=chord__v2__pb2.NotifyRequest.FromString,
+                    response_serializer=chord__v2__pb2.NotifyResponse.SerializeToString,
+            ),
+            'UpdateFingerTable': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateFingerTable,
+                    request_deserializer=chord__v2__pb2.UpdateFingerTableRequest.FromString,
+                    response_serializer=chord__v2__pb2.UpdateFingerTableResponse.SerializeToString,
+            ),
+            'GetInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetInformation,
+                    request_deserializer=chord__v2__pb2.GetInfoRequest.FromString,
+                    response_serializer=chord__v2__pb2.GetInfoResponse.SerializeToString,
+            ),
+            'AddInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddInformation,
+                    request_deserializer=chord__v2__pb2.AddInfoRequest.FromString,
+                    response_serializer=chord__v2__pb2.AddInfoResponse.SerializeToString,
+            ),
+            'RemoveInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.RemoveInformation,
+                    request_deserializer=chord__v2__pb2.RemoveInfoRequest.FromString,
+                    response_serializer=chord__v2__pb2.RemoveInfoResponse.SerializeToString,
+            ),
+            'AddRedundantInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddRedundantInformation,
+                    request_deserializer=chord__v2__pb2.AddInfoRequest.FromString,
+                    response_serializer=chord__v2__pb2.AddInfoResponse.SerializeToString,
+            ),
+            'RemoveRedundantInformation': grpc.unary_unary_rpc_method_handler(
+                    servicer.RemoveRedundantInformation,
+                    request_deserializer=chord__v2__pb2.RemoveInfoRequest.FromString,
+                    response_serializer=chord__v2__pb2.RemoveInfoResponse.SerializeToString,
+            ),
+            'AddRedundantMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddRedundantMany,
+                    request_deserializer=chord__v2__pb2.PutManyRequest.FromString,
+                    response_serializer=chord__v2__pb2.AddInfoResponse.SerializeToString,
+            ),
+            'GetMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMany,
+                    request_deserializer=chord__v2__pb2.GetManyRequest.FromString,
+                    response_serializer=chord__v2__pb2.GetManyResponse.SerializeToString,
+            ),
+            'PutMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.PutMany,
+                    request_deserializer=chord__v2__pb2.PutManyRequest.FromString,
+                    response_serializer=chord__v2__pb2.PutManyResponse.SerializeToString,
+            ),
+            'DeleteMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteMany,
+                    request_deserializer=chord__v2__pb2.DeleteManyRequest.FromString,
+                    response_serializer=chord__v2__pb2.DeleteManyResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'chord.v2.ChordV2', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('chord.v2.ChordV2', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ChordV2(object):
+    """Ring identifiers (node ids and keys) are unsigned big-endian integers in bytes fields, so the
+    same message layout works for any identifier width m.
+    """
+
+    @staticmethod
+    def FindSuccessor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/FindSuccessor',
+            chord__v2__pb2.FindSuccessorRequest.SerializeToString,
+            chord__v2__pb2.FindSuccessorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FindNextHop(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/FindNextHop',
+            chord__v2__pb2.FindNextHopRequest.SerializeToString,
+            chord__v2__pb2.FindNextHopResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FindPredecessor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/FindPredecessor',
+            chord__v2__pb2.FindPredecessorRequest.SerializeToString,
+            chord__v2__pb2.FindPredecessorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SetSuccessor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/SetSuccessor',
+            chord__v2__pb2.SetSuccessorRequest.SerializeToString,
+            chord__v2__pb2.SetSuccessorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SetPredecessor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/SetPredecessor',
+            chord__v2__pb2.SetPredecessorRequest.SerializeToString,
+            chord__v2__pb2.SetPredecessorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Notify(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/Notify',
+            chord__v2__pb2.NotifyRequest.SerializeToString,
+            chord__v2__pb2.NotifyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateFingerTable(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/UpdateFingerTable',
+            chord__v2__pb2.UpdateFingerTableRequest.SerializeToString,
+            chord__v2__pb2.UpdateFingerTableResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/GetInformation',
+            chord__v2__pb2.GetInfoRequest.SerializeToString,
+            chord__v2__pb2.GetInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/AddInformation',
+            chord__v2__pb2.AddInfoRequest.SerializeToString,
+            chord__v2__pb2.AddInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RemoveInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/RemoveInformation',
+            chord__v2__pb2.RemoveInfoRequest.SerializeToString,
+            chord__v2__pb2.RemoveInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddRedundantInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/AddRedundantInformation',
+            chord__v2__pb2.AddInfoRequest.SerializeToString,
+            chord__v2__pb2.AddInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RemoveRedundantInformation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/RemoveRedundantInformation',
+            chord__v2__pb2.RemoveInfoRequest.SerializeToString,
+            chord__v2__pb2.RemoveInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddRedundantMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/AddRedundantMany',
+            chord__v2__pb2.PutManyRequest.SerializeToString,
+            chord__v2__pb2.AddInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/GetMany',
+            chord__v2__pb2.GetManyRequest.SerializeToString,
+            chord__v2__pb2.GetManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PutMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/PutMany',
+            chord__v2__pb2.PutManyRequest.SerializeToString,
+            chord__v2__pb2.PutManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chord.v2.ChordV2/DeleteMany',
+            chord__v2__pb2.DeleteManyRequest.SerializeToString,
+            chord__v2__pb2.DeleteManyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
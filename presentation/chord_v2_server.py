@@ -0,0 +1,106 @@
+import grpc
+
+from business.node import Node
+from . import chord_v2_pb2
+from presentation.chord_v2_pb2_grpc import ChordV2Servicer
+from presentation.id_codec import decode_id, encode_id
+from presentation.node_router import NodeRouter
+
+
+class ChordV2Server(ChordV2Servicer, NodeRouter):
+
+    def __init__(self, node: Node, virtual_nodes: list[Node] | None = None):
+        NodeRouter.__init__(self, node, virtual_nodes)
+
+    def FindSuccessor(self, request, context):
+        node = self.route(request.target_id, context)
+        successor = node.find_successor(decode_id(request.key), coalesce=False)
+        if successor is None:
+            return chord_v2_pb2.FindSuccessorResponse()
+        return chord_v2_pb2.FindSuccessorResponse(successor_id=encode_id(successor))
+
+    def FindNextHop(self, request, context):
+        node = self.route(request.target_id, context)
+        next_hop, done = node.find_next_hop(decode_id(request.key))
+        return chord_v2_pb2.FindNextHopResponse(next_hop_id=encode_id(next_hop), done=done)
+
+    def FindPredecessor(self, request, context):
+        node = self.route(request.target_id, context)
+        routing = node.routing
+        predecessor = routing.predecessor
+        if predecessor is None:
+            predecessor = node.node_id
+        return chord_v2_pb2.FindPredecessorResponse(predecessor_id=encode_id(predecessor),
+                                                    successor_list=[encode_id(n) for n in routing.successor_list])
+
+    def SetSuccessor(self, request, context):
+        node = self.route(request.target_id, context)
+        node.set_successor(decode_id(request.new_successor_id) if request.HasField('new_successor_id') else None)
+        return chord_v2_pb2.SetSuccessorResponse()
+
+    def SetPredecessor(self, request, context):
+        node = self.route(request.target_id, context)
+        node.set_predecessor(decode_id(request.new_predecessor_id) if request.HasField('new_predecessor_id')
+                             else None)
+        return chord_v2_pb2.SetPredecessorResponse()
+
+    def Notify(self, request, context):
+        node = self.route(request.target_id, context)
+        node.notify(decode_id(request.sender_id))
+        return chord_v2_pb2.NotifyResponse(successor_list=[encode_id(n) for n in node.successor_list])
+
+    def UpdateFingerTable(self, request, context):
+        node = self.route(request.target_id, context)
+        node.update_finger_table(decode_id(request.new_node_id), request.index)
+        return chord_v2_pb2.UpdateFingerTableResponse()
+
+    def GetInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        info = node.node_has_info(decode_id(request.key))
+        if info is None:
+            return chord_v2_pb2.GetInfoResponse()
+        return chord_v2_pb2.GetInfoResponse(information=info.encode())
+
+    def AddInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        info_key = decode_id(request.key)
+        if not node.add_information(info_key, request.information.decode()):
+            context.abort(grpc.StatusCode.ABORTED, f"Write quorum not reached for key {info_key}")
+        return chord_v2_pb2.AddInfoResponse()
+
+    def RemoveInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        node.remove_info(decode_id(request.key))
+        return chord_v2_pb2.RemoveInfoResponse()
+
+    def AddRedundantInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        node.add_redundant_info(decode_id(request.key), request.information.decode())
+        return chord_v2_pb2.AddInfoResponse()
+
+    def AddRedundantMany(self, request, context):
+        node = self.route(request.target_id, context)
+        node.add_redundant_many({decode_id(entry.key): entry.value.decode() for entry in request.entries})
+        return chord_v2_pb2.AddInfoResponse()
+
+    def RemoveRedundantInformation(self, request, context):
+        node = self.route(request.target_id, context)
+        node.remove_redundant_info(decode_id(request.key))
+        return chord_v2_pb2.RemoveInfoResponse()
+
+    def GetMany(self, request, context):
+        node = self.route(request.target_id, context)
+        info = node.get_local_information(decode_id(key) for key in request.keys)
+        entries = [chord_v2_pb2.Entry(key=encode_id(k), value=v.encode()) for k, v in info.items()]
+        return chord_v2_pb2.GetManyResponse(entries=entries)
+
+    def PutMany(self, request, context):
+        node = self.route(request.target_id, context)
+        created = node.add_many_information({decode_id(entry.key): entry.value.decode()
+                                                  for entry in request.entries})
+        return chord_v2_pb2.PutManyResponse(created_keys=[encode_id(key) for key in created])
+
+    def DeleteMany(self, request, context):
+        node = self.route(request.target_id, context)
+        removed = node.remove_many_information(decode_id(key) for key in request.keys)
+        return chord_v2_pb2.DeleteManyResponse(removed_keys=[encode_id(key) for key in removed])
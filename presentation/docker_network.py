@@ -1,7 +1,10 @@
+from collections.abc import Iterable
+
 import grpc
 import nmap
 from business.node import Node
-from business.node_network_interface import NodeNetworkInterface
+from business.node_network_interface import UNSUPPORTED, NodeNetworkInterface, Unsupported
+from business.routing_state import RoutingState
 from presentation import chord_pb2
 from presentation.chord_pb2_grpc import ChordStub
 
@@ -57,6 +60,16 @@ class DockerNetwork(NodeNetworkInterface):
             self.local_node.handle_dead_node(target_id)
             return None
 
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindNextHopRequest(target_id=str(target_id), key=str(key))
+            res = stub.FindNextHop(req, timeout=2)
+            return int(res.next_hop_id), res.done
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_id)
+            return None
+
     def get_predecessor(self, target_id: int) -> int | None:
 
         try:
@@ -70,6 +83,32 @@ class DockerNetwork(NodeNetworkInterface):
             self.local_node.handle_dead_node(target_id)
             return None
 
+    def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindPredecessorRequest(target_id=str(target_id))
+            res = stub.FindPredecessor(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            return predecessor, [int(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_id)
+            return None
+
+    def get_routing_state(self, target_id: int) -> RoutingState | Unsupported | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.GetRoutingStateRequest(target_id=str(target_id))
+            res = stub.GetRoutingState(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            successors = [int(node_id) for node_id in res.successor_list]
+            return RoutingState(successors[0] if successors else None, predecessor, successors,
+                                [None if node_id == "None" else int(node_id) for node_id in res.finger_table])
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return UNSUPPORTED
+            self.local_node.handle_dead_node(target_id)
+            return None
+
     def set_predecessor(self, target_id: int, new_predecessor_id: int):
         try:
             stub = self._get_stub(target_id)
@@ -88,11 +127,12 @@ class DockerNetwork(NodeNetworkInterface):
             self.local_node.handle_dead_node(target_id)
             return None
 
-    def notify(self, target_id: int, sender_id: int):
+    def notify(self, target_id: int, sender_id: int) -> list[int] | None:
         try:
             stub = self._get_stub(target_id)
             req = chord_pb2.NotifyRequest(target_id=str(target_id), sender_id=str(sender_id))
-            stub.Notify(req, timeout=2)
+            res = stub.Notify(req, timeout=2)
+            return [int(node_id) for node_id in res.successor_list]
         except grpc.RpcError:
             self.local_node.handle_dead_node(target_id)
             return None
@@ -108,6 +148,15 @@ class DockerNetwork(NodeNetworkInterface):
             self.local_node.handle_dead_node(target_id)
             return None
 
+    def finger_hint(self, target_id: int, new_node_id: int, hops: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FingerHintRequest(target_id=str(target_id), new_node_id=str(new_node_id), hops=hops)
+            stub.FingerHint(req, timeout=2)
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_id)
+            return None
+
     def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
         try:
             stub = self._get_stub(target_node_id)
@@ -118,13 +167,17 @@ class DockerNetwork(NodeNetworkInterface):
         except grpc.RpcError:
             self.local_node.handle_dead_node(target_node_id)
 
-    def add_information(self, target_node_id: int, info_key: int, info: str):
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
         try:
             stub = self._get_stub(target_node_id)
             req = chord_pb2.AddInfoRequest(info_key=str(info_key), info=str(info))
             stub.AddInformation(req, timeout=2)
-        except grpc.RpcError:
-            self.local_node.handle_dead_node(target_node_id)
+            return True
+        except grpc.RpcError as e:
+            # ABORTED means the owner stored the key but missed its write quorum; it is alive
+            if e.code() != grpc.StatusCode.ABORTED:
+                self.local_node.handle_dead_node(target_node_id)
+            return False
 
     def remove_information(self, target_node_id: int, info_key: int):
         try:
@@ -133,3 +186,98 @@ class DockerNetwork(NodeNetworkInterface):
             stub.RemoveInformation(req, timeout=2)
         except grpc.RpcError:
             self.local_node.handle_dead_node(target_node_id)
+
+    def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool:
+        def requests():
+            for chunk in chunks:
+                yield chord_pb2.HandoffChunk(target_id=str(target_node_id), session_id=session_id,
+                                             info_line=[chord_pb2.InfoLine(info_key=str(k), info_val=v)
+                                                        for k, v in chunk.items()])
+
+        try:
+            stub = self._get_stub(target_node_id)
+            stub.Handoff(requests(), timeout=60)
+            return True
+        except grpc.RpcError as e:
+            print(f"[hand_off] stream to {target_node_id} interrupted: {e.code()}")
+            return False
+
+    def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.HandoffCursorRequest(target_id=str(target_node_id), session_id=session_id)
+            res = stub.GetHandoffCursor(req, timeout=2)
+            return int(res.cursor) if res.cursor else None
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RequestHandoffRequest(target_id=str(target_node_id), requester_id=str(requester_id),
+                                                  start=str(start), end=str(end))
+            return stub.RequestHandoff(req, timeout=2).completed
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return False
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.AddInfoRequest(info_key=str(info_key), info=str(info))
+            stub.AddRedundantInformation(req, timeout=2)
+            return True
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            stub.AddRedundantMany(chord_pb2.PutManyRequest(info_line=info_lines), timeout=2)
+            return True
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def remove_redundant_info(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RemoveInfoRequest(target_id=str(target_node_id), info_key=str(info_key))
+            stub.RemoveRedundantInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.GetManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = stub.GetMany(req, timeout=2)
+            return {int(line.info_key): line.info_val for line in res.info_line}
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            req = chord_pb2.PutManyRequest(target_id=str(target_node_id), info_line=info_lines)
+            res = stub.PutMany(req, timeout=2)
+            return [int(key) for key in res.created_keys]
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.DeleteManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = stub.DeleteMany(req, timeout=2)
+            return [int(key) for key in res.removed_keys]
+        except grpc.RpcError:
+            self.local_node.handle_dead_node(target_node_id)
+            return None
@@ -0,0 +1,58 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from business.metrics import REGISTRY, MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class HttpEndpoint:
+    """Small plain-HTTP side server for scrapers and probes, next to the gRPC port."""
+
+    def __init__(self, port: int, registry: MetricsRegistry | None = None, host: str = ''):
+        self.port = port
+        self.host = host
+        self.routes: dict[str, Callable[[], tuple[int, str, str]]] = {}
+        self.server: ThreadingHTTPServer | None = None
+        registry = registry if registry is not None else REGISTRY
+        self.route('/metrics', lambda: (200, PROMETHEUS_CONTENT_TYPE, registry.render()))
+
+    def route(self, path: str, handler: Callable[[], tuple[int, str, str]]):
+        self.routes[path] = handler
+
+    def start(self) -> ThreadingHTTPServer:
+        routes = self.routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                handler = routes.get(self.path.split('?', 1)[0])
+                if handler is None:
+                    status, content_type, body = 404, 'text/plain', 'not found\n'
+                else:
+                    try:
+                        status, content_type, body = handler()
+                    except Exception as e:
+                        logging.error(f"[http] {self.path} failed: {e}")
+                        status, content_type, body = 500, 'text/plain', f'{e}\n'
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logging.debug(f"[http] {format % args}")
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, name='http-endpoint', daemon=True).start()
+        return self.server
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
@@ -0,0 +1,6 @@
+def encode_id(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')
+
+
+def decode_id(raw: bytes) -> int:
+    return int.from_bytes(raw, 'big')
@@ -0,0 +1,208 @@
+import time
+
+import grpc
+
+from business.metrics import REGISTRY, Histogram, MetricsRegistry
+from presentation import chord_pb2
+
+
+class RpcMetrics:
+    """Per-method duration histograms, outcome counters and in-flight gauges for one side of the wire."""
+
+    def __init__(self, side: str, registry: MetricsRegistry | None = None):
+        self.side = side
+        self.registry = registry if registry is not None else REGISTRY
+        self.durations = {}
+        self.outcomes = {}
+        self.in_flight = {}
+
+    @staticmethod
+    def method_name(method: str | bytes) -> str:
+        if isinstance(method, bytes):
+            method = method.decode()
+        return method.rsplit('/', 1)[-1]
+
+    def started(self, method: str) -> float:
+        gauge = self.in_flight.get(method)
+        if gauge is None:
+            gauge = self.in_flight[method] = self.registry.gauge(
+                f'chord_{self.side}_rpcs_in_flight', f'{self.side.capitalize()} RPCs in progress', method=method)
+        gauge.inc()
+        return time.monotonic()
+
+    def finished(self, method: str, started: float, code: grpc.StatusCode | None):
+        seconds = time.monotonic() - started
+        self.in_flight[method].dec()
+        duration = self.durations.get(method)
+        if duration is None:
+            duration = self.durations[method] = self.registry.histogram(
+                f'chord_{self.side}_rpc_duration_seconds', f'{self.side.capitalize()} RPC latency', method=method)
+        duration.observe(seconds)
+
+        code_name = (code or grpc.StatusCode.UNKNOWN).name
+        outcome = self.outcomes.get((method, code_name))
+        if outcome is None:
+            outcome = self.outcomes[(method, code_name)] = self.registry.counter(
+                f'chord_{self.side}_rpcs', f'{self.side.capitalize()} RPCs by status code; '
+                f'DEADLINE_EXCEEDED counts timeouts', method=method, code=code_name)
+        outcome.inc()
+
+
+class ClientMetricsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor,
+                               grpc.StreamUnaryClientInterceptor):
+    def __init__(self, metrics: RpcMetrics):
+        self.metrics = metrics
+
+    def _observe(self, continuation, client_call_details, request):
+        method = self.metrics.method_name(client_call_details.method)
+        started = self.metrics.started(method)
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            self.metrics.finished(method, started, None)
+            raise
+        # runs immediately for blocking calls and once the last message arrives for streams
+        call.add_done_callback(lambda done: self.metrics.finished(method, started, done.code()))
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._observe(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._observe(continuation, client_call_details, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return self._observe(continuation, client_call_details, request_iterator)
+
+
+class AsyncClientMetricsInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(self, metrics: RpcMetrics):
+        self.metrics = metrics
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = self.metrics.method_name(client_call_details.method)
+        started = self.metrics.started(method)
+        code = None
+        try:
+            call = await continuation(client_call_details, request)
+            code = await call.code()
+            return call
+        finally:
+            self.metrics.finished(method, started, code)
+
+
+def status_of(context) -> grpc.StatusCode | None:
+    code = context.code()
+    return code if isinstance(code, grpc.StatusCode) else None
+
+
+def instrumented_handler(handler, unary, streaming):
+    codec = {'request_deserializer': handler.request_deserializer,
+             'response_serializer': handler.response_serializer}
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(unary(handler.unary_unary), **codec)
+    if handler.stream_unary:
+        return grpc.stream_unary_rpc_method_handler(unary(handler.stream_unary), **codec)
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(streaming(handler.unary_stream), **codec)
+    return handler
+
+
+class ServerMetricsInterceptor(grpc.ServerInterceptor):
+    def __init__(self, metrics: RpcMetrics):
+        self.metrics = metrics
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = self.metrics.method_name(handler_call_details.method)
+
+        def unary(behavior):
+            def observed(request, context):
+                started = self.metrics.started(method)
+                code = None
+                try:
+                    response = behavior(request, context)
+                    code = status_of(context) or grpc.StatusCode.OK
+                    return response
+                finally:
+                    self.metrics.finished(method, started, code or status_of(context))
+            return observed
+
+        def streaming(behavior):
+            def observed(request, context):
+                started = self.metrics.started(method)
+                code = None
+                try:
+                    yield from behavior(request, context)
+                    code = status_of(context) or grpc.StatusCode.OK
+                finally:
+                    self.metrics.finished(method, started, code or status_of(context))
+            return observed
+
+        return instrumented_handler(handler, unary, streaming)
+
+
+class AsyncServerMetricsInterceptor(grpc.aio.ServerInterceptor):
+    def __init__(self, metrics: RpcMetrics):
+        self.metrics = metrics
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = self.metrics.method_name(handler_call_details.method)
+
+        def unary(behavior):
+            async def observed(request, context):
+                started = self.metrics.started(method)
+                code = None
+                try:
+                    response = await behavior(request, context)
+                    code = status_of(context) or grpc.StatusCode.OK
+                    return response
+                finally:
+                    self.metrics.finished(method, started, code or status_of(context))
+            return observed
+
+        def streaming(behavior):
+            async def observed(request, context):
+                started = self.metrics.started(method)
+                code = None
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                    code = status_of(context) or grpc.StatusCode.OK
+                finally:
+                    self.metrics.finished(method, started, code or status_of(context))
+            return observed
+
+        return instrumented_handler(handler, unary, streaming)
+
+
+def histogram_snapshot(histogram: Histogram) -> chord_pb2.HistogramSnapshot:
+    buckets = histogram.cumulative()
+    return chord_pb2.HistogramSnapshot(name=histogram.name, labels=dict(histogram.labels),
+                                       bounds=[bound for bound, _ in buckets],
+                                       bucket_counts=[total for _, total in buckets],
+                                       sum=histogram.sum, count=histogram.count)
+
+
+def node_stats_response(node) -> chord_pb2.GetNodeStatsResponse:
+    node_stats = node.get_stats()
+    counters = {name: float(value) for name, value in node_stats.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)}
+    histograms = []
+    for metric in node.metrics.collect(node=node.node_id):
+        if isinstance(metric, Histogram):
+            histograms.append(histogram_snapshot(metric))
+        else:
+            labels = ','.join(f'{name}={value}' for name, value in metric.labels if name != 'node')
+            counters[f'{metric.name}{{{labels}}}' if labels else metric.name] = float(metric.value)
+    return chord_pb2.GetNodeStatsResponse(fixes=str(node_stats['finger_fixes']),
+                                          stabilization=str(node_stats['stabilization']),
+                                          lookups=str(node_stats['lookups']),
+                                          join_time=str(node_stats['join_time']),
+                                          counters=counters,
+                                          histograms=histograms)
@@ -1,26 +1,46 @@
 import logging
+from collections.abc import Iterable
 
 import grpc
 from kubernetes import client, config
+from business.identifiers import hash_key
 from business.node import Node
-from business.node_network_interface import NodeNetworkInterface
+from business.node_network_interface import UNSUPPORTED, NodeNetworkInterface, Unsupported
+from business.routing_state import RoutingState
 from presentation import chord_pb2
+from presentation.channel_pool import ChannelPool
 from presentation.chord_pb2_grpc import ChordStub
+from presentation.instrumentation import ClientMetricsInterceptor, RpcMetrics
+from presentation.latency import LatencyInterceptor, PeerLatency
+
+VIRTUAL_NODES_ANNOTATION = "chord.dht/virtual-nodes"
 
 
 class KubernetesNetwork(NodeNetworkInterface):
-    def __init__(self, namespace="chord-dht", headless_service="chord-headless", app_label="chord-node"):
-        self.stubs = {}
+    def __init__(self, namespace="chord-dht", headless_service="chord-headless", app_label="chord-node",
+                 id_bits: int | None = None, virtual_nodes: int = 1):
         self.local_node = None
+        self.local_nodes: dict[int, Node] = {}
         self.namespace = namespace
         self.headless_service = headless_service
         self.app_label = app_label
         self.k8s_client = None
         self.port = 50050
         self.address_map = {}
+        self.id_bits = id_bits
+        self.virtual_nodes = virtual_nodes
+        self.ordinals: dict[int, int] = {}
+        self.latency = PeerLatency()
+        self.rpc_metrics = RpcMetrics('client')
+        self.pool = self._create_pool()
 
         self.init_k8s_client()
 
+    def _create_pool(self) -> ChannelPool:
+        return ChannelPool(self._resolve_address,
+                           lambda node_id: [ClientMetricsInterceptor(self.rpc_metrics),
+                                            LatencyInterceptor(node_id, self.latency)])
+
     def init_k8s_client(self):
         try:
             config.load_incluster_config()
@@ -32,18 +52,59 @@ class KubernetesNetwork(NodeNetworkInterface):
                 raise
         self.k8s_client = client.CoreV1Api()
 
+    def node_ids_for_pod(self, pod_name: str, virtual_nodes: int | None = None) -> list[int]:
+        ordinal = int(pod_name.split("-")[-1])
+        if self.id_bits is None:
+            return [ordinal]
+        node_ids = []
+        for v in range(virtual_nodes or self.virtual_nodes):
+            node_id = hash_key(pod_name if v == 0 else f"{pod_name}#{v}", self.id_bits)
+            self.ordinals[node_id] = ordinal
+            node_ids.append(node_id)
+        return node_ids
+
+    def node_id_for_pod(self, pod_name: str) -> int:
+        return self.node_ids_for_pod(pod_name, 1)[0]
+
+    def pod_virtual_nodes(self, pod) -> int:
+        annotations = pod.metadata.annotations or {}
+        try:
+            return int(annotations.get(VIRTUAL_NODES_ANNOTATION, self.virtual_nodes))
+        except ValueError:
+            return self.virtual_nodes
+
+    def ordinal_for(self, node_id: int) -> int:
+        if self.id_bits is None:
+            return node_id
+        if node_id not in self.ordinals:
+            self.discover_all_nodes()
+        return self.ordinals.get(node_id, node_id)
+
     def _resolve_address(self, node_id: int) -> str:
-        return f"chord-{node_id}.{self.headless_service}.{self.namespace}.svc.cluster.local:{self.port}"
+        return f"chord-{self.ordinal_for(node_id)}.{self.headless_service}.{self.namespace}.svc.cluster.local:{self.port}"
+
+    def _get_channel(self, node_id: int) -> grpc.Channel:
+        return self.pool.channel(node_id)
 
     def _get_stub(self, node_id: int) -> ChordStub:
-        if node_id not in self.stubs:
-            dns_address = self._resolve_address(node_id)
-            channel = grpc.insecure_channel(dns_address)
-            self.stubs[node_id] = ChordStub(channel)
-        return self.stubs[node_id]
+        return self.pool.stub(node_id)
 
     def set_local_node(self, node: Node):
         self.local_node = node
+        self.local_nodes[node.node_id] = node
+        node.scheduler.add('channels', self.pool.maintain, node.min_maintenance_interval,
+                           node.max_maintenance_interval)
+
+    def add_virtual_node(self, node: Node):
+        self.local_nodes[node.node_id] = node
+
+    def peer_latency(self, node_id: int) -> float | None:
+        return self.latency.get(node_id)
+
+    def handle_dead_node(self, node_id: int):
+        self.latency.forget(node_id)
+        for node in list(self.local_nodes.values()):
+            node.handle_dead_node(node_id)
 
     def discover_bootstrap(self):
         try:
@@ -54,11 +115,13 @@ class KubernetesNetwork(NodeNetworkInterface):
 
             bootstrap_candidates = []
             for pod in pods.items:
-                if pod.status.phase == 'Running' and pod.status.pod_ip and pod.metadata.name != f"chord-{self.local_node.node_id}":
+                if pod.status.phase == 'Running' and pod.status.pod_ip:
                     try:
                         pod_name = pod.metadata.name
                         if pod_name.startswith(f"chord-"):
-                            node_id = int(pod_name.split("-")[-1])
+                            node_id = self.node_id_for_pod(pod_name)
+                            if node_id in self.local_nodes:
+                                continue
                             bootstrap_candidates.append(node_id)
                             logging.info(f"Discovered potential bootstrap node: {pod_name}")
                     except (ValueError, IndexError):
@@ -97,8 +160,7 @@ class KubernetesNetwork(NodeNetworkInterface):
                     try:
                         pod_name = pod.metadata.name
                         if pod_name.startswith(f"chord-"):
-                            node_id = int(pod_name.split("-")[-1])
-                            node_ids.append(node_id)
+                            node_ids.extend(self.node_ids_for_pod(pod_name, self.pod_virtual_nodes(pod)))
                     except (ValueError, IndexError):
                         continue
 
@@ -117,7 +179,16 @@ class KubernetesNetwork(NodeNetworkInterface):
                 return None
             return int(res.successor_id)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
+
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindNextHopRequest(target_id=str(target_id), key=str(key))
+            res = stub.FindNextHop(req, timeout=2)
+            return int(res.next_hop_id), res.done
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
 
     def get_predecessor(self, target_id: int) -> int | None:
 
@@ -129,7 +200,32 @@ class KubernetesNetwork(NodeNetworkInterface):
                 return None
             return int(res.predecessor_id)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
+
+    def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FindPredecessorRequest(target_id=str(target_id))
+            res = stub.FindPredecessor(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            return predecessor, [int(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def get_routing_state(self, target_id: int) -> RoutingState | Unsupported | None:
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.GetRoutingStateRequest(target_id=str(target_id))
+            res = stub.GetRoutingState(req, timeout=2)
+            predecessor = None if res.predecessor_id == "None" else int(res.predecessor_id)
+            successors = [int(node_id) for node_id in res.successor_list]
+            return RoutingState(successors[0] if successors else None, predecessor, successors,
+                                [None if node_id == "None" else int(node_id) for node_id in res.finger_table])
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return UNSUPPORTED
+            self.handle_dead_node(target_id)
+            return None
 
     def set_predecessor(self, target_id: int, new_predecessor_id: int):
         try:
@@ -137,7 +233,7 @@ class KubernetesNetwork(NodeNetworkInterface):
             req = chord_pb2.SetPredecessorRequest(target_id=str(target_id), new_predecessor_id=str(new_predecessor_id))
             stub.SetPredecessor(req, timeout=2)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
 
     def set_successor(self, target_id: int, successor_id: int):
         try:
@@ -145,15 +241,16 @@ class KubernetesNetwork(NodeNetworkInterface):
             req = chord_pb2.SetSuccessorRequest(target_id=str(target_id), new_successor_id=str(successor_id))
             stub.SetSuccessor(req, timeout=2)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
 
-    def notify(self, target_id: int, sender_id: int):
+    def notify(self, target_id: int, sender_id: int) -> list[int] | None:
         try:
             stub = self._get_stub(target_id)
             req = chord_pb2.NotifyRequest(target_id=str(target_id), sender_id=str(sender_id))
-            stub.Notify(req, timeout=2)
+            res = stub.Notify(req, timeout=2)
+            return [int(node_id) for node_id in res.successor_list]
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
 
     def update_finger_table(self, target_id: int, new_node_id: int, index: int):
 
@@ -163,9 +260,17 @@ class KubernetesNetwork(NodeNetworkInterface):
                                                      index=str(index))
             stub.UpdateFingerTable(req, timeout=2)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_id)
+            self.handle_dead_node(target_id)
             return None
 
+    def finger_hint(self, target_id: int, new_node_id: int, hops: int):
+        try:
+            stub = self._get_stub(target_id)
+            req = chord_pb2.FingerHintRequest(target_id=str(target_id), new_node_id=str(new_node_id), hops=hops)
+            stub.FingerHint(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
     def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
         try:
             stub = self._get_stub(target_node_id)
@@ -173,24 +278,28 @@ class KubernetesNetwork(NodeNetworkInterface):
             res = stub.GetInformation(req, timeout=2)
             return res.information
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_node_id)
+            self.handle_dead_node(target_node_id)
 
     def get_all_info(self, target_node_id: int):
         try:
             stub = self._get_stub(target_node_id)
-            req = chord_pb2.GetAllInfoRequest()
+            req = chord_pb2.GetAllInfoRequest(target_id=str(target_node_id))
             res = stub.GetAllNodeInfo(req, timeout=2)
             return res.info_line
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_node_id)
+            self.handle_dead_node(target_node_id)
 
-    def add_information(self, target_node_id: int, info_key: int, info: str):
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
         try:
             stub = self._get_stub(target_node_id)
-            req = chord_pb2.AddInfoRequest(info_key=str(info_key), info=str(info))
+            req = chord_pb2.AddInfoRequest(target_id=str(target_node_id), info_key=str(info_key), info=str(info))
             stub.AddInformation(req, timeout=2)
-        except grpc.RpcError:
-            self.local_node.handle_dead_node(target_node_id)
+            return True
+        except grpc.RpcError as e:
+            # ABORTED means the owner stored the key but missed its write quorum; it is alive
+            if e.code() != grpc.StatusCode.ABORTED:
+                self.handle_dead_node(target_node_id)
+            return False
 
     def remove_information(self, target_node_id: int, info_key: int):
         try:
@@ -198,7 +307,96 @@ class KubernetesNetwork(NodeNetworkInterface):
             req = chord_pb2.RemoveInfoRequest(target_id=str(target_node_id), info_key=str(info_key))
             stub.RemoveInformation(req, timeout=2)
         except grpc.RpcError:
-            self.local_node.handle_dead_node(target_node_id)
+            self.handle_dead_node(target_node_id)
+
+    def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool:
+        def requests():
+            for chunk in chunks:
+                yield chord_pb2.HandoffChunk(target_id=str(target_node_id), session_id=session_id,
+                                             info_line=[chord_pb2.InfoLine(info_key=str(k), info_val=v)
+                                                        for k, v in chunk.items()])
+
+        try:
+            stub = self._get_stub(target_node_id)
+            stub.Handoff(requests(), timeout=60)
+            return True
+        except grpc.RpcError as e:
+            logging.warning(f"[hand_off] stream to {target_node_id} interrupted: {e.code()}")
+            return False
+
+    def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.HandoffCursorRequest(target_id=str(target_node_id), session_id=session_id)
+            res = stub.GetHandoffCursor(req, timeout=2)
+            return int(res.cursor) if res.cursor else None
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RequestHandoffRequest(target_id=str(target_node_id), requester_id=str(requester_id),
+                                                  start=str(start), end=str(end))
+            return stub.RequestHandoff(req, timeout=2).completed
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+            return False
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.AddInfoRequest(target_id=str(target_node_id), info_key=str(info_key), info=str(info))
+            stub.AddRedundantInformation(req, timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            stub.AddRedundantMany(chord_pb2.PutManyRequest(target_id=str(target_node_id), info_line=info_lines),
+                                  timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def remove_redundant_info(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.RemoveInfoRequest(target_id=str(target_node_id), info_key=str(info_key))
+            stub.RemoveRedundantInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.GetManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = stub.GetMany(req, timeout=2)
+            return {int(line.info_key): line.info_val for line in res.info_line}
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            info_lines = [chord_pb2.InfoLine(info_key=str(k), info_val=str(v)) for k, v in items.items()]
+            req = chord_pb2.PutManyRequest(target_id=str(target_node_id), info_line=info_lines)
+            res = stub.PutMany(req, timeout=2)
+            return [int(key) for key in res.created_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        try:
+            stub = self._get_stub(target_node_id)
+            req = chord_pb2.DeleteManyRequest(target_id=str(target_node_id), keys=[str(key) for key in info_keys])
+            res = stub.DeleteMany(req, timeout=2)
+            return [int(key) for key in res.removed_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
 
     def print_node_info(self, target_node_id: int):
         try:
@@ -206,8 +404,7 @@ class KubernetesNetwork(NodeNetworkInterface):
             req = chord_pb2.GetNodeInfoRequest(target_id=str(target_node_id))
             stub.GetNodeInformation(req, timeout=2)
         except grpc.RpcError:
-            if self.local_node:
-                self.local_node.handle_dead_node(target_node_id)
+            self.handle_dead_node(target_node_id)
 
     def print_stats(self, target_node_id: int):
         try:
@@ -215,15 +412,7 @@ class KubernetesNetwork(NodeNetworkInterface):
             req = chord_pb2.GetNodeStatsRequest(target_id=str(target_node_id))
             stub.GetNodeStats(req, timeout=2)
         except grpc.RpcError:
-            if self.local_node:
-                self.local_node.handle_dead_node(target_node_id)
+            self.handle_dead_node(target_node_id)
 
     def cleanup(self):
-        for stub in self.stubs.values():
-            try:
-                channel = stub._channel
-                if hasattr(channel, 'close'):
-                    channel.close()
-            except Exception as e:
-                logging.error(f"Error closing gRPC channel: {e}")
-        self.stubs.clear()
+        self.pool.close()
@@ -0,0 +1,189 @@
+import grpc
+
+from presentation import chord_v2_pb2
+from presentation.chord_v2_pb2_grpc import ChordV2Stub
+from presentation.id_codec import decode_id, encode_id
+from presentation.kubernetes_network import KubernetesNetwork
+
+
+class KubernetesV2Network(KubernetesNetwork):
+    """KubernetesNetwork that talks the binary chord.v2 protocol for the ring and key RPCs.
+
+    Diagnostics (node info, stats, logs) still go through the v1 service on the same channel.
+    """
+
+    def __init__(self, namespace="chord-dht", headless_service="chord-headless", app_label="chord-node",
+                 id_bits: int | None = None, virtual_nodes: int = 1):
+        super().__init__(namespace, headless_service, app_label, id_bits, virtual_nodes)
+
+    def _get_v2_stub(self, node_id: int) -> ChordV2Stub:
+        return self.pool.stub(node_id, ChordV2Stub)
+
+    def find_successor(self, target_id: int, key: int) -> int | None:
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.FindSuccessorRequest(target_id=encode_id(target_id), key=encode_id(key))
+            res = stub.FindSuccessor(req, timeout=2)
+            if not res.HasField('successor_id'):
+                return None
+            return decode_id(res.successor_id)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.FindNextHopRequest(target_id=encode_id(target_id), key=encode_id(key))
+            res = stub.FindNextHop(req, timeout=2)
+            return decode_id(res.next_hop_id), res.done
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def get_predecessor(self, target_id: int) -> int | None:
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.FindPredecessorRequest(target_id=encode_id(target_id))
+            res = stub.FindPredecessor(req, timeout=2)
+            if not res.HasField('predecessor_id'):
+                return None
+            return decode_id(res.predecessor_id)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None:
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.FindPredecessorRequest(target_id=encode_id(target_id))
+            res = stub.FindPredecessor(req, timeout=2)
+            predecessor = decode_id(res.predecessor_id) if res.HasField('predecessor_id') else None
+            return predecessor, [decode_id(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def set_predecessor(self, target_id: int, new_predecessor_id: int | None):
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.SetPredecessorRequest(target_id=encode_id(target_id))
+            if new_predecessor_id is not None:
+                req.new_predecessor_id = encode_id(new_predecessor_id)
+            stub.SetPredecessor(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def set_successor(self, target_id: int, successor_id: int | None):
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.SetSuccessorRequest(target_id=encode_id(target_id))
+            if successor_id is not None:
+                req.new_successor_id = encode_id(successor_id)
+            stub.SetSuccessor(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def notify(self, target_id: int, sender_id: int) -> list[int] | None:
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.NotifyRequest(target_id=encode_id(target_id), sender_id=encode_id(sender_id))
+            res = stub.Notify(req, timeout=2)
+            return [decode_id(node_id) for node_id in res.successor_list]
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def update_finger_table(self, target_id: int, new_node_id: int, index: int):
+        try:
+            stub = self._get_v2_stub(target_id)
+            req = chord_v2_pb2.UpdateFingerTableRequest(target_id=encode_id(target_id),
+                                                        new_node_id=encode_id(new_node_id), index=index)
+            stub.UpdateFingerTable(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_id)
+
+    def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.GetInfoRequest(target_id=encode_id(target_node_id), key=encode_id(info_key))
+            res = stub.GetInformation(req, timeout=2)
+            if not res.HasField('information'):
+                return 'None'
+            return res.information.decode()
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.AddInfoRequest(target_id=encode_id(target_node_id), key=encode_id(info_key),
+                                              information=str(info).encode())
+            stub.AddInformation(req, timeout=2)
+            return True
+        except grpc.RpcError as e:
+            # ABORTED means the owner stored the key but missed its write quorum; it is alive
+            if e.code() != grpc.StatusCode.ABORTED:
+                self.handle_dead_node(target_node_id)
+            return False
+
+    def remove_information(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.RemoveInfoRequest(target_id=encode_id(target_node_id), key=encode_id(info_key))
+            stub.RemoveInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.AddInfoRequest(target_id=encode_id(target_node_id), key=encode_id(info_key),
+                                              information=str(info).encode())
+            stub.AddRedundantInformation(req, timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            entries = [chord_v2_pb2.Entry(key=encode_id(k), value=str(v).encode()) for k, v in items.items()]
+            stub.AddRedundantMany(chord_v2_pb2.PutManyRequest(target_id=encode_id(target_node_id), entries=entries),
+                                  timeout=2)
+            return True
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def remove_redundant_info(self, target_node_id: int, info_key: int):
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.RemoveInfoRequest(target_id=encode_id(target_node_id), key=encode_id(info_key))
+            stub.RemoveRedundantInformation(req, timeout=2)
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.GetManyRequest(target_id=encode_id(target_node_id),
+                                              keys=[encode_id(key) for key in info_keys])
+            res = stub.GetMany(req, timeout=2)
+            return {decode_id(entry.key): entry.value.decode() for entry in res.entries}
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            entries = [chord_v2_pb2.Entry(key=encode_id(k), value=str(v).encode()) for k, v in items.items()]
+            req = chord_v2_pb2.PutManyRequest(target_id=encode_id(target_node_id), entries=entries)
+            res = stub.PutMany(req, timeout=2)
+            return [decode_id(key) for key in res.created_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        try:
+            stub = self._get_v2_stub(target_node_id)
+            req = chord_v2_pb2.DeleteManyRequest(target_id=encode_id(target_node_id),
+                                                 keys=[encode_id(key) for key in info_keys])
+            res = stub.DeleteMany(req, timeout=2)
+            return [decode_id(key) for key in res.removed_keys]
+        except grpc.RpcError:
+            self.handle_dead_node(target_node_id)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+import grpc
+
+# RPCs the peer answers from its own state; lookups, transfers and writes also time work
+# done further along the ring or on disk, so they would skew the estimate
+SAMPLED_METHODS = frozenset({'FindNextHop', 'GetRoutingState', 'Notify', 'SetSuccessor', 'SetPredecessor',
+                             'NodeHasInformation', 'GetHandoffCursor'})
+
+
+def is_sampled(method: str | bytes) -> bool:
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rsplit('/', 1)[-1] in SAMPLED_METHODS
+
+
+class PeerLatency:
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.rtt: dict[int, float] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, node_id: int, seconds: float):
+        with self.lock:
+            previous = self.rtt.get(node_id)
+            self.rtt[node_id] = seconds if previous is None else previous + self.alpha * (seconds - previous)
+
+    def get(self, node_id: int) -> float | None:
+        return self.rtt.get(node_id)
+
+    def forget(self, node_id: int):
+        with self.lock:
+            self.rtt.pop(node_id, None)
+
+
+class LatencyInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Feeds the round trip of successful cheap point calls on a peer's channel into its RTT EWMA."""
+
+    def __init__(self, node_id: int, latency: PeerLatency):
+        self.node_id = node_id
+        self.latency = latency
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not is_sampled(client_call_details.method):
+            return continuation(client_call_details, request)
+        started = time.monotonic()
+        outcome = continuation(client_call_details, request)
+        if outcome.done() and outcome.exception() is None:
+            self.latency.observe(self.node_id, time.monotonic() - started)
+        return outcome
+
+
+class AsyncLatencyInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(self, node_id: int, latency: PeerLatency):
+        self.node_id = node_id
+        self.latency = latency
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not is_sampled(client_call_details.method):
+            return await continuation(client_call_details, request)
+        started = time.monotonic()
+        call = await continuation(client_call_details, request)
+        if await call.code() == grpc.StatusCode.OK:
+            self.latency.observe(self.node_id, time.monotonic() - started)
+        return call
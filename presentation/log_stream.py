@@ -0,0 +1,57 @@
+import logging
+
+from persistence.log_reader import LogPage, LogReader
+from presentation import chord_pb2
+
+LOG_CHUNK_LINES = 256
+MAX_LOG_LINES = 10000
+FOLLOW_INTERVAL = 0.5
+# each follower pins a worker of the threaded server, so only a few may follow at once
+MAX_FOLLOWERS = 2
+
+
+def parse_level(name: str) -> int:
+    if not name:
+        return 0
+    level = logging.getLevelName(name.upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level {name!r}")
+    return level
+
+
+def log_chunks(page: LogPage, keep_empty: bool = False) -> list[chord_pb2.LogChunk]:
+    # an empty chunk still tells the caller where to resume
+    if not page.entries:
+        return [chord_pb2.LogChunk(start=page.start, cursor=page.cursor)] if keep_empty else []
+    chunks = []
+    for i in range(0, len(page.entries), LOG_CHUNK_LINES):
+        entries = page.entries[i:i + LOG_CHUNK_LINES]
+        last = i + LOG_CHUNK_LINES >= len(page.entries)
+        chunks.append(chord_pb2.LogChunk(log_line=[text for _, _, text in entries], start=entries[0][0],
+                                         cursor=page.cursor if last else entries[-1][1]))
+    return chunks
+
+
+class LogStream:
+    """Server side of one StreamLogs call: the requested page first, then new lines while following."""
+
+    def __init__(self, reader: LogReader, request: chord_pb2.StreamLogsRequest):
+        self.reader = reader
+        self.follow = request.follow
+        self.max_lines = min(request.max_lines or MAX_LOG_LINES, MAX_LOG_LINES)
+        self.min_level = parse_level(request.min_level)
+        self.cursor = request.cursor if request.HasField('cursor') else None
+        self.before = request.before if request.HasField('before') else None
+
+    def first(self) -> list[chord_pb2.LogChunk]:
+        if self.cursor is not None:
+            page = self.reader.read(self.cursor, self.max_lines, self.min_level)
+        else:
+            page = self.reader.tail(self.max_lines, self.min_level, self.before)
+        self.cursor = page.cursor
+        return log_chunks(page, keep_empty=True)
+
+    def poll(self) -> list[chord_pb2.LogChunk]:
+        page = self.reader.read(self.cursor, MAX_LOG_LINES, self.min_level)
+        self.cursor = page.cursor
+        return log_chunks(page)
@@ -0,0 +1,44 @@
+import grpc
+
+from business.node import Node
+from presentation.id_codec import decode_id
+
+
+class NodeRouter:
+    """Routes a request to the virtual node named by its target_id.
+
+    Requests without a target go to the primary node so single-node deployments and
+    older clients keep working. An explicit target this process does not host is
+    rejected with NOT_FOUND rather than applied to the wrong node.
+    """
+
+    def __init__(self, node: Node, virtual_nodes: list[Node] | None = None):
+        self.node = node
+        self.nodes: dict[int, Node] = {node.node_id: node}
+        for virtual_node in virtual_nodes or []:
+            self.nodes[virtual_node.node_id] = virtual_node
+
+    def find(self, target_id: str | bytes | None) -> Node | None:
+        if not target_id:
+            return self.node
+        if isinstance(target_id, bytes):
+            return self.nodes.get(decode_id(target_id))
+        if not target_id.isdigit():
+            return None
+        return self.nodes.get(int(target_id))
+
+    @staticmethod
+    def unknown_target(target_id: str | bytes) -> str:
+        return f"Node {decode_id(target_id) if isinstance(target_id, bytes) else target_id} is not hosted here"
+
+    def route(self, target_id: str | bytes | None, context) -> Node:
+        node = self.find(target_id)
+        if node is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, self.unknown_target(target_id))
+        return node
+
+    async def route_async(self, target_id: str | bytes | None, context) -> Node:
+        node = self.find(target_id)
+        if node is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, self.unknown_target(target_id))
+        return node
@@ -0,0 +1,3 @@
+from simulation.models import ConstantLatency, CoordinateLatency, FailureModel, LatencyModel, UniformLatency
+from simulation.network import Fabric, SimulatedNetwork
+from simulation.simulator import OperationReport, RingSimulator
@@ -0,0 +1,66 @@
+import argparse
+import logging
+import time
+
+from simulation.models import CoordinateLatency, FailureModel, LatencyModel, UniformLatency
+from simulation.simulator import OperationReport, RingSimulator
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m simulation', description='In-process Chord ring benchmark')
+    parser.add_argument('--nodes', type=int, default=1000)
+    parser.add_argument('--bits', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--lookups', type=int, default=10000)
+    parser.add_argument('--puts', type=int, default=1000)
+    parser.add_argument('--gets', type=int, default=1000)
+    parser.add_argument('--churn', type=int, default=0, help='nodes that crash and nodes that join')
+    parser.add_argument('--rounds', type=int, default=2, help='maintenance rounds after churn')
+    parser.add_argument('--latency', choices=['none', 'uniform', 'coordinate'], default='coordinate')
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    parser.add_argument('--iterative', action='store_true')
+    parser.add_argument('--proximity-routing', action='store_true')
+    parser.add_argument('--replication-factor', type=int, default=0)
+    parser.add_argument('--lazy-join', action='store_true')
+    parser.add_argument('--finger-hint-hops', type=int, default=0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    latency = {
+        'none': LatencyModel(),
+        'uniform': UniformLatency(0.001, 0.05, seed=args.seed),
+        'coordinate': CoordinateLatency(seed=args.seed),
+    }[args.latency]
+
+    started = time.perf_counter()
+    simulator = RingSimulator(args.nodes, args.bits, args.seed, latency, FailureModel(args.drop_rate, args.seed),
+                              iterative_lookup=args.iterative, proximity_routing=args.proximity_routing,
+                              replication_factor=args.replication_factor, lazy_join=args.lazy_join,
+                              finger_hint_hops=args.finger_hint_hops)
+    simulator.build()
+    print(f'Built a ring of {args.nodes} nodes in {time.perf_counter() - started:.1f}s')
+
+    if args.proximity_routing:
+        # routing only prefers peers it has measured, so let one round of maintenance observe them
+        simulator.maintain(1)
+
+    reports = [simulator.run_lookups(args.lookups), simulator.run_puts(args.puts)]
+    if args.churn:
+        simulator.fail(args.churn)
+        background = OperationReport('join background')
+        reports.append(simulator.join(args.churn, background))
+        reports.append(background)
+        reports.append(simulator.maintain(args.rounds))
+        print(f'Ring converged after churn: {simulator.converged()}')
+        reports.append(simulator.run_lookups(args.lookups))
+    reports.append(simulator.run_gets(args.gets))
+
+    for report in reports:
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import math
+import random
+
+
+class LatencyModel:
+    """One-way RPC latency in seconds; the base model is an ideal zero-latency network."""
+
+    def sample(self, source: int, target: int) -> float:
+        return 0.0
+
+
+class ConstantLatency(LatencyModel):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def sample(self, source: int, target: int) -> float:
+        return self.seconds
+
+
+class UniformLatency(LatencyModel):
+    def __init__(self, low: float, high: float, seed: int = 0):
+        self.low = low
+        self.high = high
+        self.rng = random.Random(seed)
+
+    def sample(self, source: int, target: int) -> float:
+        return self.rng.uniform(self.low, self.high)
+
+
+class CoordinateLatency(LatencyModel):
+    """Places every node at a fixed random point of a unit square; latency grows with distance.
+
+    Pairs keep the same latency for the whole run, which is what proximity routing exploits.
+    """
+
+    def __init__(self, base: float = 0.0005, spread: float = 0.1, jitter: float = 0.0, seed: int = 0):
+        self.base = base
+        self.spread = spread
+        self.jitter = jitter
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.coordinates: dict[int, tuple[float, float]] = {}
+
+    def position(self, node_id: int) -> tuple[float, float]:
+        if node_id not in self.coordinates:
+            placement = random.Random(f'{self.seed}:{node_id}')
+            self.coordinates[node_id] = (placement.random(), placement.random())
+        return self.coordinates[node_id]
+
+    def sample(self, source: int, target: int) -> float:
+        distance = math.dist(self.position(source), self.position(target))
+        noise = self.rng.uniform(0, self.jitter) if self.jitter else 0.0
+        return self.base + self.spread * distance + noise
+
+
+class FailureModel:
+    """Drops a fraction of RPCs as if the peer had timed out; the base model never fails."""
+
+    def __init__(self, drop_rate: float = 0.0, seed: int = 0):
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+
+    def fails(self, source: int, target: int) -> bool:
+        return self.drop_rate > 0 and self.rng.random() < self.drop_rate
@@ -0,0 +1,210 @@
+from collections import Counter
+from collections.abc import Iterable
+from concurrent import futures
+from typing import Callable
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from business.routing_state import RoutingState
+from presentation.latency import PeerLatency
+from simulation.models import FailureModel, LatencyModel
+
+
+class InlineExecutor(futures.Executor):
+    """Runs submitted work on the caller's thread so a simulation is single-threaded and repeatable."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class DeferredExecutor(futures.Executor):
+    """Queues submitted work until run(), so background tasks are measured apart from the call that spawned them."""
+
+    def __init__(self):
+        self.pending: list[tuple[futures.Future, Callable, tuple, dict]] = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = futures.Future()
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def run(self):
+        while self.pending:
+            future, fn, args, kwargs = self.pending.pop(0)
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+class Fabric:
+    """The shared medium every SimulatedNetwork talks through.
+
+    It owns the nodes, decides which RPCs get through and keeps the per-method RPC
+    counts and the simulated time spent on the wire.
+    """
+
+    def __init__(self, latency: LatencyModel | None = None, failures: FailureModel | None = None):
+        self.nodes: dict[int, Node] = {}
+        self.dead: set[int] = set()
+        self.latency = latency or LatencyModel()
+        self.failures = failures or FailureModel()
+        self.rpcs: Counter[str] = Counter()
+        self.clock = 0.0
+
+    def add(self, node: Node):
+        self.nodes[node.node_id] = node
+        self.dead.discard(node.node_id)
+
+    def kill(self, node_id: int):
+        self.dead.add(node_id)
+
+    def alive(self, node_id) -> bool:
+        return node_id in self.nodes and node_id not in self.dead
+
+    def deliver(self, method: str, source: int, target) -> float | None:
+        self.rpcs[method] += 1
+        if not self.alive(target):
+            return None
+        seconds = self.latency.sample(source, target)
+        self.clock += seconds
+        if self.failures.fails(source, target):
+            return None
+        return seconds
+
+
+class SimulatedNetwork(NodeNetworkInterface):
+    """In-process stand-in for KubernetesNetwork: one per node, every call goes through the fabric.
+
+    Handlers mirror ChordServer, and an unreachable peer is reported to the local node
+    through handle_dead_node exactly like a grpc.RpcError would be.
+    """
+
+    def __init__(self, fabric: Fabric, local_id: int):
+        self.fabric = fabric
+        self.local_id = local_id
+        self.latency = PeerLatency()
+
+    def call(self, method: str, target, handler: Callable[[Node], object]):
+        seconds = self.fabric.deliver(method, self.local_id, target)
+        if seconds is None:
+            self.handle_dead_node(target)
+            return None
+        self.latency.observe(target, seconds)
+        return handler(self.fabric.nodes[target])
+
+    @staticmethod
+    def predecessor_of(node: Node) -> int:
+        # ChordServer answers with the node itself while it has no predecessor
+        predecessor = node.predecessor
+        return predecessor if predecessor is not None else node.node_id
+
+    @staticmethod
+    def neighbors_of(node: Node) -> tuple[int, list[int]]:
+        routing = node.routing
+        return (routing.predecessor if routing.predecessor is not None else node.node_id,
+                list(routing.successor_list))
+
+    def handle_dead_node(self, node_id):
+        self.latency.forget(node_id)
+        if self.fabric.alive(self.local_id):
+            self.fabric.nodes[self.local_id].handle_dead_node(node_id)
+
+    def peer_latency(self, node_id: int) -> float | None:
+        return self.latency.get(node_id)
+
+    def find_successor(self, target_id: int, key: int) -> int | None:
+        return self.call('find_successor', target_id, lambda node: node.find_successor(key, coalesce=False))
+
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        return self.call('find_next_hop', target_id, lambda node: node.find_next_hop(key))
+
+    def get_predecessor(self, target_id: int) -> int | None:
+        return self.call('get_predecessor', target_id, self.predecessor_of)
+
+    def get_neighbors(self, target_id: int) -> tuple[int | None, list[int]] | None:
+        return self.call('get_neighbors', target_id, self.neighbors_of)
+
+    def get_routing_state(self, target_id: int) -> RoutingState | None:
+        return self.call('get_routing_state', target_id, lambda node: node.routing)
+
+    def set_predecessor(self, target_id: int, new_predecessor_id: int):
+        self.call('set_predecessor', target_id, lambda node: node.set_predecessor(new_predecessor_id))
+
+    def set_successor(self, target_id: int, new_successor_id: int):
+        self.call('set_successor', target_id, lambda node: node.set_successor(new_successor_id))
+
+    def notify(self, target_id: int, sender_id: int) -> list[int] | None:
+        def handler(node):
+            node.notify(sender_id)
+            return list(node.successor_list)
+
+        return self.call('notify', target_id, handler)
+
+    def update_finger_table(self, target_id: int, new_node_id: int, index: int):
+        self.call('update_finger_table', target_id, lambda node: node.update_finger_table(new_node_id, index))
+
+    def finger_hint(self, target_id: int, new_node_id: int, hops: int):
+        self.call('finger_hint', target_id, lambda node: node.finger_hint(new_node_id, hops))
+
+    def get_information(self, target_node_id: int, info_key: int) -> str | None:
+        def handler(node):
+            info = node.node_has_info(info_key)
+            return info if info is not None else "None"
+
+        return self.call('get_information', target_node_id, handler)
+
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
+        return bool(self.call('add_information', target_node_id, lambda node: node.add_information(info_key, info)))
+
+    def remove_information(self, target_node_id: int, info_key: int):
+        self.call('remove_information', target_node_id, lambda node: node.remove_info(info_key))
+
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        return self.call('get_many', target_node_id, lambda node: node.get_local_information(info_keys))
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        return self.call('put_many', target_node_id, lambda node: node.add_many_information(items))
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        return self.call('remove_many', target_node_id, lambda node: node.remove_many_information(info_keys))
+
+    def hand_off(self, target_node_id: int, session_id: str, chunks: Iterable[dict[int, str]]) -> bool:
+        def handler(node):
+            for chunk in chunks:
+                node.receive_handoff(session_id, chunk)
+            return True
+
+        return bool(self.call('hand_off', target_node_id, handler))
+
+    def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        return self.call('get_handoff_cursor', target_node_id, lambda node: node.get_handoff_cursor(session_id))
+
+    def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        return bool(self.call('request_handoff', target_node_id,
+                              lambda node: node.serve_handoff(requester_id, start, end)))
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        def handler(node):
+            node.add_redundant_info(info_key, info)
+            return True
+
+        return self.call('add_redundant_info', target_node_id, handler)
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        def handler(node):
+            node.add_redundant_many(items)
+            return True
+
+        return self.call('add_redundant_many', target_node_id, handler)
+
+    def remove_redundant_info(self, target_node_id: int, info_key: int):
+        self.call('remove_redundant_info', target_node_id, lambda node: node.remove_redundant_info(info_key))
+
+    def cleanup(self):
+        pass
@@ -0,0 +1,199 @@
+import bisect
+import random
+import time
+from collections import Counter
+from typing import Callable
+
+from business.metrics import MetricsRegistry
+from business.node import Node
+from simulation.models import FailureModel, LatencyModel
+from simulation.network import DeferredExecutor, Fabric, InlineExecutor, SimulatedNetwork
+
+ROUTING_RPCS = ('find_successor', 'find_next_hop')
+
+
+class OperationReport:
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.errors = 0
+        self.hops: Counter[int] = Counter()
+        self.rpcs: Counter[str] = Counter()
+        self.simulated_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def record(self, rpcs: Counter[str], simulated_seconds: float, wall_seconds: float, correct: bool = True):
+        self.count += 1
+        self.errors += not correct
+        self.hops[sum(rpcs[method] for method in ROUTING_RPCS)] += 1
+        self.rpcs.update(rpcs)
+        self.simulated_seconds += simulated_seconds
+        self.wall_seconds += wall_seconds
+
+    def percentile(self, fraction: float) -> int:
+        seen = 0
+        for hops in sorted(self.hops):
+            seen += self.hops[hops]
+            if seen >= fraction * self.count:
+                return hops
+        return 0
+
+    def summary(self) -> dict[str, float | int]:
+        count = self.count or 1
+        return {
+            'ops': self.count,
+            'errors': self.errors,
+            'mean_hops': sum(hops * n for hops, n in self.hops.items()) / count,
+            'p50_hops': self.percentile(0.5),
+            'p99_hops': self.percentile(0.99),
+            'rpcs_per_op': sum(self.rpcs.values()) / count,
+            'simulated_latency_ms': self.simulated_seconds / count * 1000,
+            'ops_per_second': self.count / self.wall_seconds if self.wall_seconds else 0.0,
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+        output = (f'{self.name}: {summary["ops"]} ops, {summary["errors"]} errors, '
+                  f'{summary["ops_per_second"]:.0f} ops/s wall clock\n')
+        output += (f'\thops mean {summary["mean_hops"]:.2f}, p50 {summary["p50_hops"]}, p99 {summary["p99_hops"]}; '
+                   f'simulated latency {summary["simulated_latency_ms"]:.2f} ms/op\n')
+        widest = max(self.hops.values(), default=1)
+        for hops in sorted(self.hops):
+            output += f'\t{hops:3d} hops {self.hops[hops]:7d} {"#" * max(1, 40 * self.hops[hops] // widest)}\n'
+        for method, n in self.rpcs.most_common():
+            output += f'\t{method}: {n / (self.count or 1):.2f} per op\n'
+        return output
+
+
+class RingSimulator:
+    """Runs a whole Chord ring in one process on top of SimulatedNetwork.
+
+    Everything is driven by one seed: node ids, workload keys, churn victims and the
+    models' randomness, so two runs with the same arguments see the same RPCs.
+    """
+
+    def __init__(self, size: int = 1000, m: int = 32, seed: int = 0, latency: LatencyModel | None = None,
+                 failures: FailureModel | None = None, **node_options):
+        if size > 1 << m:
+            raise ValueError(f"Cannot place {size} nodes in a {m}-bit identifier space")
+        self.m = m
+        self.rng = random.Random(seed)
+        self.metrics = node_options.setdefault('metrics', MetricsRegistry())
+        self.node_options = node_options
+        self.fabric = Fabric(latency, failures)
+        self.executor = InlineExecutor()
+        self.members: list[int] = sorted(self.rng.sample(range(1 << m), size))
+        self.keys: dict[int, str] = {}
+        for node_id in self.members:
+            self.create_node(node_id)
+
+    def create_node(self, node_id: int) -> Node:
+        node = Node(node_id, self.m, SimulatedNetwork(self.fabric, node_id), **self.node_options)
+        node.executor = node.replication_executor = node.finger_executor = self.executor
+        self.fabric.add(node)
+        return node
+
+    def owner(self, key: int) -> int:
+        return self.members[bisect.bisect_left(self.members, key) % len(self.members)]
+
+    def build(self):
+        # wires the converged ring directly; joining thousands of nodes one by one is a benchmark of its own
+        size = len(self.members)
+        for index, node_id in enumerate(self.members):
+            node = self.fabric.nodes[node_id]
+            node.predecessor = self.members[index - 1]
+            node.successor_list = [self.members[(index + i) % size] for i in range(1, node.successor_list_size + 1)
+                                   if self.members[(index + i) % size] != node_id]
+            node.successor = node.successor_list[0] if node.successor_list else node_id
+            node.finger_table = [self.owner(node.start(i)) for i in range(self.m)]
+
+    def random_member(self) -> Node:
+        return self.fabric.nodes[self.rng.choice(self.members)]
+
+    def random_key(self) -> int:
+        return self.rng.randrange(1 << self.m)
+
+    def measure(self, report: OperationReport, action: Callable[[], object],
+                check: Callable[[object], bool] = lambda result: True):
+        rpcs = Counter(self.fabric.rpcs)
+        clock = self.fabric.clock
+        started = time.perf_counter()
+        result = action()
+        wall = time.perf_counter() - started
+        report.record(self.fabric.rpcs - rpcs, self.fabric.clock - clock, wall, check(result))
+        return result
+
+    def run_lookups(self, count: int) -> OperationReport:
+        report = OperationReport('lookup')
+        for _ in range(count):
+            node, key = self.random_member(), self.random_key()
+            self.measure(report, lambda: node.find_successor(key), lambda owner: owner == self.owner(key))
+        return report
+
+    def run_puts(self, count: int) -> OperationReport:
+        report = OperationReport('put')
+        for _ in range(count):
+            node, key = self.random_member(), self.random_key()
+            value = f'value-{key}'
+            self.measure(report, lambda: node.create_info(key, value))
+            self.keys[key] = value
+        return report
+
+    def run_gets(self, count: int) -> OperationReport:
+        report = OperationReport('get')
+        if not self.keys:
+            return report
+        keys = list(self.keys)
+        for _ in range(count):
+            node, key = self.random_member(), self.rng.choice(keys)
+            self.measure(report, lambda: node.get_information(key), lambda info: info == self.keys[key])
+        return report
+
+    def join(self, count: int, background: OperationReport | None = None) -> OperationReport:
+        report = OperationReport('join')
+        background = background or OperationReport('join background')
+        for _ in range(count):
+            node_id = self.random_key()
+            while node_id in self.fabric.nodes:
+                node_id = self.random_key()
+            bootstrap = self.random_member().node_id
+            node = self.create_node(node_id)
+            # what the join hands to its executor runs after it returns, as it would on a live node
+            node.executor = deferred = DeferredExecutor()
+            self.measure(report, lambda: node.join(bootstrap), lambda result: node.successor is not None)
+            node.executor = self.executor
+            if node.successor is None:
+                # a join that could not find the ring leaves the node out, as a pod that exits to retry would
+                self.fabric.kill(node_id)
+                continue
+            self.measure(background, deferred.run)
+            bisect.insort(self.members, node_id)
+        return report
+
+    def leave(self, count: int) -> OperationReport:
+        report = OperationReport('leave')
+        for _ in range(min(count, len(self.members) - 1)):
+            node = self.random_member()
+            self.measure(report, node.leave)
+            self.remove(node.node_id)
+        return report
+
+    def fail(self, count: int):
+        for _ in range(min(count, len(self.members) - 1)):
+            self.remove(self.random_member().node_id)
+
+    def remove(self, node_id: int):
+        self.fabric.kill(node_id)
+        self.members.remove(node_id)
+
+    def maintain(self, rounds: int = 1) -> OperationReport:
+        report = OperationReport('maintenance')
+        for _ in range(rounds):
+            for node_id in list(self.members):
+                node = self.fabric.nodes[node_id]
+                self.measure(report, lambda: (node.check_predecessor(), node.stabilize(), node.fix_fingers()))
+        return report
+
+    def converged(self) -> bool:
+        return all(self.fabric.nodes[node_id].successor == self.owner((node_id + 1) % (1 << self.m))
+                   for node_id in self.members)
@@ -0,0 +1,125 @@
+import unittest
+
+from business.async_node import AsyncNode
+from business.async_node_network_interface import AsyncNodeNetworkInterface
+
+
+class AsyncMockNetwork(AsyncNodeNetworkInterface):
+    def __init__(self):
+        self.nodes: dict[int, AsyncNode] = {}
+
+    def register_node(self, node: AsyncNode):
+        self.nodes[node.node_id] = node
+
+    async def find_successor(self, requester_id: int, key: int) -> int:
+        return await self.nodes[requester_id].find_successor(key)
+
+    async def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        return self.nodes[target_id].find_next_hop(key)
+
+    async def get_predecessor(self, node_id: int) -> int | None:
+        return self.nodes[node_id].predecessor
+
+    async def get_neighbors(self, node_id: int) -> tuple[int | None, list[int]] | None:
+        return self.nodes[node_id].predecessor, self.nodes[node_id].successor_list
+
+    async def set_predecessor(self, node_id: int, predecessor_id: int):
+        self.nodes[node_id].predecessor = predecessor_id
+
+    async def set_successor(self, node_id: int, successor_id: int):
+        self.nodes[node_id].successor = successor_id
+
+    async def notify(self, node_id: int, potential_pred_id: int) -> list[int] | None:
+        self.nodes[node_id].notify(potential_pred_id)
+        return self.nodes[node_id].successor_list
+
+    async def update_finger_table(self, node_id: int, s: int, i: int):
+        await self.nodes[node_id].update_finger_table(s, i)
+
+    async def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
+        return self.nodes[target_node_id].node_has_info(info_key)
+
+    async def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
+        return await self.nodes[target_node_id].store_information(info_key, info)
+
+    async def remove_information(self, target_node_id: int, info_key: int):
+        self.nodes[target_node_id].remove_information(info_key)
+
+    async def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        self.nodes[target_node_id].add_redundant_info(info_key, info)
+        return True
+
+    async def remove_redundant_info(self, target_node_id: int, info_key: int):
+        self.nodes[target_node_id].remove_redundant_info(info_key)
+
+    async def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        return self.nodes[target_node_id].get_local_information(info_keys)
+
+    async def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        return self.nodes[target_node_id].add_many_information(items)
+
+    async def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        return self.nodes[target_node_id].remove_many_information(info_keys)
+
+    async def hand_off(self, target_node_id: int, session_id: str, chunks) -> bool:
+        for chunk in chunks:
+            self.nodes[target_node_id].receive_handoff(session_id, chunk)
+        return True
+
+    async def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        return self.nodes[target_node_id].get_handoff_cursor(session_id)
+
+    async def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        node = self.nodes[target_node_id]
+        return await node.hand_off(requester_id, node.get_range(start, end), release=True)
+
+
+class TestAsyncNode(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.network = AsyncMockNetwork()
+        self.m = 5
+        self.nodes = {}
+
+        for node_id in [3, 7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id] = AsyncNode(node_id, self.m, self.network, replication_factor=2, write_quorum=1)
+            self.network.register_node(self.nodes[node_id])
+
+        await self.nodes[3].join(None)
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            await self.nodes[node_id].join(3)
+
+        for _ in range(11):
+            for node in self.nodes.values():
+                await node.stabilize()
+            for node in self.nodes.values():
+                await node.fix_fingers()
+
+    async def test_find_successor(self):
+        self.assertEqual(await self.nodes[7].find_successor(9), 12)
+        self.assertEqual(await self.nodes[21].find_successor(1), 3)
+        self.assertEqual(await self.nodes[12].find_successor(22), 27)
+
+    async def test_successor_list(self):
+        self.assertEqual(self.nodes[27].successor_list, [30, 3, 7])
+        self.nodes[27].handle_dead_node(30)
+        self.assertEqual(self.nodes[27].successor, 3)
+
+    async def test_create_and_remove_info(self):
+        self.assertTrue(await self.nodes[21].create_info(15, 'abc'))
+        self.assertFalse(await self.nodes[3].create_info(15, 'def'))
+        self.assertEqual(self.nodes[21].node_has_info(15), 'abc')
+        self.assertEqual(await self.nodes[8].get_information(15), 'abc')
+        self.assertEqual(self.nodes[27].redundant_information, {15: 'abc'})
+
+        self.assertTrue(await self.nodes[7].remove_info(15))
+        self.assertEqual(await self.nodes[8].get_information(15), None)
+
+    async def test_batched_info(self):
+        self.assertEqual(await self.nodes[21].create_many({9: 'a', 13: 'b', 31: 'c'}), {9: True, 13: True, 31: True})
+        self.assertEqual(await self.nodes[7].get_many([9, 13, 14]), {9: 'a', 13: 'b', 14: None})
+        self.assertEqual(await self.nodes[3].remove_many([9, 14]), {9: True, 14: False})
+        self.assertEqual(self.nodes[12].node_has_info(9), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
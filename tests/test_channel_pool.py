@@ -0,0 +1,134 @@
+import asyncio
+import socket
+import time
+import unittest
+from concurrent import futures
+
+import grpc
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from presentation import chord_pb2
+from presentation import chord_pb2_grpc
+from presentation.channel_pool import AsyncChannelPool, ChannelPool, CircuitBreaker, PeerUnavailable
+from presentation.chord_server import ChordServer
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+class TestChannelPool(unittest.TestCase):
+    def setUp(self):
+        self.node = Node(1, 6, NodeNetworkInterface())
+        self.node.join(None)
+
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(self.node), self.server)
+        port = self.server.add_insecure_port('localhost:0')
+        self.server.start()
+
+        self.addresses = {1: f'localhost:{port}', 2: f'localhost:{unused_port()}'}
+        self.pool = ChannelPool(self.addresses.get, idle_timeout=60.0)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.stop(None)
+
+    def find_successor(self, node_id: int) -> str:
+        req = chord_pb2.FindSuccessorRequest(target_id=str(node_id), key='5')
+        return self.pool.stub(node_id).FindSuccessor(req, timeout=1).successor_id
+
+    def test_reuses_stub(self):
+        self.assertEqual(self.find_successor(1), '1')
+        self.assertIs(self.pool.stub(1), self.pool.stub(1))
+        self.assertFalse(self.pool.is_open(1))
+
+    def test_dead_peer_fails_fast(self):
+        for _ in range(3):
+            with self.assertRaises(grpc.RpcError) as error:
+                self.find_successor(2)
+            self.assertNotIsInstance(error.exception, PeerUnavailable)
+        self.assertTrue(self.pool.is_open(2))
+
+        started = time.monotonic()
+        with self.assertRaises(PeerUnavailable) as error:
+            self.find_successor(2)
+        self.assertLess(time.monotonic() - started, 0.05)
+        self.assertEqual(error.exception.code(), grpc.StatusCode.UNAVAILABLE)
+
+    def test_maintain_reconnects_after_backoff(self):
+        breaker = self.pool.breaker(1)
+        for _ in range(3):
+            breaker.record_failure()
+        self.assertTrue(self.pool.maintain())
+        self.assertTrue(self.pool.is_open(1))
+
+        breaker.opened_at -= breaker.backoff
+        self.assertTrue(self.pool.maintain())
+        self.assertFalse(self.pool.is_open(1))
+        self.assertEqual(self.find_successor(1), '1')
+
+    def test_evicts_idle_channels(self):
+        self.find_successor(1)
+        self.pool.idle_timeout = 0.0
+        self.assertEqual(self.pool.evict_idle(), [1])
+        self.assertEqual(self.pool.entries, {})
+        self.assertEqual(self.find_successor(1), '1')
+
+    def test_resolves_outside_the_pool_lock(self):
+        held = []
+
+        def resolve(node_id):
+            held.append(self.pool.lock.locked())
+            return self.addresses[node_id]
+
+        self.pool.resolve = resolve
+        self.assertEqual(self.find_successor(1), '1')
+        self.assertEqual(held, [False])
+
+    def test_async_pool(self):
+        async def run():
+            pool = AsyncChannelPool(self.addresses.get, idle_timeout=60.0)
+            req = chord_pb2.FindSuccessorRequest(target_id='1', key='5')
+            self.assertEqual((await pool.stub(1).FindSuccessor(req, timeout=1)).successor_id, '1')
+            self.assertIs(pool.stub(1), pool.stub(1))
+
+            for _ in range(3):
+                with self.assertRaises(grpc.RpcError):
+                    await pool.stub(2).FindSuccessor(req, timeout=1)
+            with self.assertRaises(PeerUnavailable):
+                pool.stub(2)
+
+            breaker = pool.breaker(1)
+            for _ in range(3):
+                breaker.record_failure()
+            breaker.opened_at -= breaker.backoff
+            self.assertTrue(await pool.maintain())
+            self.assertFalse(pool.is_open(1))
+            self.assertTrue(pool.is_open(2))
+            await pool.close()
+
+        asyncio.run(run())
+
+    def test_breaker_backoff(self):
+        breaker = CircuitBreaker(failure_threshold=1, base_backoff=1.0, max_backoff=3.0)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        for expected in [2.0, 3.0, 3.0]:
+            breaker.opened_at -= breaker.backoff
+            self.assertTrue(breaker.allow())
+            self.assertFalse(breaker.allow())
+            breaker.record_failure()
+            self.assertEqual(breaker.backoff, expected)
+
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.backoff, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
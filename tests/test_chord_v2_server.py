@@ -0,0 +1,65 @@
+import unittest
+from concurrent import futures
+
+import grpc
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from presentation import chord_v2_pb2
+from presentation import chord_v2_pb2_grpc
+from presentation.chord_v2_server import ChordV2Server
+from presentation.id_codec import decode_id, encode_id
+
+
+class TestChordV2Server(unittest.TestCase):
+    def setUp(self):
+        self.node = Node(42, 8, NodeNetworkInterface())
+        self.node.join(None)
+
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        chord_v2_pb2_grpc.add_ChordV2Servicer_to_server(ChordV2Server(self.node), self.server)
+        port = self.server.add_insecure_port('localhost:0')
+        self.server.start()
+
+        self.channel = grpc.insecure_channel(f'localhost:{port}')
+        self.stub = chord_v2_pb2_grpc.ChordV2Stub(self.channel)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+
+    def test_id_codec(self):
+        for value in [0, 1, 255, 256, 2 ** 64, 2 ** 160 - 1]:
+            self.assertEqual(decode_id(encode_id(value)), value)
+        self.assertEqual(encode_id(0), b'\x00')
+
+    def test_find_successor(self):
+        res = self.stub.FindSuccessor(chord_v2_pb2.FindSuccessorRequest(key=encode_id(200)))
+        self.assertEqual(decode_id(res.successor_id), 42)
+
+    def test_information_presence(self):
+        res = self.stub.GetInformation(chord_v2_pb2.GetInfoRequest(key=encode_id(7)))
+        self.assertFalse(res.HasField('information'))
+
+        self.stub.AddInformation(chord_v2_pb2.AddInfoRequest(key=encode_id(7), information='abc'.encode()))
+        res = self.stub.GetInformation(chord_v2_pb2.GetInfoRequest(key=encode_id(7)))
+        self.assertTrue(res.HasField('information'))
+        self.assertEqual(res.information, b'abc')
+
+    def test_batched_information(self):
+        entries = [chord_v2_pb2.Entry(key=encode_id(k), value=v) for k, v in [(1, b'a'), (300, b'b')]]
+        res = self.stub.PutMany(chord_v2_pb2.PutManyRequest(entries=entries))
+        self.assertEqual(sorted(decode_id(key) for key in res.created_keys), [1, 300])
+
+        res = self.stub.GetMany(chord_v2_pb2.GetManyRequest(keys=[encode_id(1), encode_id(2), encode_id(300)]))
+        self.assertEqual({decode_id(entry.key): entry.value for entry in res.entries}, {1: b'a', 300: b'b'})
+
+    def test_set_predecessor_clears_without_sentinel(self):
+        self.stub.SetPredecessor(chord_v2_pb2.SetPredecessorRequest(new_predecessor_id=encode_id(9)))
+        self.assertEqual(self.node.predecessor, 9)
+        self.stub.SetPredecessor(chord_v2_pb2.SetPredecessorRequest())
+        self.assertIsNone(self.node.predecessor)
+
+
+if __name__ == "__main__":
+    unittest.main()
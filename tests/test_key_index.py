@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from persistence.key_index import HEADER_SIZE, SortedKeyIndex
+
+
+class TestSortedKeyIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'keys.idx')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ring_ranges(self):
+        index = SortedKeyIndex(1)
+        for key in [30, 5, 12, 1, 9]:
+            index.add(key)
+
+        self.assertEqual(list(index), [1, 5, 9, 12, 30])
+        self.assertEqual(index.range(5, 12), [9, 12])
+        self.assertEqual(index.range(20, 5), [30, 1, 5])
+        self.assertEqual(index.range(9, 9), [12, 30, 1, 5, 9])
+
+    def test_mapped_base_with_overlay(self):
+        index = SortedKeyIndex(2, self.path)
+        for key in [300, 5, 1000]:
+            index.add(key)
+        index.dump()
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 6)
+        self.assertEqual(SortedKeyIndex(2, self.path).generation, 0)
+
+        index.discard(5)
+        index.add(7)
+        index.add(300)
+        self.assertEqual(list(index), [7, 300, 1000])
+        self.assertEqual(len(index), 3)
+        self.assertNotIn(5, index)
+        self.assertIn(1000, index)
+        self.assertEqual(index.range(6, 300), [7, 300])
+        index.close()
+
+        reopened = SortedKeyIndex(2, self.path)
+        self.assertEqual(list(reopened), [5, 300, 1000])
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
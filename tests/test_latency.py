@@ -0,0 +1,41 @@
+import time
+import unittest
+from collections import namedtuple
+
+from presentation.latency import LatencyInterceptor, PeerLatency
+
+CallDetails = namedtuple('CallDetails', 'method')
+
+
+class Outcome:
+    def done(self):
+        return True
+
+    def exception(self):
+        return None
+
+
+class TestLatencyInterceptor(unittest.TestCase):
+    def setUp(self):
+        self.latency = PeerLatency()
+        self.interceptor = LatencyInterceptor(7, self.latency)
+
+    def call(self, method: str, seconds: float):
+        def continuation(details, request):
+            time.sleep(seconds)
+            return Outcome()
+
+        self.interceptor.intercept_unary_unary(continuation, CallDetails(method), None)
+
+    def test_only_point_calls_feed_the_estimate(self):
+        self.call('/chord.Chord/FindSuccessor', 0.05)
+        self.call('/chord.Chord/PutMany', 0.05)
+        self.assertIsNone(self.latency.get(7))
+
+        self.call('/chord.Chord/FindNextHop', 0)
+        self.call('/chord.v2.ChordV2/Notify', 0)
+        self.assertLess(self.latency.get(7), 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import logging
+import os
+import tempfile
+import time
+import unittest
+from concurrent import futures
+
+import grpc
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from persistence.log_reader import LogReader
+from presentation import chord_pb2
+from presentation import chord_pb2_grpc
+from presentation.chord_server import ChordServer
+from presentation.log_stream import FOLLOW_INTERVAL, MAX_FOLLOWERS
+
+
+def record(index: int, level: str = 'INFO') -> str:
+    return f'2024-01-01 00:00:00,000 - business.node - {level} - message {index}'
+
+
+class TestLogReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'app.log')
+        self.lines = [record(i, 'ERROR' if i % 10 == 0 else 'INFO') for i in range(500)]
+        self.write(self.lines)
+        # small blocks so every read crosses several of them
+        self.reader = LogReader(self.path, block_size=128)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, lines: list[str], mode: str = 'w', partial: str = ''):
+        with open(self.path, mode) as log_file:
+            log_file.write(''.join(line + '\n' for line in lines) + partial)
+
+    def test_tail(self):
+        self.assertEqual(self.reader.tail(1).lines, self.lines[-1:])
+        self.assertEqual(self.reader.tail(25).lines, self.lines[-25:])
+        self.assertEqual(self.reader.tail(10000).lines, self.lines)
+        self.assertEqual(LogReader(os.path.join(self.directory.name, 'missing.log')).tail(10).lines, [])
+
+    def test_page_backward(self):
+        newest = self.reader.tail(30)
+        older = self.reader.tail(30, before=newest.start)
+        self.assertEqual(older.lines + newest.lines, self.lines[-60:])
+        self.assertEqual(newest.cursor, os.path.getsize(self.path))
+
+    def test_level_filter_keeps_tracebacks(self):
+        self.write([record(500, 'ERROR'), 'Traceback (most recent call last):', '  raise RuntimeError()',
+                    record(501, 'DEBUG'), '  continued debug line', record(502)], mode='a')
+
+        page = self.reader.tail(4, min_level=logging.ERROR)
+        self.assertEqual(page.lines, [self.lines[490], record(500, 'ERROR'), 'Traceback (most recent call last):',
+                                      '  raise RuntimeError()'])
+
+    def test_read_forward(self):
+        first = self.reader.read(0, 100)
+        second = self.reader.read(first.cursor, 100)
+        self.assertEqual(first.lines + second.lines, self.lines[:200])
+        # a cursor in the middle of a line resumes at the next one
+        self.assertEqual(self.reader.read(first.cursor + 3, 1).lines, self.lines[101:102])
+
+        errors = self.reader.read(0, 1000, min_level=logging.ERROR)
+        self.assertEqual(errors.lines, self.lines[::10])
+        self.assertEqual(errors.cursor, os.path.getsize(self.path))
+
+    def test_partial_line_is_not_returned(self):
+        self.write([], mode='a', partial='2024-01-01 00:00:00,000 - business.node - INFO - half')
+        end = self.reader.tail(1)
+        self.assertEqual(end.lines, self.lines[-1:])
+        self.assertEqual(self.reader.read(end.cursor, 10).lines, [])
+
+        self.write([], mode='a', partial=' written\n')
+        self.assertEqual(self.reader.read(end.cursor, 10).lines,
+                         ['2024-01-01 00:00:00,000 - business.node - INFO - half written'])
+
+    def test_truncation_restarts_from_the_beginning(self):
+        cursor = self.reader.tail(1).cursor
+        self.write([record(0)])
+        self.assertEqual(self.reader.read(cursor, 10).lines, [record(0)])
+
+
+class TestStreamLogs(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'app.log')
+        with open(self.path, 'w') as log_file:
+            log_file.writelines(record(i) + '\n' for i in range(600))
+        self.node = Node(7, 6, NodeNetworkInterface(), log_path=self.path)
+
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(self.node), self.server)
+        port = self.server.add_insecure_port('localhost:0')
+        self.server.start()
+        self.channel = grpc.insecure_channel(f'localhost:{port}')
+        self.stub = chord_pb2_grpc.ChordStub(self.channel)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+        self.directory.cleanup()
+
+    def test_tail_in_chunks(self):
+        chunks = list(self.stub.StreamLogs(chord_pb2.StreamLogsRequest(max_lines=300), timeout=2))
+        self.assertEqual([len(chunk.log_line) for chunk in chunks], [256, 44])
+        self.assertEqual(chunks[0].log_line[0], record(300))
+        self.assertEqual(chunks[-1].cursor, os.path.getsize(self.path))
+
+        older = list(self.stub.StreamLogs(chord_pb2.StreamLogsRequest(max_lines=10, before=chunks[0].start),
+                                          timeout=2))
+        self.assertEqual(list(older[0].log_line), [record(i) for i in range(290, 300)])
+
+        logs = self.stub.GetLogs(chord_pb2.LogsRequest(max_lines=2), timeout=2)
+        self.assertEqual(list(logs.log_line), [record(598) + '\n', record(599) + '\n'])
+
+    def test_follow(self):
+        stream = self.stub.StreamLogs(chord_pb2.StreamLogsRequest(max_lines=1, follow=True), timeout=5)
+        self.assertEqual(list(next(stream).log_line), [record(599)])
+        with open(self.path, 'a') as log_file:
+            log_file.write(record(600) + '\n')
+        self.assertEqual(list(next(stream).log_line), [record(600)])
+        stream.cancel()
+
+    def test_followers_are_capped(self):
+        request = chord_pb2.StreamLogsRequest(max_lines=1, follow=True)
+        streams = [self.stub.StreamLogs(request, timeout=5) for _ in range(MAX_FOLLOWERS)]
+        for stream in streams:
+            next(stream)
+        with self.assertRaises(grpc.RpcError) as raised:
+            next(self.stub.StreamLogs(request, timeout=2))
+        self.assertEqual(raised.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(len(list(self.stub.StreamLogs(chord_pb2.StreamLogsRequest(max_lines=1), timeout=2))), 1)
+
+        streams.pop().cancel()
+        time.sleep(2 * FOLLOW_INTERVAL)
+        streams.append(self.stub.StreamLogs(request, timeout=2))
+        self.assertEqual(list(next(streams[-1]).log_line), [record(599)])
+        for stream in streams:
+            stream.cancel()
+
+    def test_unknown_level(self):
+        with self.assertRaises(grpc.RpcError) as raised:
+            list(self.stub.StreamLogs(chord_pb2.StreamLogsRequest(min_level='LOUD'), timeout=2))
+        self.assertEqual(raised.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
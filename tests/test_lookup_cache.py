@@ -0,0 +1,48 @@
+import unittest
+
+from business.lookup_cache import LookupCache
+
+
+class TestLookupCache(unittest.TestCase):
+    def test_arcs_grow_towards_lowest_resolved_key(self):
+        cache = LookupCache()
+        cache.put(10, 12)
+        cache.put(9, 12)
+
+        self.assertEqual(cache.get(11), 12)
+        self.assertEqual(cache.get(9), 12)
+        self.assertIsNone(cache.get(8))
+        self.assertIsNone(cache.get(13))
+
+    def test_wrapping_arc(self):
+        cache = LookupCache()
+        cache.put(28, 3)
+
+        self.assertEqual(cache.get(30), 3)
+        self.assertEqual(cache.get(1), 3)
+        self.assertIsNone(cache.get(20))
+
+    def test_invalidate_drops_arc_containing_new_node(self):
+        cache = LookupCache()
+        cache.put(5, 12)
+        cache.put(15, 21)
+
+        cache.invalidate(8)
+
+        self.assertIsNone(cache.get(5))
+        self.assertEqual(cache.get(15), 21)
+
+    def test_lru_eviction(self):
+        cache = LookupCache(capacity=2)
+        cache.put(1, 3)
+        cache.put(5, 7)
+        cache.get(2)
+        cache.put(10, 12)
+
+        self.assertEqual(cache.get(2), 3)
+        self.assertIsNone(cache.get(6))
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from business.node import Node
+from persistence.membership_journal import MembershipJournal
+from simulation import RingSimulator
+from simulation.network import SimulatedNetwork
+
+
+def state(successor: int, fingers: list[int]) -> dict:
+    return {'node_id': 1, 'm': 3, 'successor': successor, 'predecessor': 0,
+            'successor_list': [successor], 'finger_table': fingers}
+
+
+class TestMembershipJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal = MembershipJournal(self.directory.name, compact_every=4)
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def test_last_record_wins(self):
+        self.assertIsNone(self.journal.load())
+        self.assertTrue(self.journal.append(state(2, [2, 4, 4])))
+        self.assertFalse(self.journal.append(state(2, [2, 4, 4])))
+        self.journal.append(state(3, [3, 4, 6]))
+        self.journal.close()
+
+        self.assertEqual(MembershipJournal(self.directory.name).load(), state(3, [3, 4, 6]))
+
+    def test_torn_and_corrupt_tails_are_dropped(self):
+        self.journal.append(state(2, [2, 4, 4]))
+        self.journal.close()
+        with open(self.journal.path, 'a') as journal_file:
+            journal_file.write(MembershipJournal.encode(state(3, [3, 4, 6])).replace('"successor":3', '"successor":5'))
+            journal_file.write('0000')
+
+        reopened = MembershipJournal(self.directory.name)
+        self.assertEqual(reopened.load(), state(2, [2, 4, 4]))
+        self.assertEqual(os.path.getsize(reopened.path), len(MembershipJournal.encode(state(2, [2, 4, 4]))))
+        reopened.append(state(4, [4, 4, 6]))
+        reopened.close()
+        self.assertEqual(MembershipJournal(self.directory.name).load(), state(4, [4, 4, 6]))
+
+    def test_compaction_keeps_only_the_newest(self):
+        for successor in range(2, 8):
+            self.journal.append(state(successor, [successor] * 3))
+        self.journal.close()
+
+        with open(self.journal.path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 3)
+        self.assertEqual(MembershipJournal(self.directory.name).load(), state(7, [7] * 3))
+
+
+class TestWarmStart(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.simulator = RingSimulator(64, 12, seed=11, iterative_lookup=True)
+        self.simulator.build()
+        self.node_id = self.simulator.members[10]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def restart(self) -> Node:
+        node = Node(self.node_id, self.simulator.m, SimulatedNetwork(self.simulator.fabric, self.node_id),
+                    iterative_lookup=True, metrics=self.simulator.metrics,
+                    journal=MembershipJournal(self.directory.name))
+        node.executor = node.replication_executor = node.finger_executor = self.simulator.executor
+        self.simulator.fabric.add(node)
+        return node
+
+    def test_resume_serves_lookups_without_a_full_join(self):
+        routing = self.simulator.fabric.nodes[self.node_id].routing
+        running = self.restart()
+        running.routing = routing
+        self.assertTrue(running.save_routing())
+        expected = running.finger_table
+
+        restarted = self.restart()
+        rpcs = sum(self.simulator.fabric.rpcs.values())
+        self.assertTrue(restarted.resume())
+        self.assertLessEqual(sum(self.simulator.fabric.rpcs.values()) - rpcs, 3)
+        self.assertEqual(restarted.finger_table, expected)
+        for key in range(0, 1 << 12, 97):
+            self.assertEqual(restarted.find_successor(key), self.simulator.owner(key))
+
+    def test_dead_successors_fall_back_to_a_full_join(self):
+        routing = self.simulator.fabric.nodes[self.node_id].routing
+        running = self.restart()
+        running.routing = routing
+        running.save_routing()
+        for successor in running.successor_list:
+            self.simulator.remove(successor)
+
+        restarted = self.restart()
+        self.assertFalse(restarted.resume())
+        self.assertIsNone(restarted.successor)
+        self.assertEqual(restarted.finger_table, [self.node_id] * self.simulator.m)
+
+
+if __name__ == "__main__":
+    unittest.main()
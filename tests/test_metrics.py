@@ -0,0 +1,100 @@
+import unittest
+import urllib.request
+from concurrent import futures
+
+import grpc
+
+from business.metrics import HOP_BUCKETS, MetricsRegistry
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from presentation import chord_pb2
+from presentation import chord_pb2_grpc
+from presentation.chord_server import ChordServer
+from presentation.http_endpoint import HttpEndpoint
+from presentation.instrumentation import ClientMetricsInterceptor, RpcMetrics, ServerMetricsInterceptor
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_histogram(self):
+        registry = MetricsRegistry()
+        hops = registry.histogram('chord_lookup_hops', 'Hops', HOP_BUCKETS, node=1)
+        for value in [1, 2, 2, 3, 40]:
+            hops.observe(value)
+
+        self.assertIs(registry.histogram('chord_lookup_hops', 'Hops', HOP_BUCKETS, node=1), hops)
+        self.assertEqual(hops.count, 5)
+        self.assertEqual(hops.quantile(0.5), 2)
+        self.assertEqual(hops.quantile(1.0), 64)
+        self.assertEqual(hops.cumulative()[-1], (float('inf'), 5))
+
+    def test_render(self):
+        registry = MetricsRegistry()
+        registry.counter('chord_client_rpcs', 'RPCs', method='Notify', code='OK').inc(3)
+        registry.gauge('chord_lookups_in_flight', 'Lookups', node='a"b').inc()
+        registry.histogram('chord_lookup_duration_seconds', 'Latency', buckets=(0.1, 1.0), node=1).observe(0.5)
+
+        text = registry.render()
+        self.assertIn('# TYPE chord_client_rpcs counter\n', text)
+        self.assertIn('chord_client_rpcs_total{code="OK",method="Notify"} 3\n', text)
+        self.assertIn('chord_lookups_in_flight{node="a\\"b"} 1\n', text)
+        self.assertIn('chord_lookup_duration_seconds_bucket{node="1",le="0.1"} 0\n', text)
+        self.assertIn('chord_lookup_duration_seconds_bucket{node="1",le="+Inf"} 1\n', text)
+        self.assertIn('chord_lookup_duration_seconds_count{node="1"} 1\n', text)
+
+
+class TestRpcInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.node = Node(7, 6, NodeNetworkInterface(), metrics=self.registry)
+        self.node.join(None)
+
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2),
+                                  interceptors=[ServerMetricsInterceptor(RpcMetrics('server', self.registry))])
+        chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(self.node), self.server)
+        port = self.server.add_insecure_port('localhost:0')
+        self.server.start()
+
+        self.channel = grpc.intercept_channel(grpc.insecure_channel(f'localhost:{port}'),
+                                              ClientMetricsInterceptor(RpcMetrics('client', self.registry)))
+        self.stub = chord_pb2_grpc.ChordStub(self.channel)
+        self.endpoint = HttpEndpoint(0, self.registry, host='localhost')
+        self.endpoint.start()
+
+    def tearDown(self):
+        self.endpoint.stop()
+        self.channel.close()
+        self.server.stop(None)
+
+    def test_rpc_metrics(self):
+        self.stub.FindSuccessor(chord_pb2.FindSuccessorRequest(key='3'), timeout=2)
+        self.stub.Handoff(iter([chord_pb2.HandoffChunk(session_id='s')]), timeout=2)
+
+        for side in ['client', 'server']:
+            outcome = self.registry.counter(f'chord_{side}_rpcs', '', method='FindSuccessor', code='OK')
+            self.assertEqual(outcome.value, 1)
+            self.assertEqual(self.registry.histogram(f'chord_{side}_rpc_duration_seconds', '',
+                                                     method='Handoff').count, 1)
+            self.assertEqual(self.registry.gauge(f'chord_{side}_rpcs_in_flight', '', method='Handoff').value, 0)
+
+    def test_node_stats(self):
+        self.node.fix_fingers()
+        self.stub.FindSuccessor(chord_pb2.FindSuccessorRequest(key='3'), timeout=2)
+        stats = self.stub.GetNodeStats(chord_pb2.GetNodeStatsRequest(), timeout=2)
+
+        self.assertEqual(stats.fixes, '1')
+        self.assertEqual(stats.counters['finger_fixes'], 1)
+        self.assertIn('chord_lookups_in_flight', stats.counters)
+        names = {histogram.name for histogram in stats.histograms}
+        self.assertIn('chord_lookup_hops', names)
+        self.assertIn('chord_server_rpc_duration_seconds', names)
+
+    def test_metrics_endpoint(self):
+        self.stub.FindSuccessor(chord_pb2.FindSuccessorRequest(key='3'), timeout=2)
+        with urllib.request.urlopen(f'http://localhost:{self.endpoint.port}/metrics', timeout=2) as response:
+            self.assertTrue(response.headers['Content-Type'].startswith('text/plain'))
+            text = response.read().decode()
+        self.assertIn('chord_server_rpcs_total{code="OK",method="FindSuccessor"} 1', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
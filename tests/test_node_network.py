@@ -1,12 +1,27 @@
+import time
 import unittest
+from concurrent import futures
+
+from business.identifiers import hash_key
+from business.metrics import MetricsRegistry
 from business.node import Node
 from business.node_network_interface import NodeNetworkInterface
+from business.routing_state import RoutingState
+from presentation import chord_pb2
+from presentation.chord_server import ChordServer
+from simulation.network import DeferredExecutor
 
 
 class MockNetwork(NodeNetworkInterface):
     def __init__(self):
         self.nodes: dict[int, Node] = {}
         self.dead: set[int] = set()
+        self.batch_calls = 0
+        self.replica_batches = 0
+        self.handoff_chunks = 0
+        self.latencies: dict[int, float] = {}
+        self.elapsed = 0.0
+        self.fail_handoff_after: int | None = None
 
     def register_node(self, node: Node):
         self.nodes[node.node_id] = node
@@ -14,17 +29,39 @@ class MockNetwork(NodeNetworkInterface):
     def find_successor(self, requester_id: int, key: int) -> int:
         return self.nodes[requester_id].find_successor(key)
 
+    def peer_latency(self, node_id: int) -> float | None:
+        return self.latencies.get(node_id)
+
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        self.elapsed += self.latencies.get(target_id, 0.0)
+        return self.nodes[target_id].find_next_hop(key)
+
     def get_predecessor(self, node_id: int) -> int | None:
         return self.nodes[node_id].predecessor
 
+    def get_neighbors(self, node_id: int) -> tuple[int | None, list[int]] | None:
+        if node_id in self.dead:
+            self.nodes_alive_handle_dead(node_id)
+            return None
+        return self.nodes[node_id].predecessor, self.nodes[node_id].successor_list
+
+    def nodes_alive_handle_dead(self, dead_id: int):
+        for node_id, node in self.nodes.items():
+            if node_id not in self.dead:
+                node.handle_dead_node(dead_id)
+
     def set_predecessor(self, node_id: int, predecessor_id: int):
         self.nodes[node_id].predecessor = predecessor_id
 
     def set_successor(self, node_id: int, successor_id: int):
         self.nodes[node_id].successor = successor_id
 
-    def notify(self, node_id: int, potential_pred_id: int):
+    def notify(self, node_id: int, potential_pred_id: int) -> list[int] | None:
+        if node_id in self.dead:
+            self.nodes_alive_handle_dead(node_id)
+            return None
         self.nodes[node_id].notify(potential_pred_id)
+        return self.nodes[node_id].successor_list
 
     def update_finger_table(self, node_id: int, s: int, i: int):
         self.nodes[node_id].update_finger_table(s, i)
@@ -36,8 +73,89 @@ class MockNetwork(NodeNetworkInterface):
         self.nodes[target_node_id].remove_info(info_key)
 
     def get_information(self, target_node_id: int, info_key: int) -> [str | None]:
+        if target_node_id in self.dead:
+            self.nodes_alive_handle_dead(target_node_id)
+            return None
         return self.nodes[target_node_id].get_information(info_key)
 
+    def add_information(self, target_node_id: int, info_key: int, info: str) -> bool:
+        return self.nodes[target_node_id].add_information(info_key, info)
+
+    def add_redundant_info(self, target_node_id: int, info_key: int, info: str) -> bool | None:
+        if target_node_id in self.dead:
+            return None
+        self.nodes[target_node_id].add_redundant_info(info_key, info)
+        return True
+
+    def add_redundant_many(self, target_node_id: int, items: dict[int, str]) -> bool | None:
+        if target_node_id in self.dead:
+            return None
+        self.replica_batches += 1
+        self.nodes[target_node_id].add_redundant_many(items)
+        return True
+
+    def remove_redundant_info(self, target_node_id: int, info_key: int):
+        self.nodes[target_node_id].remove_redundant_info(info_key)
+
+    def hand_off(self, target_node_id: int, session_id: str, chunks) -> bool:
+        for chunk in chunks:
+            if self.fail_handoff_after is not None and self.handoff_chunks >= self.fail_handoff_after:
+                self.fail_handoff_after = None
+                return False
+            self.handoff_chunks += 1
+            self.nodes[target_node_id].receive_handoff(session_id, chunk)
+        return True
+
+    def get_handoff_cursor(self, target_node_id: int, session_id: str) -> int | None:
+        return self.nodes[target_node_id].get_handoff_cursor(session_id)
+
+    def request_handoff(self, target_node_id: int, requester_id: int, start: int, end: int) -> bool:
+        node = self.nodes[target_node_id]
+        return node.hand_off(requester_id, node.get_range(start, end), release=True)
+
+    def get_many(self, target_node_id: int, info_keys: list[int]) -> dict[int, str] | None:
+        self.batch_calls += 1
+        return self.nodes[target_node_id].get_local_information(info_keys)
+
+    def put_many(self, target_node_id: int, items: dict[int, str]) -> list[int] | None:
+        self.batch_calls += 1
+        return self.nodes[target_node_id].add_many_information(items)
+
+    def remove_many(self, target_node_id: int, info_keys: list[int]) -> list[int] | None:
+        self.batch_calls += 1
+        return self.nodes[target_node_id].remove_many_information(info_keys)
+
+
+class LoopingNetwork(MockNetwork):
+    # every answer sends the lookup back to the other of two nodes, as broken finger tables would
+    def find_next_hop(self, target_id: int, key: int) -> tuple[int, bool] | None:
+        return (12 if target_id == 21 else 21), False
+
+
+class LoopbackNetwork(MockNetwork):
+    # the first recursive hop forwards the lookup back to its origin on another server thread
+    def __init__(self, ring: list[int]):
+        super().__init__()
+        self.ring = ring
+        self.server = futures.ThreadPoolExecutor(max_workers=1)
+        self.looped = False
+
+    def find_successor(self, target_id: int, key: int) -> int:
+        if not self.looped:
+            self.looped = True
+            return self.server.submit(self.loop_back, key).result()
+        return next((node_id for node_id in self.ring if node_id >= key), self.ring[0])
+
+    def loop_back(self, key: int) -> int:
+        return self.nodes[3].find_successor(key, coalesce=False)
+
+
+class ServedLoopbackNetwork(LoopbackNetwork):
+    # the looped lookup arrives through the sync server's FindSuccessor handler
+    def loop_back(self, key: int) -> int:
+        res = ChordServer(self.nodes[3]).FindSuccessor(chord_pb2.FindSuccessorRequest(key=str(key)), None)
+        return int(res.successor_id)
+
 
 class TestNodeNetwork(unittest.TestCase):
     def setUp(self):
@@ -83,6 +201,171 @@ class TestNodeNetwork(unittest.TestCase):
 
         self.assertEqual(self.nodes[7].find_successor(9), 12)
 
+    def test_large_identifier_space(self):
+        m = 160
+        network = MockNetwork()
+        node_ids = sorted(hash_key(f"chord-{ordinal}", m) for ordinal in range(8))
+        nodes = {node_id: Node(node_id, m, network, iterative_lookup=True) for node_id in node_ids}
+        for node in nodes.values():
+            network.register_node(node)
+
+        nodes[node_ids[0]].join(None)
+        for node_id in node_ids[1:]:
+            nodes[node_id].join(node_ids[0])
+        for _ in range(4):
+            for node in nodes.values():
+                node.stabilize()
+            for node in nodes.values():
+                node.fix_fingers()
+
+        self.assertTrue(all(0 <= node_id < 2 ** m for node_id in node_ids))
+        self.assertEqual(nodes[node_ids[3]].start(159), (node_ids[3] + 2 ** 159) % 2 ** m)
+        for ordinal in range(20):
+            key_id = hash_key(f"key-{ordinal}", m)
+            owner = next((node_id for node_id in node_ids if node_id >= key_id), node_ids[0])
+            self.assertEqual(nodes[node_ids[ordinal % 8]].find_successor(key_id), owner)
+
+        self.assertTrue(nodes[node_ids[1]].put(b"user:42", "alice"))
+        self.assertEqual(nodes[node_ids[5]].get("user:42"), "alice")
+        self.assertFalse(nodes[node_ids[2]].put("user:42", "bob"))
+
+    def test_find_successor_iterative(self):
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        for node in self.nodes.values():
+            node.iterative_lookup = True
+
+        self.assertEqual(self.nodes[7].find_successor(9), 12)
+        self.assertEqual(self.nodes[21].find_successor(1), 3)
+        self.assertEqual(self.nodes[30].find_successor(30), 30)
+        self.assertEqual(self.nodes[12].find_successor(22), 27)
+
+    def test_iterative_lookup_gives_up_after_hop_budget(self):
+        network = LoopingNetwork()
+        node = Node(3, self.m, network, iterative_lookup=True, metrics=MetricsRegistry())
+        network.register_node(node)
+        node.routing = RoutingState(7, 30, [7], [7, 7, 7, 12, 21])
+
+        self.assertIsNone(node.find_successor(25))
+        self.assertEqual(node.lookup_hops.count, 1)
+        self.assertFalse(node.create_info(25, 'abc'))
+        self.assertIsNone(node.get_information(25))
+        self.assertEqual(node.information, {})
+
+    def test_recursive_lookup_looping_back_is_not_coalesced(self):
+        for network in (LoopbackNetwork([3, 7, 12, 21, 30]), ServedLoopbackNetwork([3, 7, 12, 21, 30])):
+            with self.subTest(network=type(network).__name__):
+                node = Node(3, self.m, network, coalesce_timeout=2.0, metrics=MetricsRegistry())
+                network.register_node(node)
+                node.routing = RoutingState(7, 30, [7], [7, 7, 7, 12, 21])
+
+                started = time.monotonic()
+                self.assertEqual(node.find_successor(25), 30)
+                self.assertLess(time.monotonic() - started, 1.0)
+                self.assertEqual(node.inflight.timeouts, 0)
+                network.server.shutdown()
+
+    def test_proximity_routing(self):
+        self.nodes[3].join(None)
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(3)
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+        for node in self.nodes.values():
+            node.iterative_lookup = True
+        self.network.latencies = {3: 1.0, 7: 1.0, 8: 1.0, 12: 1.0, 21: 20.0, 27: 1.0, 30: 1.0}
+
+        def lookups():
+            self.network.elapsed = 0.0
+            owners = [self.nodes[node_id].find_successor(key) for node_id in self.nodes for key in range(0, 32, 3)]
+            return owners, self.network.elapsed
+
+        owners, elapsed = lookups()
+        for node in self.nodes.values():
+            node.proximity_routing = True
+        proximity_owners, proximity_elapsed = lookups()
+
+        self.assertEqual(proximity_owners, owners)
+        self.assertLess(proximity_elapsed, elapsed)
+
+    def test_recursive_proximity_routing(self):
+        self.nodes[3].join(None)
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(3)
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+        self.network.latencies = {3: 1.0, 7: 1.0, 8: 1.0, 12: 1.0, 21: 20.0, 27: 1.0, 30: 1.0}
+
+        forwarded = []
+        find_successor = self.network.find_successor
+
+        def record(target_id: int, key: int) -> int:
+            forwarded.append((target_id, key))
+            return find_successor(target_id, key)
+
+        self.network.find_successor = record
+
+        self.assertEqual(self.nodes[3].find_successor(0), 3)
+        self.assertIn((21, 0), forwarded)
+        forwarded.clear()
+        for node in self.nodes.values():
+            node.proximity_routing = True
+        self.assertEqual(self.nodes[3].find_successor(0), 3)
+        # the slow finger 21 is skipped for 12, which is at most twice as far from the key
+        self.assertIn((12, 0), forwarded)
+        self.assertNotIn((21, 0), forwarded)
+
+    def test_find_next_hop(self):
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.assertEqual(self.nodes[8].find_next_hop(10), (12, True))
+        self.assertEqual(self.nodes[3].find_next_hop(25), (21, False))
+
+    def test_fix_fingers_reuses_lookups(self):
+        self.nodes[3].join(None)
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(3)
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        starts = []
+        lookup = self.nodes[3].lookup_finger
+        self.nodes[3].lookup_finger = lambda start: starts.append(start) or lookup(start)
+        self.nodes[3].finger_table = [7] * self.m
+        self.nodes[3].fix_fingers()
+
+        self.assertEqual(self.nodes[3].finger_table, [7, 7, 7, 12, 21])
+        self.assertEqual(sorted(starts), [4, 11, 19])
+
     def test_find_predecessor(self):
         bootstrap_id = 3
         self.nodes[3].join(None)
@@ -178,6 +461,215 @@ class TestNodeNetwork(unittest.TestCase):
         self.nodes[21].remove_info(15)
         self.assertEqual(self.nodes[21].node_has_info(15), None)
 
+    def test_batched_info(self):
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(11):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.assertEqual(self.nodes[21].group_keys_by_owner([9, 10, 11, 13, 31, 1]),
+                         {3: [1, 31], 12: [9, 10, 11], 21: [13]})
+
+        created = self.nodes[21].create_many({9: 'a', 10: 'b', 13: 'c', 31: 'd'})
+        self.assertEqual(created, {9: True, 10: True, 13: True, 31: True})
+        self.assertEqual(self.network.batch_calls, 2)
+        self.assertEqual(self.nodes[12].get_all_node_info(), {9: 'a', 10: 'b'})
+        self.assertEqual(self.nodes[3].node_has_info(31), 'd')
+
+        self.assertEqual(self.nodes[7].create_many({9: 'x', 14: 'y'}), {9: False, 14: True})
+        self.assertEqual(self.nodes[8].get_many([9, 13, 14, 20]), {9: 'a', 13: 'c', 14: 'y', 20: None})
+
+        self.assertEqual(self.nodes[30].remove_many([9, 13, 15]), {9: True, 13: True, 15: False})
+        self.assertEqual(self.nodes[8].get_many([9, 10, 13]), {9: None, 10: 'b', 13: None})
+
+    def test_lookup_cache(self):
+        self.nodes[3].join(None)
+        for node_id in [12, 21]:
+            self.nodes[node_id].join(3)
+        for _ in range(5):
+            for node_id in [3, 12, 21]:
+                self.nodes[node_id].stabilize()
+                self.nodes[node_id].fix_fingers()
+
+        self.assertTrue(self.nodes[3].create_info(5, 'a'))
+        lookups = self.nodes[3].stats['lookups']
+        self.assertEqual(self.nodes[3].get_information(5), 'a')
+        self.assertEqual(self.nodes[3].get_information(5), 'a')
+        self.assertEqual(self.nodes[3].stats['lookups'], lookups)
+        self.assertEqual(self.nodes[3].stats['cache_hits'], 2)
+
+        self.nodes[8].join(3)
+        self.assertIsNone(self.nodes[3].lookup_cache.get(5))
+        self.nodes[3].stabilize()
+        self.assertEqual(self.nodes[3].get_information(5), 'a')
+
+    def test_successor_list(self):
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(11):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.assertEqual(self.nodes[3].successor_list, [7, 8, 12])
+        self.assertEqual(self.nodes[27].successor_list, [30, 3, 7])
+
+    def test_successor_failover(self):
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(11):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.network.dead.update({7, 8})
+        self.nodes[3].handle_dead_node(7)
+        self.assertEqual(self.nodes[3].successor, 8)
+        self.nodes[3].handle_dead_node(8)
+        self.assertEqual(self.nodes[3].successor, 12)
+
+        self.nodes[12].handle_dead_node(8)
+
+        self.nodes[3].stabilize()
+        self.assertEqual(self.nodes[3].successor_list, [12, 21, 27])
+
+    def test_replication(self):
+        for node in self.nodes.values():
+            node.replication_factor = 2
+            node.write_quorum = 2
+
+        bootstrap_id = 3
+        self.nodes[3].join(None)
+
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(bootstrap_id)
+
+        for _ in range(11):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.nodes[3].create_info(15, 'abc')
+        self.assertEqual(self.nodes[21].node_has_info(15), 'abc')
+        self.assertEqual(self.nodes[27].redundant_information, {15: 'abc'})
+        self.assertEqual(self.nodes[30].redundant_information, {15: 'abc'})
+
+        # the owner dies: reads fall back to the replica and the successor promotes it
+        self.network.dead.add(21)
+        self.assertEqual(self.nodes[8].get_information(15), 'abc')
+        self.assertEqual(self.nodes[27].node_has_info(15), 'abc')
+        self.nodes[12].stabilize()
+        self.assertEqual(self.nodes[27].predecessor, 12)
+        self.assertEqual(self.nodes[27].get_all_node_info(), {15: 'abc'})
+        # 30 already holds the replica; promotion writes locally and does not copy it on to 3
+        self.assertNotIn(15, self.nodes[3].redundant_information)
+
+    def test_dead_predecessor_promotes_only_its_range(self):
+        node = self.nodes[27]
+        node.replication_factor = 2
+        # 12 is missing from the fingers, so the closest preceding finger of 21 is half a ring away
+        node.routing = RoutingState(30, 21, [30, 3], [30, 30, 3, 3, 3])
+        node.redundant_information.update({10: 'a', 15: 'b', 20: 'c'})
+
+        node.handle_dead_node(21)
+        self.assertEqual(node.get_all_node_info(), {})
+        node.notify(12)
+        self.assertEqual(node.get_all_node_info(), {15: 'b', 20: 'c'})
+        self.assertEqual(node.redundant_information, {10: 'a'})
+
+    def test_write_quorum_and_batched_replicas(self):
+        for node in self.nodes.values():
+            node.replication_factor = 2
+            node.write_quorum = 2
+        self.nodes[3].join(None)
+        for node_id in [7, 8, 12, 21, 27, 30]:
+            self.nodes[node_id].join(3)
+        for _ in range(self.m):
+            for node in self.nodes.values():
+                node.stabilize()
+            for node in self.nodes.values():
+                node.fix_fingers()
+
+        self.assertEqual(self.nodes[21].add_many_information({13: 'a', 14: 'b', 16: 'c'}), [13, 14, 16])
+        self.assertEqual(self.network.replica_batches, 2)
+        self.assertEqual(self.nodes[30].redundant_information, {13: 'a', 14: 'b', 16: 'c'})
+
+        self.network.dead.add(30)
+        self.assertFalse(self.nodes[3].create_info(15, 'abc'))
+        self.assertEqual(self.nodes[21].node_has_info(15), 'abc')
+
+    def test_join_pulls_key_range(self):
+        self.nodes[3].join(None)
+        for key in [5, 10, 12, 15, 25]:
+            self.nodes[3].create_info(key, str(key))
+
+        self.nodes[12].join(3)
+
+        self.assertEqual(self.nodes[12].get_all_node_info(), {5: '5', 10: '10', 12: '12'})
+        self.assertEqual(self.nodes[3].get_all_node_info(), {15: '15', 25: '25'})
+        self.assertEqual(list(self.nodes[3].key_index), [15, 25])
+
+    def test_serve_handoff_pushes_in_the_background(self):
+        self.nodes[3].join(None)
+        for key in [5, 10, 12, 15, 25]:
+            self.nodes[3].create_info(key, str(key))
+        self.nodes[3].executor = deferred = DeferredExecutor()
+
+        self.assertTrue(self.nodes[3].serve_handoff(12, 3, 12))
+        self.assertEqual(self.nodes[12].get_all_node_info(), {})
+        deferred.run()
+        self.assertEqual(self.nodes[12].get_all_node_info(), {5: '5', 10: '10', 12: '12'})
+        self.assertEqual(list(self.nodes[3].key_index), [15, 25])
+
+    def test_leave_hands_off_keys_in_chunks(self):
+        self.nodes[3].join(None)
+        self.nodes[12].join(3)
+        for _ in range(3):
+            for node_id in [3, 12]:
+                self.nodes[node_id].stabilize()
+                self.nodes[node_id].fix_fingers()
+
+        for key in [5, 7, 9, 11, 12]:
+            self.nodes[12].create_info(key, str(key))
+        self.nodes[12].transfer_chunk_size = 2
+        self.network.handoff_chunks = 0
+
+        self.nodes[12].leave()
+
+        self.assertEqual(self.network.handoff_chunks, 3)
+        self.assertEqual(self.nodes[3].get_all_node_info(), {5: '5', 7: '7', 9: '9', 11: '11', 12: '12'})
+
+    def test_handoff_resumes_from_cursor(self):
+        self.nodes[3].join(None)
+        for key in [5, 7, 9, 11, 12, 15]:
+            self.nodes[3].create_info(key, str(key))
+        self.nodes[3].transfer_chunk_size = 2
+        self.network.fail_handoff_after = 1
+
+        self.nodes[12].join(3)
+
+        self.assertEqual(self.network.handoff_chunks, 3)
+        self.assertEqual(self.nodes[12].get_all_node_info(), {5: '5', 7: '7', 9: '9', 11: '11', 12: '12'})
+        self.assertEqual(self.nodes[3].get_all_node_info(), {15: '15'})
+
     def test_leaving_node(self):
         bootstrap_id = 3
         self.nodes[3].join(None)
@@ -0,0 +1,73 @@
+import unittest
+from concurrent import futures
+
+import grpc
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from presentation import chord_pb2
+from presentation import chord_pb2_grpc
+from presentation import chord_v2_pb2
+from presentation import chord_v2_pb2_grpc
+from presentation.chord_server import ChordServer
+from presentation.chord_v2_server import ChordV2Server
+from presentation.id_codec import encode_id
+
+
+class TestNodeRouter(unittest.TestCase):
+    def setUp(self):
+        network = NodeNetworkInterface()
+        self.nodes = [Node(node_id, 8, network) for node_id in [10, 90, 170]]
+        for node in self.nodes:
+            node.join(None)
+
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        chord_pb2_grpc.add_ChordServicer_to_server(ChordServer(self.nodes[0], self.nodes[1:]), self.server)
+        chord_v2_pb2_grpc.add_ChordV2Servicer_to_server(ChordV2Server(self.nodes[0], self.nodes[1:]), self.server)
+        port = self.server.add_insecure_port('localhost:0')
+        self.server.start()
+
+        self.channel = grpc.insecure_channel(f'localhost:{port}')
+        self.stub = chord_pb2_grpc.ChordStub(self.channel)
+        self.v2_stub = chord_v2_pb2_grpc.ChordV2Stub(self.channel)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+
+    def test_routes_by_target_id(self):
+        self.stub.AddInformation(chord_pb2.AddInfoRequest(target_id='90', info_key='50', info='a'))
+        self.v2_stub.AddInformation(chord_v2_pb2.AddInfoRequest(target_id=encode_id(170), key=encode_id(120),
+                                                                information=b'b'))
+
+        self.assertEqual(self.nodes[1].get_all_node_info(), {50: 'a'})
+        self.assertEqual(self.nodes[2].get_all_node_info(), {120: 'b'})
+        self.assertEqual(self.nodes[0].get_all_node_info(), {})
+
+        res = self.stub.FindPredecessor(chord_pb2.FindPredecessorRequest(target_id='170'))
+        self.assertEqual(res.predecessor_id, '170')
+
+        res = self.stub.GetAllNodeInfo(chord_pb2.GetAllInfoRequest(target_id='90'))
+        self.assertEqual([(line.info_key, line.info_val) for line in res.info_line], [('50', 'a')])
+
+    def test_empty_target_falls_back_to_primary(self):
+        self.stub.AddInformation(chord_pb2.AddInfoRequest(info_key='5', info='x'))
+        self.stub.SetPredecessor(chord_pb2.SetPredecessorRequest(new_predecessor_id='3'))
+
+        self.assertEqual(self.nodes[0].get_all_node_info(), {5: 'x'})
+        self.assertEqual(self.nodes[0].predecessor, 3)
+
+    def test_unknown_target_is_not_found(self):
+        for target_id in ('None', '42'):
+            with self.assertRaises(grpc.RpcError) as raised:
+                self.stub.SetPredecessor(chord_pb2.SetPredecessorRequest(target_id=target_id, new_predecessor_id='3'))
+            self.assertEqual(raised.exception.code(), grpc.StatusCode.NOT_FOUND)
+        with self.assertRaises(grpc.RpcError) as raised:
+            self.v2_stub.Notify(chord_v2_pb2.NotifyRequest(target_id=encode_id(42), sender_id=encode_id(3)))
+        self.assertEqual(raised.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+        self.assertEqual([node.predecessor for node in self.nodes], [10, 90, 170])
+
+
+if __name__ == "__main__":
+    unittest.main()
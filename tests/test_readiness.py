@@ -0,0 +1,65 @@
+import unittest
+import urllib.error
+import urllib.request
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from business.readiness import JOINED, SERVING, STARTING, SYNCED, Readiness
+from presentation.http_endpoint import HttpEndpoint
+from simulation import RingSimulator
+
+
+class TestReadiness(unittest.TestCase):
+    def test_stages(self):
+        readiness = Readiness()
+        self.assertEqual(readiness.status(), STARTING)
+        readiness.advance(JOINED)
+        readiness.advance(SERVING)
+        self.assertEqual(readiness.status(), JOINED)
+        self.assertFalse(readiness.ready)
+
+        readiness.advance(SYNCED)
+        self.assertTrue(readiness.ready)
+        readiness.drain()
+        self.assertFalse(readiness.ready)
+        self.assertEqual(readiness.status(), 'draining')
+
+    def test_probe(self):
+        readiness = Readiness()
+        endpoint = HttpEndpoint(0, host='localhost')
+        endpoint.route('/ready', lambda: (200 if readiness.ready else 503, 'text/plain', readiness.status()))
+        endpoint.start()
+        url = f'http://localhost:{endpoint.port}/ready'
+        try:
+            with self.assertRaises(urllib.error.HTTPError) as raised:
+                urllib.request.urlopen(url, timeout=2)
+            self.assertEqual(raised.exception.code, 503)
+
+            readiness.advance(SYNCED)
+            with urllib.request.urlopen(url, timeout=2) as response:
+                self.assertEqual(response.read(), b'synced')
+        finally:
+            endpoint.stop()
+
+
+class TestStagedJoin(unittest.TestCase):
+    def test_join_ring_leaves_keys_to_pull(self):
+        simulator = RingSimulator(size=8, m=8, seed=3)
+        simulator.build()
+        simulator.run_puts(50)
+
+        node_id = next(i for i in range(256) if i not in simulator.fabric.nodes)
+        node: Node = simulator.create_node(node_id)
+        self.assertFalse(Node(1, 8, NodeNetworkInterface()).join_ring(None))
+        self.assertTrue(node.join_ring(simulator.members[0]))
+        self.assertEqual(node.successor, simulator.owner((node_id + 1) % 256))
+        self.assertEqual(node.information, {})
+
+        node.pull_keys()
+        owned = {key for key in simulator.keys if node.in_range(key, node.predecessor, node_id)}
+        self.assertTrue(owned)
+        self.assertTrue(owned <= set(node.information))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import threading
+import unittest
+from concurrent import futures
+
+from business.node import Node
+from business.node_network_interface import NodeNetworkInterface
+from business.routing_state import RoutingState
+
+
+class TestRoutingState(unittest.TestCase):
+    def test_snapshots_are_immutable(self):
+        state = RoutingState(3, 1, [3, 5], [3, 3, 5])
+        with self.assertRaises(AttributeError):
+            state.successor = 4
+
+        updated = state.with_finger(2, 7).replace(successor=4)
+        self.assertEqual((state.successor, state.finger_table), (3, (3, 3, 5)))
+        self.assertEqual((updated.successor, updated.predecessor, updated.finger_table), (4, 1, (3, 3, 7)))
+
+    def test_node_fields_read_the_current_snapshot(self):
+        node = Node(0, 3, NodeNetworkInterface())
+        snapshot = node.routing
+        node.successor_list = [1, 2]
+        node.finger_table = [1, 2, 4]
+        node.handle_dead_node(2)
+
+        self.assertEqual(snapshot.successor_list, ())
+        self.assertEqual(node.successor_list, [1])
+        self.assertEqual(node.finger_table, [1, None, 4])
+        node.finger_table.append(5)
+        self.assertEqual(node.finger_table, [1, None, 4])
+
+
+class TestConcurrentNode(unittest.TestCase):
+    def setUp(self):
+        self.node = Node(0, 8, NodeNetworkInterface())
+        self.node.join(None)
+
+    def tearDown(self):
+        self.node.executor.shutdown()
+
+    def test_readers_see_whole_tables(self):
+        stop = threading.Event()
+        torn = []
+
+        def writer():
+            # flips every finger between two complete tables
+            while not stop.is_set():
+                for owner in (64, 128):
+                    self.node.finger_table = [owner] * 8
+
+        def reader():
+            for _ in range(5000):
+                fingers = set(self.node.routing.finger_table)
+                if len(fingers) != 1 and fingers != {0}:
+                    torn.append(fingers)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        with futures.ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: reader(), range(4)))
+        stop.set()
+        thread.join()
+        self.assertEqual(torn, [])
+
+    def test_concurrent_creates_of_one_key(self):
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            created = list(pool.map(lambda i: self.node.add_many_information({42: f'value-{i}'}), range(64)))
+
+        self.assertEqual(sum(len(keys) for keys in created), 1)
+        self.assertEqual(list(self.node.key_index), [42])
+
+    def test_lookup_counters_are_not_lost(self):
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(self.node.find_successor, range(2000)))
+        self.assertEqual(self.node.get_stats()['lookups'], 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
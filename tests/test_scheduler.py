@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+from business.scheduler import AdaptiveScheduler
+
+
+class TestAdaptiveScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AdaptiveScheduler()
+        self.changes = []
+        self.scheduler.add('stabilize', lambda: self.changes.pop(0) if self.changes else False, 1, 8)
+        self.task = self.scheduler.tasks['stabilize']
+
+    def run_once(self):
+        self.task.next_run = 0
+        self.scheduler.run_pending()
+
+    def test_backs_off_while_nothing_changes(self):
+        intervals = []
+        for _ in range(5):
+            self.run_once()
+            intervals.append(self.task.interval)
+
+        self.assertEqual(intervals, [2, 4, 8, 8, 8])
+        self.assertEqual(self.scheduler.timings()['stabilize']['runs'], 5)
+
+    def test_change_and_churn_reset_interval(self):
+        for _ in range(3):
+            self.run_once()
+        self.changes.append(True)
+        self.run_once()
+        self.assertEqual(self.task.interval, 1)
+
+        self.run_once()
+        self.run_once()
+        self.scheduler.signal_churn()
+        self.assertEqual(self.task.interval, 1)
+        self.assertEqual(self.scheduler.delay(self.task.next_run), 0)
+
+    def test_errors_count_as_churn(self):
+        self.scheduler.add('check_predecessor', lambda: 1 / 0, 1, 8)
+        self.scheduler.run_pending()
+
+        timings = self.scheduler.timings()['check_predecessor']
+        self.assertEqual(timings['errors'], 1)
+        self.assertEqual(timings['interval'], 1)
+
+    def test_async_runner_accepts_plain_functions(self):
+        async def fix_fingers():
+            return True
+
+        self.scheduler.add('fix_fingers', fix_fingers, 1, 8)
+        asyncio.run(self.scheduler.run_pending_async())
+
+        timings = self.scheduler.timings()
+        self.assertEqual((timings['stabilize']['runs'], timings['stabilize']['errors']), (1, 0))
+        self.assertEqual(timings['fix_fingers']['changes'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
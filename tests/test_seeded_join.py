@@ -0,0 +1,120 @@
+import bisect
+import logging
+import unittest
+from collections import Counter
+
+from business.node_network_interface import UNSUPPORTED
+from simulation import RingSimulator
+from simulation.network import DeferredExecutor
+
+
+class TestSeededJoin(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.simulator = RingSimulator(64, 12, seed=5, iterative_lookup=True)
+        self.simulator.build()
+        self.node_id = next(i for i in range(7, 1 << 12, 61) if i not in self.simulator.fabric.nodes)
+        self.node = self.simulator.create_node(self.node_id)
+        self.node.executor = self.deferred = DeferredExecutor()
+
+    def test_join_is_one_bulk_fetch(self):
+        rpcs = Counter(self.simulator.fabric.rpcs)
+        self.assertTrue(self.node.join_ring(self.simulator.members[0]))
+        rpcs = self.simulator.fabric.rpcs - rpcs
+
+        self.assertEqual(rpcs['get_routing_state'], 1)
+        self.assertNotIn('get_predecessor', rpcs)
+        self.assertLess(sum(rpcs.values()), self.simulator.m)
+
+        bisect.insort(self.simulator.members, self.node_id)
+        index = self.simulator.members.index(self.node_id)
+        self.assertEqual(self.node.successor, self.simulator.members[index + 1])
+        self.assertEqual(self.node.predecessor, self.simulator.members[index - 1])
+        self.assertEqual(self.simulator.fabric.nodes[self.node.predecessor].successor, self.node_id)
+        for key in range(0, 1 << 12, 37):
+            self.assertEqual(self.node.find_successor(key), self.simulator.owner(key))
+
+    def test_background_refinement_makes_fingers_exact(self):
+        self.node.join_ring(self.simulator.members[0])
+        self.assertEqual(len(self.deferred.pending), 1)
+        self.deferred.run()
+
+        bisect.insort(self.simulator.members, self.node_id)
+        self.assertEqual(self.node.finger_table, [self.simulator.owner(start) for start in self.node.finger_starts])
+        self.simulator.maintain(1)
+        for node_id in self.simulator.members:
+            node = self.simulator.fabric.nodes[node_id]
+            self.assertEqual(node.finger_table, [self.simulator.owner(start) for start in node.finger_starts])
+
+    def test_unsupported_routing_state_falls_back_to_lookups(self):
+        self.node.network.get_routing_state = lambda target_id: UNSUPPORTED
+        rpcs = Counter(self.simulator.fabric.rpcs)
+        self.assertTrue(self.node.join_ring(self.simulator.members[0]))
+        rpcs = self.simulator.fabric.rpcs - rpcs
+
+        self.assertEqual(rpcs['get_predecessor'], 1)
+        self.assertEqual(self.node.finger_table, [self.simulator.owner(start) for start in self.node.finger_starts])
+
+    def test_dead_successor_is_skipped(self):
+        successor = self.simulator.owner(self.node_id)
+        self.simulator.remove(successor)
+        self.assertTrue(self.node.join_ring(self.simulator.members[0]))
+        self.assertEqual(self.node.successor, self.simulator.owner(self.node_id))
+
+    def test_failed_join_does_not_self_loop(self):
+        bootstrap = self.simulator.members[0]
+        self.simulator.fabric.kill(bootstrap)
+        self.assertFalse(self.node.join_ring(bootstrap))
+        self.assertIsNone(self.node.successor)
+        self.assertIsNone(self.node.predecessor)
+
+
+class TestLazyJoin(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.simulator = RingSimulator(64, 12, seed=5, iterative_lookup=True, lazy_join=True, finger_hint_hops=3)
+        self.simulator.build()
+        self.node_id = next(i for i in range(7, 1 << 12, 61) if i not in self.simulator.fabric.nodes)
+        self.node = self.simulator.create_node(self.node_id)
+
+    def test_join_cost_is_capped(self):
+        rpcs = Counter(self.simulator.fabric.rpcs)
+        self.assertTrue(self.node.join_ring(self.simulator.members[0]))
+        rpcs = self.simulator.fabric.rpcs - rpcs
+        self.assertEqual(rpcs['update_finger_table'], 1)
+        self.assertEqual(rpcs['finger_hint'], 3)
+
+        bisect.insort(self.simulator.members, self.node_id)
+        index = self.simulator.members.index(self.node_id)
+        for node_id in self.simulator.members[index - 3:index]:
+            node = self.simulator.fabric.nodes[node_id]
+            for start, finger in zip(node.finger_starts, node.finger_table):
+                if self.simulator.owner(start) == self.node_id:
+                    self.assertEqual(finger, self.node_id)
+
+        rpcs = Counter(self.simulator.fabric.rpcs)
+        self.simulator.fabric.nodes[self.node.predecessor].finger_hint(self.node_id, 3)
+        self.assertEqual(self.simulator.fabric.rpcs - rpcs, Counter())
+
+        self.simulator.maintain(1)
+        for node_id in self.simulator.members:
+            node = self.simulator.fabric.nodes[node_id]
+            self.assertEqual(node.finger_table, [self.simulator.owner(start) for start in node.finger_starts])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import logging
+import math
+import unittest
+
+from simulation import ConstantLatency, FailureModel, RingSimulator
+
+
+class TestRingSimulator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_static_ring_lookups(self):
+        simulator = RingSimulator(256, 16, seed=1, iterative_lookup=True)
+        simulator.build()
+        self.assertTrue(simulator.converged())
+
+        report = simulator.run_lookups(300)
+        summary = report.summary()
+        self.assertEqual(summary['errors'], 0)
+        self.assertLessEqual(summary['mean_hops'], math.log2(256))
+        self.assertEqual(sum(report.hops.values()), 300)
+        self.assertEqual(set(report.rpcs), {'find_next_hop'})
+
+    def test_same_seed_same_run(self):
+        def run():
+            simulator = RingSimulator(64, 12, seed=7, latency=ConstantLatency(0.01), iterative_lookup=True)
+            simulator.build()
+            report = simulator.run_lookups(100)
+            return report.hops, report.rpcs, round(report.simulated_seconds, 9)
+
+        self.assertEqual(run(), run())
+
+    def test_recovers_from_crashes(self):
+        simulator = RingSimulator(128, 16, seed=3, iterative_lookup=True)
+        simulator.build()
+        simulator.run_puts(50)
+        simulator.fail(8)
+        simulator.maintain(6)
+
+        self.assertTrue(simulator.converged())
+        self.assertEqual(simulator.run_lookups(200).errors, 0)
+
+    def test_converges_under_churn(self):
+        for iterative_lookup in (True, False):
+            with self.subTest(iterative_lookup=iterative_lookup):
+                simulator = RingSimulator(128, 32, seed=1, iterative_lookup=iterative_lookup)
+                simulator.build()
+                simulator.run_puts(50)
+                simulator.fail(8)
+                self.assertEqual(simulator.join(8).errors, 0)
+                simulator.maintain(4)
+
+                self.assertEqual(len(simulator.members), 128)
+                self.assertTrue(simulator.converged())
+                self.assertEqual(simulator.run_lookups(200).errors, 0)
+
+    def test_dropped_rpcs_are_reported_as_dead_peers(self):
+        simulator = RingSimulator(32, 8, seed=5, failures=FailureModel(drop_rate=1.0), iterative_lookup=True)
+        simulator.build()
+        node = simulator.fabric.nodes[simulator.members[0]]
+        successor = node.successor
+
+        self.assertIsNone(node.network.get_neighbors(successor))
+        self.assertNotIn(successor, node.finger_table)
+        self.assertEqual(simulator.fabric.rpcs['get_neighbors'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
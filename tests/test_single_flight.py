@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent import futures
+
+from business.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight(timeout=5.0)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def slow_lookup(self):
+        self.calls += 1
+        self.release.wait(5)
+        return 42
+
+    def test_concurrent_callers_share_one_call(self):
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = [executor.submit(self.flight.do, 'key', self.slow_lookup) for _ in range(8)]
+            while self.flight.coalesced < 7:
+                time.sleep(0.01)
+            self.release.set()
+
+        self.assertEqual([result.result() for result in results], [42] * 8)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.flight.counters()['coalescing_rate'], 7 / 8)
+        self.assertEqual(self.flight.flights, {})
+
+    def test_reentrant_call_does_not_wait_on_itself(self):
+        def lookup():
+            self.calls += 1
+            return 1 if self.calls > 1 else self.flight.do('key', lookup) + 1
+
+        self.assertEqual(self.flight.do('key', lookup), 2)
+        self.assertEqual(self.flight.coalesced, 0)
+
+    def test_follower_gives_up_after_timeout(self):
+        self.flight.timeout = 0.05
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(self.flight.do, 'key', self.slow_lookup)
+            while not self.flight.flights:
+                time.sleep(0.01)
+            self.assertEqual(self.flight.do('key', lambda: 7), 7)
+            self.release.set()
+            self.assertEqual(leader.result(), 42)
+        self.assertEqual(self.flight.timeouts, 1)
+
+    def test_errors_are_not_cached(self):
+        def failing():
+            raise ConnectionError('down')
+
+        with self.assertRaises(ConnectionError):
+            self.flight.do('key', failing)
+        self.assertEqual(self.flight.do('key', lambda: 3), 3)
+
+    def test_async_callers_share_one_call(self):
+        flight = AsyncSingleFlight()
+
+        async def lookup():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def run():
+            return await asyncio.gather(*[flight.do('key', lookup) for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), [42] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(flight.coalesced, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()